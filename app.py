@@ -1,5 +1,6 @@
 from flask import Flask, request, render_template, redirect, url_for, flash, jsonify, session
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from bank_analysis.domain.value_objects import BreakdownKind
 from bank_analysis.usecases.compute_enhanced_category_breakdown import \
@@ -7,6 +8,9 @@ from bank_analysis.usecases.compute_enhanced_category_breakdown import \
 from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
 from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
 from bank_analysis.domain import period_splicer
+from bank_analysis.domain.transaction_index import TransactionIndex
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.reporting.enhanced_breakdown import discard_dictionary_flags
 from bank_analysis.adapters.csv_content_loader import CsvContentDataLoader
 from bank_analysis.usecases.compute_category_breakdown import \
   ComputeCategoryBreakdownUseCase
@@ -14,13 +18,35 @@ from bank_analysis.usecases.compute_monthly_summary import \
   ComputeMonthlySummaryUseCase
 from bank_analysis.usecases.data_loading import DataLoadingUseCase
 from bank_analysis.adapters.result_in_memory_store import InMemoryResultStore
+from bank_analysis.adapters.analysis_cache import ContentAddressedCache, HashingReader
+from bank_analysis.adapters.json_rules_provider import JsonRulesProvider
+from bank_analysis.ports.rules_provider import StaticRulesProvider
 from bank_analysis.usecases.filter_atypical_months import \
   FilterAtypicalMonthsUseCase
 from bank_analysis.usecases.filter_transactions import FilterTransactionsUseCase
+from bank_analysis.usecases.compute_rolling_stats import ComputeRollingStatsUseCase
+from bank_analysis.usecases.precompute_period_breakdowns import \
+  PrecomputePeriodBreakdownsUseCase
 
 app = Flask(__name__)
 app.secret_key = "change-me-in-production-hoho"
-result_store = InMemoryResultStore()
+result_store = InMemoryResultStore(
+    max_sessions=int(os.environ.get("RESULT_STORE_MAX_SESSIONS", 200)),
+    max_bytes=int(os.environ.get("RESULT_STORE_MAX_BYTES", 512 * 1024 * 1024)),
+    ttl_seconds=float(os.environ.get("RESULT_STORE_TTL_SECONDS", 2 * 3600)),
+)
+# Parsed uploads keyed by content digest (shared by all sessions)
+analysis_cache = ContentAddressedCache(InMemoryResultStore(
+    max_sessions=int(os.environ.get("ANALYSIS_CACHE_MAX_ENTRIES", 32)),
+    max_bytes=int(os.environ.get("ANALYSIS_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+))
+# Large pasted CSV texts are parsed in chunks by this many processes (1 = in-process);
+# uploads are decoded incrementally from their stream
+UPLOAD_PARSE_WORKERS = int(os.environ.get("UPLOAD_PARSE_WORKERS", 1))
+# Budget policy and classification rules: a JSON config, reloaded when the file
+# changes, or the built-in defaults. Derived results are keyed by rules version.
+RULES_CONFIG = os.environ.get("BANK_ANALYSIS_RULES")
+rules_provider = JsonRulesProvider(RULES_CONFIG) if RULES_CONFIG else StaticRulesProvider()
 
 
 ALLOWED_EXTENSIONS = {"csv", "txt"}
@@ -35,51 +61,144 @@ def index():
 @app.route("/analyze", methods=["POST"])
 def analyze():
     # Accept file upload OR pasted CSV text
+    upload = request.files.get("file")
     csv_text = None
-    if "file" in request.files and request.files["file"].filename != "":
-        f = request.files["file"]
-        if not allowed_file(f.filename):
+    if upload is not None and upload.filename != "":
+        if not allowed_file(upload.filename):
             flash("Only CSV or TXT files are allowed.")
             return redirect(url_for("index"))
-        csv_text = f.read().decode("utf-8")
     else:
+        upload = None
         csv_text = request.form.get("csv_text", "").strip()
+        if not csv_text:
+            flash("Please upload a CSV file or paste CSV data.")
+            return redirect(url_for("index"))
 
-    if not csv_text:
-        flash("Please upload a CSV file or paste CSV data.")
+    try:
+        rolling_window = int(request.form.get("rolling_window", 3))
+        if rolling_window < 1:
+            raise ValueError
+    except ValueError:
+        flash("The rolling window must be a whole number of periods, at least 1.")
         return redirect(url_for("index"))
 
     try:
         cycle = request.form.get("cycle", "calendar")
-        cycle_grouper = None
+        rule_set = rules_provider.current()
 
-        loader = CsvContentDataLoader(base_path=".")
+        loader = CsvContentDataLoader(base_path=".", workers=UPLOAD_PARSE_WORKERS)
         data_loader_uc = DataLoadingUseCase(loader)
 
-        transactions = data_loader_uc.execute(csv_text)
+        # Re-uploads of the same export reuse the first parse and its derived results
+        if upload is not None:
+            analysis = load_upload(upload.stream, loader)
+            if analysis is None:
+                flash("Please upload a CSV file or paste CSV data.")
+                return redirect(url_for("index"))
+        else:
+            digest = ContentAddressedCache.digest(csv_text, loader=type(loader).__name__)
+            analysis = analysis_cache.get_or_load(digest, lambda: data_loader_uc.execute(csv_text))
 
-        if cycle == "calendar": cycle_grouper = CalendarCycleGrouper()
-        elif cycle == "salary": cycle_grouper = SalaryCycleGrouper(transactions)
-
-        monthly_summary_uc = ComputeMonthlySummaryUseCase(cycle_grouper)
         filtering_outliers_uc = FilterAtypicalMonthsUseCase()
-
-        custom_analysis = monthly_summary_uc.execute(transactions)
+        custom_analysis = analysis_summary(analysis, cycle, rule_set)
         filtering_outlier = request.form.get("filtering_outlier", "yes")
         if filtering_outlier == "yes":
             custom_analysis = filtering_outliers_uc.execute(custom_analysis).filtered
+
+        rolling_stats = ComputeRollingStatsUseCase(rolling_window).execute(custom_analysis)
     except Exception as e:
         flash(f"Could not parse CSV: {e}")
         return redirect(url_for("index"))
 
-    transactions = loader.load_and_prepare(csv_text)
+    # Precompute every period's breakdown (both styles) once, so /details is a lookup
+    analysis_details(analysis, cycle, rule_set)
 
-    # Store transactions in session-aware cache
+    # Session keeps the upload; details and index are looked up under the current rules
     session_id = session.get("_id") or os.urandom(16).hex()
     session["_id"] = session_id
-    result_store.put(session_id, transactions)
+    if not result_store.put(session_id, {"analysis": analysis, "cycle": cycle}):
+        flash("This export is too large to keep for this session: period details "
+              "and transaction lists are unavailable.")
+
+    return render_template("results.html", results={}, customAnalysis=custom_analysis,
+                           rollingStats=rolling_stats, rollingWindow=rolling_window)
+
+
+# ----- Results derived from an upload, memoized per (cycle, rules version) -----
+
+def analysis_grouper(analysis, cycle, rule_set):
+    if cycle == "calendar":
+        return CalendarCycleGrouper()
+    if cycle == "salary":
+        return analysis.derived(("grouper", cycle, rule_set.version), lambda: SalaryCycleGrouper(
+            analysis.transactions, salary_category=rule_set.policy.salary_category))
+    raise ValueError(f"Unknown cycle '{cycle}'.")
+
+
+def analysis_summary(analysis, cycle, rule_set):
+    monthly_summary_uc = ComputeMonthlySummaryUseCase(analysis_grouper(analysis, cycle, rule_set),
+                                                      policy=rule_set.policy)
+    return analysis.derived(("summary", cycle, rule_set.version),
+                            lambda: monthly_summary_uc.execute(analysis.transactions))
+
+
+def analysis_details(analysis, cycle, rule_set):
+    """(breakdown style, period) -> /details rows."""
+    precompute_uc = PrecomputePeriodBreakdownsUseCase(analysis_grouper(analysis, cycle, rule_set),
+                                                      rule_set.policy, rule_set.rules)
+    return analysis.derived(("details", cycle, rule_set.version), lambda: {
+        key: details_rows(rows) for key, rows in precompute_uc.execute(analysis.transactions).items()
+    })
 
-    return render_template("results.html", results={}, customAnalysis=custom_analysis)
+
+def analysis_index(analysis, rule_set):
+    """Drill-down index; its maps are only built on the first /transactions request."""
+    return analysis.derived(("index", rule_set.version), lambda: TransactionIndex(
+        analysis.transactions, rule_set.rules.supplier_patterns))
+
+
+def refresh_cached_analyses(old, new):
+    """
+    After a rules change: recompute, for every cached upload, the summaries and
+    details that were derived under the old rules, then drop the old results
+    (including the classification predicates stored on the parsed table).
+    """
+    # A later change may already be in force: compute for it, not for 'new'
+    target = rules_provider.current()
+    for analysis in analysis_cache.entries():
+        old_keys = [k for k in analysis.derived_keys() if k[-1] == old.version]
+        for cycle in {k[1] for k in old_keys if k[0] in ("summary", "details")}:
+            analysis_summary(analysis, cycle, target)
+            analysis_details(analysis, cycle, target)
+        analysis.discard_derived(lambda k: k[-1] == old.version)
+        if isinstance(analysis.transactions, TransactionTable):
+            discard_dictionary_flags(analysis.transactions, old.policy, old.rules)
+
+
+# Recompute in the background, one change at a time and in order, so requests are
+# not held up by a rules change; the file is watched so reloads happen off-request.
+rules_refresh = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rules-refresh")
+rules_provider.on_change(lambda old, new: rules_refresh.submit(refresh_cached_analyses, old, new))
+if isinstance(rules_provider, JsonRulesProvider):
+    rules_provider.watch()
+
+
+def load_upload(stream, loader):
+    """
+    Parse an uploaded file straight from its stream: the loader decodes it chunk by
+    chunk through the incremental decoder, and every chunk read is hashed on the
+    way, so the body is read once and never held as one bytes object plus one str.
+    The digest is only known once parsing is done: a re-upload is parsed again but
+    reuses the cached entry and its derived results. Returns None for an empty upload.
+    """
+    reader = HashingReader(stream, ContentAddressedCache.hasher(loader=type(loader).__name__))
+    try:
+        table = DataLoadingUseCase(loader).execute_table(reader)
+    except ValueError:
+        if reader.size == 0:
+            return None
+        raise
+    return analysis_cache.add(reader.hexdigest(), table)
 
 
 KIND_ORDER = {
@@ -102,6 +221,13 @@ def breakdown_sort_key(row):
     return (kind_rank, row.label.lower(), -row.total)
 
 
+def details_rows(breakdown):
+    """JSON-ready /details rows, in display order."""
+    return [{"category_parent": row.label, "total": row.total,
+             "nb_operations": row.nb_operations, "kind": row.kind.value}
+            for row in sorted(breakdown, key=breakdown_sort_key)]
+
+
 @app.route("/details")
 def details():
     period = request.args.get("period")
@@ -109,26 +235,31 @@ def details():
     if not period or not session_id:
         return jsonify([])
 
-    transactions = result_store.get(session_id)
-    if transactions is None:
+    payload = result_store.get(session_id)
+    if payload is None:
         return jsonify([])
 
-    spliced_transactions = period_splicer.filter_transactions_by_period(transactions, period)
-
     breakdown_style = request.args.get("breakdown_style", "default")
-    if breakdown_style == "enhanced":
-      breakdown_uc = ComputeEnhancedCategoryBreakdownUseCase()
+    style = "enhanced" if breakdown_style == "enhanced" else "standard"
+    rule_set = rules_provider.current()
+    analysis = payload["analysis"]
+    precomputed = analysis_details(analysis, payload["cycle"], rule_set).get((style, period))
+    # Details may just have been derived for new rules: re-account the session
+    result_store.resize(session_id)
+    if precomputed is not None:
+        return jsonify(precomputed)
+
+    # Period not precomputed (e.g. a hand-written label): compute it on the fly
+    spliced_transactions = period_splicer.filter_transactions_by_period(analysis.transactions, period)
+
+    if style == "enhanced":
+      breakdown_uc = ComputeEnhancedCategoryBreakdownUseCase(rule_set.policy, rule_set.rules)
     else:
-      breakdown_uc = ComputeCategoryBreakdownUseCase()
+      breakdown_uc = ComputeCategoryBreakdownUseCase(rule_set.policy)
 
     breakdown = breakdown_uc.execute(spliced_transactions)
 
-    ordered = sorted(breakdown, key=breakdown_sort_key)
-
-    data = jsonify([{"category_parent": row.label, "total": row.total,
-                  "nb_operations": row.nb_operations, "kind": row.kind.value}
-                 for row in ordered])
-    return data
+    return jsonify(details_rows(breakdown))
 
 
 @app.route("/transactions")
@@ -138,14 +269,18 @@ def transactions_list():
     kind = request.args.get("kind", "standard")
 
     session_id = session.get("_id")
-    transactions = result_store.get(session_id)
-    if transactions is None:
+    payload = result_store.get(session_id)
+    if payload is None:
       return jsonify([])
 
 
-    # Filter transactions based on period, label, kind
+    # Filter transactions based on period, label, kind (index lookups)
     filter_transactions_uc = FilterTransactionsUseCase()
-    transactions = filter_transactions_uc.execute(transactions, period, label, BreakdownKind(kind))
+    drilldown_index = analysis_index(payload["analysis"], rules_provider.current())
+    transactions = filter_transactions_uc.execute_indexed(drilldown_index, period, label, BreakdownKind(kind))
+    # The index builds its lookup maps on first use: re-account what they take
+    payload["analysis"].resized()
+    result_store.resize(session_id)
 
 
     return jsonify([{
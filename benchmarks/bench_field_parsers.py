@@ -0,0 +1,68 @@
+"""
+Microbenchmark: reference cell parsers vs the fast paths in field_parsers.
+
+Rows are demo.csv's data lines repeated (plus a few NBSP-formatted amounts), parsed
+the historical way (csv.DictReader, per-row header normalization, NFKC on every
+cell) and through RowParser.
+
+    python benchmarks/bench_field_parsers.py [n_rows]
+"""
+import csv
+import io
+import os
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from bank_analysis.adapters.field_parsers import (  # noqa: E402
+    RowParser, _normalize_header, _strip_nbsp, parse_amount, parse_date,
+)
+
+
+def reference_rows(text: str):
+    f = io.StringIO(text)
+    headers = [_normalize_header(h) for h in next(csv.reader([f.readline()], delimiter=";"))]
+    out = []
+    for row in csv.DictReader(f, fieldnames=headers, delimiter=";"):
+        row = {_normalize_header(k): v for k, v in row.items()}
+        date_raw = _strip_nbsp(row.get("dateOp"))
+        amount = parse_amount(_strip_nbsp(row.get("amount")))
+        if not date_raw or amount is None:
+            continue
+        d = parse_date(date_raw)
+        if d is None:
+            continue
+        out.append((d, _strip_nbsp(row.get("month")) or f"{d.year:04d}-{d.month:02d}",
+                    _strip_nbsp(row.get("category")), _strip_nbsp(row.get("categoryParent")),
+                    float(amount), _strip_nbsp(row.get("label")), _strip_nbsp(row.get("supplierFound")),
+                    _strip_nbsp(row.get("accountNum")) or ""))
+    return out
+
+
+def fast_rows(text: str):
+    reader = csv.reader(io.StringIO(text), delimiter=";")
+    parse_row = RowParser(next(reader))
+    return [f for f in map(parse_row, reader) if f is not None]
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with open(os.path.join(ROOT, "demo.csv"), encoding="utf-8-sig") as f:
+        header, *lines = f.read().splitlines()
+    lines.append('2024-08-03;2024-08-03;"PRLV EDF";"Energie";"Logement";"edf";-1\xa0234,56;;1;B;0')
+    body = [lines[i % len(lines)] for i in range(n_rows)]
+    text = "\n".join([header] + body) + "\n"
+
+    reference = reference_rows(text)
+    assert len(reference) == n_rows and fast_rows(text) == reference, "fast path diverges from the reference parsers"
+
+    slow = min(timeit.repeat(lambda: reference_rows(text), number=1, repeat=5))
+    fast = min(timeit.repeat(lambda: fast_rows(text), number=1, repeat=5))
+    print(f"{n_rows} rows: reference {slow * 1e3:.1f} ms, fast path {fast * 1e3:.1f} ms "
+          f"({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Microbenchmark: trying each supplier pattern in turn vs the compiled SupplierMatcher.
+
+A rule set of a few hundred word patterns (the real rules have hundreds of
+suppliers) is matched against supplier strings drawn from a smaller set of
+merchants, most of which match no rule, as in bank exports.
+
+    python benchmarks/bench_supplier_matcher.py [n_rows] [n_patterns]
+"""
+import os
+import random
+import re
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from bank_analysis.domain.matcher import SupplierMatcher, _first_match  # noqa: E402
+from bank_analysis.domain.reporting.category_rules import SupplierPattern  # noqa: E402
+
+
+def main() -> None:
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_patterns = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    rng = random.Random(7)
+    names = [f"shop{i:04d}" for i in range(n_patterns)]
+    patterns = tuple(SupplierPattern(n, re.compile(rf"\b{n}\b", re.IGNORECASE)) for n in names)
+    merchants = [f"CB {rng.choice(names).upper()} PARIS" if rng.random() < 0.3 else f"CB MERCHANT {i}"
+                 for i in range(2_000)]
+    suppliers = [rng.choice(merchants) for _ in range(n_rows)]
+
+    def reference():
+        return [_first_match(s.strip().casefold(), patterns) if s else None for s in suppliers]
+
+    def compiled():
+        match = SupplierMatcher(patterns).match
+        return [match(s) for s in suppliers]
+
+    assert compiled() == reference(), "compiled matcher diverges from the per-pattern loop"
+    slow = min(timeit.repeat(reference, number=1, repeat=3))
+    fast = min(timeit.repeat(compiled, number=1, repeat=3))
+    print(f"{n_rows} rows x {n_patterns} patterns: per-pattern {slow * 1e3:.1f} ms, "
+          f"compiled {fast * 1e3:.1f} ms ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import sys
+
 from src.bank_analysis.entrypoints.cli import run
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    sys.exit(run())
\ No newline at end of file
@@ -0,0 +1,160 @@
+import hashlib
+from threading import Lock
+from typing import IO, Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+from bank_analysis.adapters.result_in_memory_store import InMemoryResultStore
+from bank_analysis.domain.entities import Transaction
+
+
+class CachedAnalysis:
+    """
+    One parsed upload: its transactions plus memoized derived results
+    (summaries, precomputed breakdowns, indexes...) keyed by the caller.
+    Concurrent first uses of a key compute it once: the other callers wait for it.
+    on_resize, if set, is called whenever derived results are added or dropped
+    (the owning cache re-accounts the entry's size).
+    """
+
+    def __init__(self, digest: str, transactions: Sequence[Transaction],
+                 on_resize: Optional[Callable[[], Any]] = None) -> None:
+        self.digest = digest
+        self.transactions = transactions
+        self.on_resize = on_resize
+        self._derived: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, Lock] = {}
+        self._key_locks_guard = Lock()
+
+    def derived(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the result stored under key, computing (and storing) it on first use."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._key_locks_guard:
+            lock = self._key_locks.setdefault(key, Lock())
+        with lock:
+            try:
+                return self._derived[key]
+            except KeyError:
+                value = self._derived[key] = compute()
+            finally:
+                with self._key_locks_guard:
+                    self._key_locks.pop(key, None)
+        self.resized()
+        return value
+
+    def resized(self) -> None:
+        """Report a size change, e.g. after a derived result was filled in lazily."""
+        if self.on_resize is not None:
+            self.on_resize()
+
+    def derived_keys(self) -> List[Hashable]:
+        return list(self._derived)
+
+    def discard_derived(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the derived results whose key matches predicate (e.g. an old rules version)."""
+        keys = [k for k in list(self._derived) if predicate(k)]
+        for key in keys:
+            self._derived.pop(key, None)
+        if keys:
+            self.resized()
+
+
+class ContentAddressedCache:
+    """
+    Cache of parsed uploads keyed by a digest of the raw bytes plus loader options,
+    so re-submitting the same export (with a different cycle or outlier toggle)
+    skips parsing. Storage is an InMemoryResultStore, hence size-bounded LRU eviction.
+    Entry sizes are re-estimated when derived results are added or dropped.
+    """
+
+    def __init__(self, store: Optional[InMemoryResultStore] = None) -> None:
+        self._store = store if store is not None else InMemoryResultStore(max_sessions=32)
+        self._locks: Dict[str, Lock] = {}
+        self._locks_guard = Lock()
+
+    @staticmethod
+    def hasher(**options: Any) -> "hashlib._Hash":
+        """SHA-256 primed with the options (sorted); feed it the content to get a digest."""
+        h = hashlib.sha256()
+        for name in sorted(options):
+            h.update(f"{name}={options[name]!r}\0".encode("utf-8"))
+        return h
+
+    @staticmethod
+    def digest(content: bytes | str, **options: Any) -> str:
+        """SHA-256 of the options (sorted) followed by the content."""
+        h = ContentAddressedCache.hasher(**options)
+        h.update(content.encode("utf-8") if isinstance(content, str) else content)
+        return h.hexdigest()
+
+    def get(self, digest: str) -> Optional[CachedAnalysis]:
+        return self._store.get(digest)
+
+    def get_or_load(self, digest: str, load: Callable[[], Sequence[Transaction]]) -> CachedAnalysis:
+        """
+        Return the cached analysis for digest, parsing through load() on a miss.
+        Concurrent misses on the same digest parse only once.
+        """
+        entry = self._store.get(digest)
+        if entry is not None:
+            return entry
+        with self._lock_for(digest):
+            entry = self._store.get(digest)
+            if entry is None:
+                entry = self._store_new(digest, load())
+        with self._locks_guard:
+            self._locks.pop(digest, None)
+        return entry
+
+    def add(self, digest: str, transactions: Sequence[Transaction]) -> CachedAnalysis:
+        """
+        Store an upload parsed before its digest was known (hashed while streaming).
+        If the digest is already cached, the existing entry wins.
+        """
+        with self._lock_for(digest):
+            entry = self._store.get(digest)
+            if entry is None:
+                entry = self._store_new(digest, transactions)
+        with self._locks_guard:
+            self._locks.pop(digest, None)
+        return entry
+
+    def _store_new(self, digest: str, transactions: Sequence[Transaction]) -> CachedAnalysis:
+        # An upload too large for the store is still returned, just not cached
+        entry = CachedAnalysis(digest, transactions)
+        if self._store.put(digest, entry):
+            entry.on_resize = lambda: self._store.resize(digest)
+        return entry
+
+    def entries(self) -> List[CachedAnalysis]:
+        """Snapshot of the cached uploads."""
+        return self._store.values()
+
+    def stats(self) -> Dict[str, int]:
+        return self._store.stats()
+
+    def _lock_for(self, digest: str) -> Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(digest, Lock())
+
+
+class HashingReader:
+    """
+    Binary stream wrapper feeding every chunk read to a hash (see ContentAddressedCache.hasher),
+    so an upload can be parsed and digested in the same pass. size counts the bytes read.
+    """
+
+    def __init__(self, stream: IO[bytes], hasher: "hashlib._Hash") -> None:
+        self._stream = stream
+        self._hasher = hasher
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._hasher.update(data)
+        self.size += len(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
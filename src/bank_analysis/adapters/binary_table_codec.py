@@ -0,0 +1,229 @@
+"""
+Compact binary, columnar encoding of a TransactionTable.
+
+Layout (little-endian):
+  header      b"BATX" | u16 version | u16 reserved
+  blocks      repeated, each starting with a 1-byte tag:
+    b"D"  dictionary delta: u8 column id | u32 count | count x string
+          (new values appended to that column's dictionary, in code order)
+    b"R"  row group: u32 n | i32[n] date ordinals | f64[n] amounts
+          | i32[n] month codes | i32[n] category codes | i32[n] category_parent codes
+          | i32[n] supplier codes | i32[n] account codes
+          | u32[n] message byte lengths | message bytes (utf-8)
+    b"E"  end of stream: u64 total rows
+  string      u32 byte length (0xFFFFFFFF for None) | utf-8 bytes
+
+Dictionary deltas always precede the row group that first uses their codes, so
+a table can be written incrementally, one row group at a time, and an existing
+stream extended by overwriting its end marker (TableWriter.resume).
+Version 1 streams (no account column) are still read; their rows get account "".
+"""
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, List, Optional
+
+from bank_analysis.domain.transaction_table import ColumnDictionary, TransactionTable
+
+MAGIC = b"BATX"
+VERSION = 2
+_READABLE_VERSIONS = (1, 2)
+_NONE_LEN = 0xFFFFFFFF
+_DICT_COLUMNS = ("month_dict", "category_dict", "category_parent_dict", "supplier_dict", "account_dict")
+_CODE_COLUMNS = ("month_codes", "category_codes", "category_parent_codes", "supplier_codes",
+                 "account_codes")
+_SWAP = sys.byteorder != "little"
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a stream is not a valid BATX stream."""
+
+
+def _array_bytes(a: array) -> bytes:
+    if _SWAP:
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _read_exact(fp: BinaryIO, n: int) -> bytes:
+    data = fp.read(n)
+    if len(data) != n:
+        raise BinaryFormatError("Truncated BATX stream.")
+    return data
+
+
+def _read_array(fp: BinaryIO, typecode: str, n: int) -> array:
+    a = array(typecode)
+    a.frombytes(_read_exact(fp, n * a.itemsize))
+    if _SWAP:
+        a.byteswap()
+    return a
+
+
+def _write_string(fp: BinaryIO, s: Optional[str]) -> None:
+    if s is None:
+        fp.write(struct.pack("<I", _NONE_LEN))
+        return
+    data = s.encode("utf-8")
+    fp.write(struct.pack("<I", len(data)))
+    fp.write(data)
+
+
+def _read_string(fp: BinaryIO) -> Optional[str]:
+    (n,) = struct.unpack("<I", _read_exact(fp, 4))
+    if n == _NONE_LEN:
+        return None
+    return _read_exact(fp, n).decode("utf-8")
+
+
+class TableWriter:
+    """
+    Incremental writer: each write(table) call emits the dictionary values not yet
+    written, then one row group. Tables may come from different sources; their codes
+    are remapped onto the stream's own dictionaries.
+    """
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._dicts = [ColumnDictionary() for _ in _DICT_COLUMNS]
+        self._rows = 0
+        fp.write(MAGIC + struct.pack("<HH", VERSION, 0))
+
+    @classmethod
+    def resume(cls, fp: BinaryIO) -> "TableWriter":
+        """
+        Writer extending an existing stream (a file opened 'r+b'): the dictionaries
+        and row count are recovered by walking the blocks, seeking over row group
+        columns and messages, then the end marker is overwritten by later writes.
+        Only current-version streams can be extended.
+        """
+        if _read_exact(fp, 4) != MAGIC:
+            raise BinaryFormatError("Not a BATX stream (bad magic).")
+        (version, _reserved) = struct.unpack("<HH", _read_exact(fp, 4))
+        if version != VERSION:
+            raise BinaryFormatError(f"Cannot append to a BATX version {version} stream.")
+        row_bytes = 4 + 8 + 4 * len(_CODE_COLUMNS)
+
+        writer = cls.__new__(cls)
+        writer._fp = fp
+        writer._dicts = [ColumnDictionary() for _ in _DICT_COLUMNS]
+        writer._rows = 0
+        while True:
+            tag = _read_exact(fp, 1)
+            if tag == b"D":
+                col_id, count = struct.unpack("<BI", _read_exact(fp, 5))
+                if col_id >= len(writer._dicts):
+                    raise BinaryFormatError(f"Unknown BATX dictionary column {col_id}.")
+                for _ in range(count):
+                    writer._dicts[col_id].code_for(_read_string(fp))
+            elif tag == b"R":
+                (n,) = struct.unpack("<I", _read_exact(fp, 4))
+                fp.seek(n * row_bytes, 1)
+                fp.seek(sum(_read_array(fp, "I", n)), 1)
+                writer._rows += n
+            elif tag == b"E":
+                (total,) = struct.unpack("<Q", _read_exact(fp, 8))
+                if total != writer._rows:
+                    raise BinaryFormatError("BATX row count mismatch.")
+                fp.seek(-9, 1)
+                fp.truncate()
+                return writer
+            else:
+                raise BinaryFormatError(f"Unknown BATX block {tag!r}.")
+
+    def write(self, table: TransactionTable) -> None:
+        if len(table) == 0:
+            return
+        fp = self._fp
+        code_columns: List[array] = []
+        for col_id, (dict_name, codes_name) in enumerate(zip(_DICT_COLUMNS, _CODE_COLUMNS)):
+            out_dict = self._dicts[col_id]
+            before = len(out_dict)
+            remap = [out_dict.code_for(v) for v in getattr(table, dict_name).values]
+            if len(out_dict) > before:
+                fp.write(b"D" + struct.pack("<BI", col_id, len(out_dict) - before))
+                for value in out_dict.values[before:]:
+                    _write_string(fp, value)
+            code_columns.append(array("i", [remap[c] for c in getattr(table, codes_name)]))
+
+        encoded = [m.encode("utf-8") for m in table.messages]
+        fp.write(b"R" + struct.pack("<I", len(table)))
+        fp.write(_array_bytes(table.date_ordinals))
+        fp.write(_array_bytes(table.amounts))
+        for codes in code_columns:
+            fp.write(_array_bytes(codes))
+        fp.write(_array_bytes(array("I", [len(m) for m in encoded])))
+        fp.write(b"".join(encoded))
+        self._rows += len(table)
+
+    def close(self) -> None:
+        """Write the end marker (does not close the underlying file)."""
+        self._fp.write(b"E" + struct.pack("<Q", self._rows))
+
+
+def write_table(fp: BinaryIO, table: TransactionTable) -> None:
+    writer = TableWriter(fp)
+    writer.write(table)
+    writer.close()
+
+
+def iter_row_groups(fp: BinaryIO) -> Iterator[TransactionTable]:
+    """
+    Read a BATX stream one row group at a time. Yielded tables share the stream's
+    dictionaries, so only one row group of columns is decoded at once.
+    """
+    if _read_exact(fp, 4) != MAGIC:
+        raise BinaryFormatError("Not a BATX stream (bad magic).")
+    (version, _reserved) = struct.unpack("<HH", _read_exact(fp, 4))
+    if version not in _READABLE_VERSIONS:
+        raise BinaryFormatError(f"Unsupported BATX version {version}.")
+    code_columns = _CODE_COLUMNS if version >= 2 else _CODE_COLUMNS[:-1]
+
+    dicts = [ColumnDictionary() for _ in _DICT_COLUMNS]
+    rows = 0
+    while True:
+        tag = _read_exact(fp, 1)
+        if tag == b"D":
+            col_id, count = struct.unpack("<BI", _read_exact(fp, 5))
+            if col_id >= len(dicts):
+                raise BinaryFormatError(f"Unknown BATX dictionary column {col_id}.")
+            for _ in range(count):
+                # Written values are distinct, so codes are assigned in stream order
+                dicts[col_id].code_for(_read_string(fp))
+        elif tag == b"R":
+            (n,) = struct.unpack("<I", _read_exact(fp, 4))
+            group = TransactionTable(*dicts)
+            group.date_ordinals = _read_array(fp, "i", n)
+            group.amounts = _read_array(fp, "d", n)
+            for name in code_columns:
+                setattr(group, name, _read_array(fp, "i", n))
+            if version < 2:
+                group.account_codes = array("i", [dicts[-1].code_for("")]) * n
+            lengths = _read_array(fp, "I", n)
+            blob = _read_exact(fp, sum(lengths))
+            pos = 0
+            messages = group.messages
+            for length in lengths:
+                messages.append(blob[pos:pos + length].decode("utf-8"))
+                pos += length
+            rows += n
+            yield group
+        elif tag == b"E":
+            (total,) = struct.unpack("<Q", _read_exact(fp, 8))
+            if total != rows:
+                raise BinaryFormatError("BATX row count mismatch.")
+            return
+        else:
+            raise BinaryFormatError(f"Unknown BATX block {tag!r}.")
+
+
+def read_table(fp: BinaryIO) -> TransactionTable:
+    """Read a whole BATX stream into one TransactionTable."""
+    table: Optional[TransactionTable] = None
+    for group in iter_row_groups(fp):
+        if table is None:
+            table = group
+        else:
+            table.extend_table(group)
+    return table if table is not None else TransactionTable()
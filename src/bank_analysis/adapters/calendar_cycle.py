@@ -1,7 +1,25 @@
 from datetime import date
+from typing import Iterable, List, Sequence
 from ..ports.cycle_grouper import CycleGrouper
 
 class CalendarCycleGrouper(CycleGrouper):
     """Group by calendar months using 'YYYY-MM' labels."""
+    @classmethod
+    def for_transactions(cls, txns: Sequence) -> "CalendarCycleGrouper":
+        """Same signature as SalaryCycleGrouper(txns), for grouper factories."""
+        return cls()
+
     def label_for_date(self, d: date) -> str:
         return f"{d.year:04d}-{d.month:02d}"
+
+    def labels_for_dates(self, dates: Iterable[date]) -> List[str]:
+        # One formatted (shared) label per distinct month
+        labels: dict[tuple[int, int], str] = {}
+        out: List[str] = []
+        for d in dates:
+            key = (d.year, d.month)
+            label = labels.get(key)
+            if label is None:
+                label = labels[key] = f"{d.year:04d}-{d.month:02d}"
+            out.append(label)
+        return out
@@ -0,0 +1,234 @@
+"""
+Streaming CSV parsing core shared by CsvFileDataLoader and CsvContentDataLoader.
+
+Accepted sources (CsvSource):
+  - os.PathLike: a file path (opened as utf-8-sig)
+  - str: CSV content (a plain str is never treated as a path)
+  - bytes / bytearray: raw CSV content, decoded as utf-8-sig
+  - binary stream (e.g. an upload's .stream), decoded incrementally, or text stream
+  - any iterable of text lines
+
+The header line picks the delimiter (';' or ',') and the RowParser; data rows
+then go from csv.reader straight through the fast-path field parsers.
+Whole files and byte buffers can also be split on record boundaries and
+parsed in a process pool (parse_table_parallel).
+"""
+import codecs
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import pairwise
+from typing import IO, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bank_analysis.adapters.field_parsers import RowParser
+from bank_analysis.domain.transaction_table import TransactionTable
+
+CsvSource = Union[str, bytes, bytearray, os.PathLike, IO, Iterable[str]]
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# ---------- Header ----------
+
+def _detect_delimiter(header_line: str) -> str:
+    """
+    Returns ';' if no separator found.
+    """
+    semi = header_line.count(";")
+    comma = header_line.count(",")
+    if semi == 0 and comma == 0:
+        return ";"
+    return ";" if semi >= comma else ","
+
+
+def parse_header(raw_header: str) -> Optional[Tuple[str, RowParser]]:
+    """Detect the delimiter and build the row parser; None if the header is unusable."""
+    raw_header = raw_header.lstrip("\ufeff").rstrip("\r\n")
+    if not raw_header.strip():
+        return None
+    delim = _detect_delimiter(raw_header)
+    parse_row = RowParser(next(csv.reader([raw_header], delimiter=delim)))
+    if not parse_row.is_valid:
+        # Invalid header
+        return None
+    return delim, parse_row
+
+
+# ---------- Streaming ----------
+
+@contextmanager
+def open_lines(source: CsvSource) -> Iterator[Iterable[str]]:
+    """Yield the source as an iterable of text lines (line endings preserved)."""
+    if isinstance(source, os.PathLike):
+        with open(source, encoding="utf-8-sig", newline="") as f:
+            yield f
+    elif isinstance(source, str):
+        yield io.StringIO(source, newline="")
+    elif isinstance(source, (bytes, bytearray)):
+        yield io.StringIO(bytes(source).decode("utf-8-sig"), newline="")
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    elif hasattr(source, "read"):
+        yield iter_decoded_lines(source)
+    else:
+        yield source
+
+
+def iter_decoded_lines(stream: IO[bytes], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yield the text lines of a binary stream, reading chunk_size bytes at a time
+    through an incremental utf-8-sig decoder (BOM dropped, multi-byte characters
+    split across chunks handled). Only the current chunk and a partial line are
+    held in memory; the stream is not closed.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_records(source: CsvSource) -> Iterator[tuple]:
+    """Yield Transaction field tuples (in Transaction field order), one row at a time."""
+    with open_lines(source) as lines:
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
+        parsed = parse_header(first)
+        if parsed is None:
+            return
+        delim, parse_row = parsed
+
+        for cells in csv.reader(lines, delimiter=delim):
+            fields = parse_row(cells)
+            if fields is not None:
+                yield fields
+
+
+def parse_table(source: CsvSource) -> TransactionTable:
+    table = TransactionTable()
+    for fields in iter_records(source):
+        table.append_values(*fields)
+    return table
+
+
+# ---------- Parallel chunking ----------
+
+def _count_quotes(buf: Buffer, begin: int, end: int, window: int = 1 << 20) -> int:
+    """Count '"' bytes in buf[begin:end], one bounded window at a time."""
+    return sum(buf[pos:min(pos + window, end)].count(b'"') for pos in range(begin, end, window))
+
+
+def record_boundaries(buf: Buffer, start: int, n_chunks: int) -> List[int]:
+    """
+    Split buf[start:] into about n_chunks byte ranges ending on record boundaries.
+    A newline only ends a record when the number of quotes seen so far is even,
+    so line breaks (and delimiters) inside quoted fields never split a row;
+    escaped quotes ('""') do not change the parity.
+    Returns sorted offsets [start, ..., len(buf)].
+    """
+    size = len(buf)
+    bounds = [start]
+    pos, inside_quotes = start, False
+    for k in range(1, n_chunks):
+        target = start + (size - start) * k // n_chunks
+        if target <= pos:
+            continue
+        inside_quotes ^= bool(_count_quotes(buf, pos, target) & 1)
+        pos = target
+        while True:
+            nl = buf.find(b"\n", pos)
+            if nl == -1:
+                pos = size
+                break
+            inside_quotes ^= bool(_count_quotes(buf, pos, nl) & 1)
+            pos = nl + 1
+            if not inside_quotes:
+                break
+        if pos >= size:
+            break
+        bounds.append(pos)
+    bounds.append(size)
+    return bounds
+
+
+def _split(buf: Buffer, n_chunks: int) -> Optional[Tuple[str, List[str], List[int]]]:
+    header_end = buf.find(b"\n")
+    if header_end == -1:
+        header_end = len(buf)
+    parsed = parse_header(bytes(buf[:header_end]).decode("utf-8-sig"))
+    if parsed is None:
+        return None
+    delim, parse_row = parsed
+    return delim, parse_row.headers, record_boundaries(buf, min(header_end + 1, len(buf)), n_chunks)
+
+
+def _parse_bytes(chunk: bytes, delim: str, headers: List[str]) -> TransactionTable:
+    """Process-pool worker: parse a run of complete records."""
+    table = TransactionTable()
+    parse_row = RowParser(headers)
+    for cells in csv.reader(io.StringIO(chunk.decode("utf-8"), newline=""), delimiter=delim):
+        fields = parse_row(cells)
+        if fields is not None:
+            table.append_values(*fields)
+    return table
+
+
+def _parse_file_chunk(path: str, begin: int, end: int, delim: str, headers: List[str]) -> TransactionTable:
+    """Process-pool worker: parse the records in bytes [begin, end) of the file."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunk = mm[begin:end]
+    return _parse_bytes(chunk, delim, headers)
+
+
+def parse_table_parallel(source: Union[str, os.PathLike, bytes, bytearray], workers: int) -> TransactionTable:
+    """
+    Split the source at record boundaries, parse the chunks in a ProcessPoolExecutor
+    and merge the per-chunk tables in source order.
+    A str here is a file path: files are memory-mapped and each worker maps the file
+    itself, so only offsets cross process boundaries; byte buffers are sliced.
+    """
+    # A few chunks per worker keeps the pool busy when rows are uneven
+    n_chunks = max(workers, 1) * 4
+    jobs: List[Tuple[Callable[..., TransactionTable], tuple]] = []
+    if isinstance(source, (bytes, bytearray)):
+        split = _split(source, n_chunks)
+        if split is None:
+            return TransactionTable()
+        delim, headers, bounds = split
+        jobs = [(_parse_bytes, (bytes(source[b:e]), delim, headers)) for b, e in pairwise(bounds)]
+    else:
+        path = os.fspath(source)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return TransactionTable()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                split = _split(mm, n_chunks)
+        if split is None:
+            return TransactionTable()
+        delim, headers, bounds = split
+        jobs = [(_parse_file_chunk, (path, b, e, delim, headers)) for b, e in pairwise(bounds)]
+
+    table = TransactionTable()
+    if workers <= 1 or len(jobs) <= 1:
+        for fn, args in jobs:
+            table.extend_table(fn(*args))
+        return table
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for future in [pool.submit(fn, *args) for fn, args in jobs]:
+            table.extend_table(future.result())
+    return table
@@ -1,78 +1,20 @@
 from __future__ import annotations
 
-import csv
 import os
-import unicodedata
-from datetime import datetime
-from io import StringIO
-from typing import List, Optional, Sequence
-
+from typing import Iterator, List, Optional, Sequence
+
+from bank_analysis.adapters.csv_core import (  # noqa: F401 (re-exported)
+    _detect_delimiter, iter_records, parse_table_parallel,
+)
+from bank_analysis.adapters.field_parsers import (  # noqa: F401 (re-exported)
+    _normalize_header, _strip_nbsp, parse_amount,
+)
+from bank_analysis.adapters.parse_cache import DiskParseCache
 from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
 from bank_analysis.ports.loader import DataLoaderPort
 
 
-# ---------- Utils ----------
-
-def _strip_nbsp(s: Optional[str]) -> str:
-    """Normalize in NFKC, suppress NBSP et other spaces, puis strip."""
-    if not isinstance(s, str):
-        return "" if s is None else str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("\xa0", " ").replace("\u202f", " ")
-    return s.strip()
-
-
-def _normalize_header(h: Optional[str]) -> str:
-    """Normalize header (BOM, NBSP, spaces, strip)."""
-    if h is None:
-        return ""
-    h = unicodedata.normalize("NFKC", h)
-    return h.replace("\ufeff", "").replace("\xa0", " ").replace("\u202f", " ").strip()
-
-
-def parse_amount(value: Optional[str]) -> Optional[float]:
-    """
-    Converts a String to float :
-    - handles coma separator for numbers and replacing them with dots,
-    - Strip quotes,
-    - NBSP and spaces (different kinds),
-    Returns None if empty or non parseable.
-    """
-    if value is None:
-        return None
-
-    s = _strip_nbsp(value)
-    if s == "":
-        return None
-
-    if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
-        s = s[1:-1]
-
-    s = s.replace(" ", "").replace("\u202f", "").replace("\xa0", "")
-
-    s = s.replace(",", ".")
-
-    try:
-        return float(s)
-    except Exception:
-        s = s.replace('"', '')
-        try:
-            return float(s)
-        except Exception:
-            return None
-
-
-def _detect_delimiter(header_line: str) -> str:
-    """
-    Returns ';' if no separator found.
-    """
-    semi = header_line.count(";")
-    comma = header_line.count(",")
-    if semi == 0 and comma == 0:
-        return ";"
-    return ";" if semi >= comma else ","
-
-
 # ---------- Adapter ----------
 
 class CsvFileDataLoader(DataLoaderPort):
@@ -81,78 +23,71 @@ class CsvFileDataLoader(DataLoaderPort):
     - Encoding: 'utf-8-sig' (workaround for BOM).
     - Minimal expected columns (min): 'dateOp', 'amount'.
     - Optional columns: 'month', 'category', 'categoryParent'.
+    - Optional on-disk parse cache: with cache_dir set, parsed files are kept as
+      binary sidecars and reused while the file is unchanged (refresh_cache=True
+      forces a re-parse and rewrites the sidecar).
+    - Optional parallel ingestion: with workers > 1, files of at least
+      parallel_min_bytes are memory-mapped and parsed in chunks by a process pool.
     """
 
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", cache_dir: Optional[str] = None,
+                 refresh_cache: bool = False, workers: int = 1,
+                 parallel_min_bytes: int = 8 * 1024 * 1024):
         self.base_path = base_path
+        self._cache = DiskParseCache(cache_dir) if cache_dir else None
+        self._refresh_cache = refresh_cache
+        self.workers = workers
+        self.parallel_min_bytes = parallel_min_bytes
 
     def list_csv_files(self) -> List[str]:
         return [f for f in os.listdir(self.base_path) if f.lower().endswith(".csv")]
 
     def load_and_prepare(self, source: str) -> Sequence[Transaction]:
-        txns: list[Transaction] = []
-
-        with open(source, encoding="utf-8-sig") as f:
-            text = f.read()
-
-        if not text.strip():
-            return []
-
-        lines = text.splitlines()
-        raw_header = lines[0]
-        delim = _detect_delimiter(raw_header)
-
-
-        raw_headers = raw_header.split(delim)
-        headers = [_normalize_header(h) for h in raw_headers]
-
-        if not {"dateOp", "amount"}.issubset(set(headers)):
-            # Invalid header
-            return []
-
-        normalized_text = delim.join(headers) + "\n" + "\n".join(lines[1:])
-        io = StringIO(normalized_text)
-
-        reader = csv.DictReader(io, delimiter=delim)
-        for row in reader:
-            # Safety normalization
-            row = {_normalize_header(k): v for k, v in row.items()}
-
-            date_raw = _strip_nbsp(row.get("dateOp"))
-            amount_raw = _strip_nbsp(row.get("amount"))
-
-            if not date_raw:
-                continue
-
-            amount = parse_amount(amount_raw)
-            if amount is None:
-                continue
-
-            # Date ISO 'YYYY-MM-DD'
-            try:
-                d = datetime.fromisoformat(date_raw).date()
-            except Exception:
-                cleaned = date_raw.replace('"', '').strip()
-                try:
-                    d = datetime.fromisoformat(cleaned).date()
-                except Exception:
-                    continue
-
-            # Optional fields
-            month = _strip_nbsp(row.get("month")) or f"{d.year:04d}-{d.month:02d}"
-            category = _strip_nbsp(row.get("category"))
-            category_parent = _strip_nbsp(row.get("categoryParent"))
-            supplier_found = _strip_nbsp(row.get("supplierFound"))
-            message = _strip_nbsp(row.get("label"))
-
-            txns.append(Transaction(
-                date_op=d,
-                month=month,
-                category=category,
-                category_parent=category_parent,
-                amount=float(amount),
-                supplier=supplier_found,
-                message=message
-            ))
-
-        return txns
+        if self._cache is not None or self.workers > 1:
+            return self.load_table(source)
+        return list(self.iter_transactions(source))
+
+    def iter_transactions(self, source: str) -> Iterator[Transaction]:
+        """
+        Streaming mode: read the file incrementally and yield Transactions one by one.
+        Rows are parsed by the shared streaming core (csv_core).
+        With a parse cache, rows come from the cached table.
+        """
+        if self._cache is not None:
+            yield from self.load_table(source)
+            return
+        for fields in self._iter_rows(source):
+            yield Transaction(*fields)
+
+    def load_table(self, source: str) -> TransactionTable:
+        """Columnar mode: parsed rows go straight into a TransactionTable."""
+        if self._cache is not None:
+            if self._refresh_cache:
+                self._cache.invalidate(source)
+            else:
+                cached = self._cache.load(source)
+                if cached is not None:
+                    return cached
+
+        if self.workers > 1 and os.path.getsize(source) >= self.parallel_min_bytes:
+            table = self.load_parallel(source)
+        else:
+            table = TransactionTable()
+            for fields in self._iter_rows(source):
+                table.append_values(*fields)
+
+        if self._cache is not None:
+            self._cache.store(source, table)
+        return table
+
+    def load_parallel(self, source: str, workers: Optional[int] = None) -> TransactionTable:
+        """
+        Parallel mode: memory-map the file, split it at record boundaries (newlines
+        outside quoted fields), parse the chunks in a ProcessPoolExecutor and merge
+        the per-chunk tables in file order.
+        """
+        return parse_table_parallel(source, workers or max(self.workers, 1))
+
+    def _iter_rows(self, source: str) -> Iterator[tuple]:
+        with open(source, encoding="utf-8-sig", newline="") as f:
+            yield from iter_records(f)
@@ -0,0 +1,179 @@
+"""
+Cell parsers shared by the CSV loaders.
+
+Each field has a reference ("slow") parser, which is the historical behaviour
+(NFKC normalization, NBSP handling, several fallbacks), and a fast path for the
+shapes bank exports actually contain: plain ASCII text, French-format amounts
+('-49,40', '1 234,56' with NBSP thousands) and ISO dates. A fast path either
+returns exactly what the slow parser would, or defers to it.
+"""
+import unicodedata
+from datetime import date, datetime
+from typing import List, Optional, Sequence
+
+# Version of the parsed output: bump it whenever a change here (or in RowParser)
+# alters the fields produced for the same CSV, so cached parses are rebuilt.
+# 2: account column (accountNum).
+PARSER_VERSION = 2
+
+# NBSP and narrow NBSP, the only non-ASCII characters the amount fast path accepts
+_NBSP_TABLE = str.maketrans("", "", "\xa0\u202f")
+
+
+# ---------- Reference parsers ----------
+
+def _strip_nbsp(s: Optional[str]) -> str:
+    """Normalize in NFKC, suppress NBSP et other spaces, puis strip."""
+    if not isinstance(s, str):
+        return "" if s is None else str(s)
+    s = unicodedata.normalize("NFKC", s)
+    s = s.replace("\xa0", " ").replace("\u202f", " ")
+    return s.strip()
+
+
+def _normalize_header(h: Optional[str]) -> str:
+    """Normalize header (BOM, NBSP, spaces, strip)."""
+    if h is None:
+        return ""
+    h = unicodedata.normalize("NFKC", h)
+    return h.replace("\ufeff", "").replace("\xa0", " ").replace("\u202f", " ").strip()
+
+
+def parse_amount(value: Optional[str]) -> Optional[float]:
+    """
+    Converts a String to float :
+    - handles coma separator for numbers and replacing them with dots,
+    - Strip quotes,
+    - NBSP and spaces (different kinds),
+    Returns None if empty or non parseable.
+    """
+    if value is None:
+        return None
+
+    s = _strip_nbsp(value)
+    if s == "":
+        return None
+
+    if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
+        s = s[1:-1]
+
+    s = s.replace(" ", "").replace("\u202f", "").replace("\xa0", "")
+
+    s = s.replace(",", ".")
+
+    try:
+        return float(s)
+    except Exception:
+        s = s.replace('"', '')
+        try:
+            return float(s)
+        except Exception:
+            return None
+
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """ISO date ('YYYY-MM-DD', optionally quoted); None if not parseable."""
+    s = _strip_nbsp(value)
+    if not s:
+        return None
+    try:
+        return datetime.fromisoformat(s).date()
+    except Exception:
+        cleaned = s.replace('"', '').strip()
+        try:
+            return datetime.fromisoformat(cleaned).date()
+        except Exception:
+            return None
+
+
+# ---------- Fast paths ----------
+
+def clean_text(s: Optional[str]) -> str:
+    """_strip_nbsp(), skipping NFKC for ASCII cells (where it is the identity)."""
+    if s.__class__ is str and s.isascii():
+        return s.strip()
+    return _strip_nbsp(s)
+
+
+def parse_amount_fast(value: Optional[str]) -> Optional[float]:
+    """parse_amount() for '-49,40' / '1 234,56' shaped cells; defers to it otherwise."""
+    if value.__class__ is not str:
+        return parse_amount(value)
+    s = value if value.isascii() else value.translate(_NBSP_TABLE)
+    if s.isascii():
+        s = s.strip()
+        if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
+            s = s[1:-1]
+        try:
+            return float(s.replace(" ", "").replace(",", "."))
+        except ValueError:
+            pass
+    return parse_amount(value)
+
+
+def parse_date_fast(value: Optional[str]) -> Optional[date]:
+    """parse_date() for bare 'YYYY-MM-DD' cells; defers to it otherwise."""
+    if value.__class__ is str and len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_date(value)
+
+
+class RowParser:
+    """
+    Turns csv.reader rows into Transaction field tuples (in Transaction field order).
+    Headers are normalized once and resolved to column positions, so rows are
+    plain lists rather than per-row dicts.
+    """
+
+    __slots__ = ("headers", "_date", "_amount", "_month", "_category",
+                 "_category_parent", "_supplier", "_label", "_account")
+
+    def __init__(self, raw_headers: Sequence[Optional[str]]) -> None:
+        self.headers: List[str] = [_normalize_header(h) for h in raw_headers]
+        # Like csv.DictReader, the last column wins when a name is repeated
+        positions = {name: i for i, name in enumerate(self.headers)}
+        self._date = positions.get("dateOp")
+        self._amount = positions.get("amount")
+        self._month = positions.get("month")
+        self._category = positions.get("category")
+        self._category_parent = positions.get("categoryParent")
+        self._supplier = positions.get("supplierFound")
+        self._label = positions.get("label")
+        self._account = positions.get("accountNum")
+
+    @property
+    def is_valid(self) -> bool:
+        return self._date is not None and self._amount is not None
+
+    def __call__(self, cells: Sequence[Optional[str]]) -> Optional[tuple]:
+        """Field values for one row; None if it has no usable date/amount."""
+        width = len(self.headers)
+        if len(cells) < width:
+            # Short row: missing trailing cells read as None (csv.DictReader's restval)
+            cells = list(cells) + [None] * (width - len(cells))
+
+        date_raw = clean_text(cells[self._date])
+        if not date_raw:
+            return None
+
+        amount = parse_amount_fast(cells[self._amount])
+        if amount is None:
+            return None
+
+        d = parse_date_fast(date_raw)
+        if d is None:
+            return None
+
+        month = (self._month is not None and clean_text(cells[self._month])) \
+            or f"{d.year:04d}-{d.month:02d}"
+        category = clean_text(cells[self._category]) if self._category is not None else ""
+        category_parent = (clean_text(cells[self._category_parent])
+                           if self._category_parent is not None else "")
+        supplier_found = clean_text(cells[self._supplier]) if self._supplier is not None else ""
+        message = clean_text(cells[self._label]) if self._label is not None else ""
+        account = clean_text(cells[self._account]) if self._account is not None else ""
+
+        return d, month, category, category_parent, float(amount), message, supplier_found, account
@@ -0,0 +1,122 @@
+import csv
+import json
+import os
+from collections import Counter
+from dataclasses import asdict, fields
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..domain.value_objects import BatchFileResult, FileAnalysis, MonthlySummary
+from ..ports.report_writer import ReportWriterPort
+
+FORMATS = ("json", "csv")
+MANIFEST_NAME = "batch_report.json"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stem(source: str) -> str:
+    return os.path.splitext(os.path.basename(source))[0]
+
+
+class FileReportWriter(ReportWriterPort):
+    """
+    Writes batch outputs into out_dir, named after the source file (see plan()):
+    - json: <name>.json with the summary, excluded months, aggregates and breakdowns
+    - csv:  <name>.summary.csv (one row per period, 'excluded' flag) and
+            <name>.breakdown.csv (period;kind;label;total;nb_operations, enhanced
+            breakdown per period), ';'-separated like the bank exports
+    The run manifest (per-file rows, outputs, stage timings, errors, and the run's
+    throughput over its wall time) is JSON.
+    """
+
+    def __init__(self, out_dir: str, fmt: str = "json"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown output format '{fmt}'. Expected one of: {', '.join(FORMATS)}.")
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self._names: Dict[str, str] = {}
+        os.makedirs(out_dir, exist_ok=True)
+
+    def plan(self, sources: Sequence[str]) -> None:
+        """
+        Name each source's outputs: the file name without extension, or, for sources
+        sharing a name, their path relative to the common directory of those sources
+        ('a/export.csv' -> 'a__export'), keeping the extension if still needed.
+        Raises ValueError when two sources would still write the same outputs.
+        """
+        repeated = sorted(s for s, n in Counter(sources).items() if n > 1)
+        if repeated:
+            raise ValueError("Sources listed more than once: " + ", ".join(repeated))
+        names = {s: _stem(s) for s in sources}
+        for pass_ext in (False, True):
+            counts = Counter(names.values())
+            clashes = [s for s in sources if counts[names[s]] > 1]
+            if not clashes:
+                break
+            root = os.path.commonpath([os.path.dirname(os.path.abspath(s)) for s in clashes])
+            for s in clashes:
+                rel = os.path.relpath(os.path.abspath(s), root)
+                if not pass_ext:
+                    rel = os.path.splitext(rel)[0]
+                names[s] = rel.replace(os.sep, "__")
+        counts = Counter(names.values())
+        duplicates = sorted(s for s in sources if counts[names[s]] > 1)
+        if duplicates:
+            raise ValueError("Sources would overwrite each other's outputs: " + ", ".join(duplicates))
+        self._names = names
+
+    def _path(self, source: str, suffix: str) -> str:
+        name = self._names.get(source) or _stem(source)
+        return os.path.join(self.out_dir, name + suffix)
+
+    def write(self, analysis: FileAnalysis) -> List[str]:
+        if self.fmt == "json":
+            path = self._path(analysis.source, ".json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(asdict(analysis), f, ensure_ascii=False, indent=1, default=_json_default)
+            return [path]
+
+        summary_path = self._path(analysis.source, ".summary.csv")
+        excluded = set(analysis.excluded_months)
+        names = [f.name for f in fields(MonthlySummary)]
+        with open(summary_path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f, delimiter=";")
+            w.writerow(names + ["excluded"])
+            for row in analysis.monthly_summary:
+                w.writerow([getattr(row, n) for n in names] + [int(row.month in excluded)])
+
+        breakdown_path = self._path(analysis.source, ".breakdown.csv")
+        with open(breakdown_path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f, delimiter=";")
+            w.writerow(["period", "kind", "label", "total", "nb_operations"])
+            for period, rows in analysis.period_enhanced_breakdowns.items():
+                for r in rows:
+                    w.writerow([period, r.kind.value, r.label, r.total, r.nb_operations])
+        return [summary_path, breakdown_path]
+
+    def write_manifest(self, results: Sequence[BatchFileResult],
+                       wall_seconds: Optional[float] = None) -> str:
+        total_rows = sum(r.rows for r in results)
+        if wall_seconds is None:
+            wall_seconds = sum(r.timings.get("total", 0.0) for r in results)
+        manifest = {
+            "files": len(results),
+            "failed": sum(1 for r in results if r.error is not None),
+            "rows": total_rows,
+            "seconds": round(wall_seconds, 6),
+            "rows_per_second": round(total_rows / wall_seconds, 1) if wall_seconds else None,
+            "stages": {
+                stage: round(sum(r.timings.get(stage, 0.0) for r in results), 6)
+                for stage in ("load", "analyze", "write")
+            },
+            "results": [asdict(r) for r in results],
+        }
+        path = os.path.join(self.out_dir, MANIFEST_NAME)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        return path
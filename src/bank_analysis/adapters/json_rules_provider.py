@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from bank_analysis.domain.reporting.rule_set import RuleSet, rule_set_from_dict
+from bank_analysis.ports.rules_provider import RulesProviderPort
+
+
+def load_rule_set(path: str) -> RuleSet:
+    """Read a JSON rules config (see rule_set_from_dict) once."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return _parse(data)
+
+
+def _parse(data: bytes) -> RuleSet:
+    doc = json.loads(data.decode("utf-8-sig"))
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    # The declared version is for humans; the content digest makes edits that
+    # forget to bump it a new version too
+    declared = doc.get("version") if isinstance(doc, dict) else None
+    version = f"{declared}@{digest}" if declared else digest
+    return rule_set_from_dict(doc, version)
+
+
+class JsonRulesProvider(RulesProviderPort):
+    """
+    Rules from a JSON config file, reloaded when the file changes (hot reload).
+
+    current() stats the file at most every check_interval seconds; a changed
+    (mtime, size) triggers a re-read, and a changed content a new RuleSet whose
+    version combines the declared 'version' and the content digest. Listeners
+    registered with on_change() are called after the switch, in version order.
+    watch() polls the file from a daemon thread, so changes are usually picked up
+    off the request path.
+
+    A config that fails to parse is reported through last_error and ignored: the
+    previous rules stay in force. The first load must succeed.
+    """
+
+    def __init__(self, path: str, check_interval: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__()
+        self.path = path
+        self.check_interval = check_interval
+        self.last_error: Optional[str] = None
+        self._clock = clock
+        self._lock = threading.RLock()  # listeners may call current()
+        self._stop_watching = threading.Event()
+        self._stat = self._file_stat()
+        self._rule_set = load_rule_set(path)
+        self._checked_at = clock()
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def current(self) -> RuleSet:
+        if self._clock() - self._checked_at >= self.check_interval:
+            self.reload()
+        return self._rule_set
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-read the file if it changed; returns True if the rules changed."""
+        with self._lock:
+            self._checked_at = self._clock()
+            stat = self._file_stat()
+            if stat is None or (stat == self._stat and not force):
+                return False
+            self._stat = stat
+            try:
+                with open(self.path, "rb") as f:
+                    new = _parse(f.read())
+            except (OSError, ValueError) as e:  # JSONDecodeError is a ValueError
+                self.last_error = f"{type(e).__name__}: {e}"
+                return False
+            self.last_error = None
+            old = self._rule_set
+            if new.version == old.version:
+                return False
+            self._rule_set = new
+            self._notify(old, new)
+        return True
+
+    def watch(self) -> threading.Thread:
+        """Start a daemon thread calling reload() every check_interval seconds, until stop()."""
+        self._stop_watching.clear()
+
+        def poll() -> None:
+            while not self._stop_watching.wait(self.check_interval):
+                self.reload()
+        thread = threading.Thread(target=poll, name="rules-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stop_watching.set()
@@ -0,0 +1,59 @@
+import glob
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from bank_analysis.adapters.binary_file_loader import BINARY_EXTENSION, BinaryFileDataLoader
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.domain.transaction_table import TransactionTable
+
+
+def _load_file(path: str) -> TransactionTable:
+    """Worker: parse one export and tag rows without 'accountNum' with the file name."""
+    if path.lower().endswith(BINARY_EXTENSION):
+        table = BinaryFileDataLoader().load_table(path)
+    else:
+        table = CsvFileDataLoader().load_table(path)
+    missing = table.account_dict.lookup("")
+    if missing is not None:
+        tag = table.account_dict.code_for(os.path.splitext(os.path.basename(path))[0])
+        table.account_codes = array("i", [tag if c == missing else c for c in table.account_codes])
+    return table
+
+
+class MultiFileDataLoader:
+    """
+    Loads several account exports at once, one file per process (workers > 1).
+    Rows keep their 'accountNum'; exports without that column are tagged with
+    their file name, so every row belongs to an account.
+    """
+
+    def __init__(self, base_path: str = ".", workers: Optional[int] = None):
+        self.base_path = base_path
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    def list_files(self, pattern: Optional[str] = None) -> List[str]:
+        """CSV and BATX files matching pattern (a glob), or every CSV in base_path."""
+        if pattern:
+            return sorted(p for p in glob.glob(pattern)
+                          if p.lower().endswith((".csv", BINARY_EXTENSION)) and os.path.isfile(p))
+        return sorted(os.path.join(self.base_path, f)
+                      for f in CsvFileDataLoader(self.base_path).list_csv_files())
+
+    def load_files(self, paths: Sequence[str]) -> Dict[str, TransactionTable]:
+        """path -> table, in the order of paths."""
+        workers = min(self.workers, len(paths))
+        if workers <= 1:
+            tables = [_load_file(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                tables = list(pool.map(_load_file, paths))
+        return dict(zip(paths, tables))
+
+    def load_table(self, paths: Sequence[str]) -> TransactionTable:
+        """All files in one table, file after file."""
+        out = TransactionTable()
+        for table in self.load_files(paths).values():
+            out.extend_table(table)
+        return out
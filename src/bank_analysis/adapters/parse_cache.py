@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+from bank_analysis.adapters.binary_table_codec import VERSION, BinaryFormatError, read_table, write_table
+from bank_analysis.adapters.field_parsers import PARSER_VERSION
+from bank_analysis.domain.transaction_table import TransactionTable
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DiskParseCache:
+    """
+    On-disk cache of parsed CSV files, stored as BATX sidecars (see binary_table_codec).
+
+    For each source path, the cache directory holds:
+      - <key>.batx: the parsed TransactionTable
+      - <key>.json: the source path, size, mtime_ns and SHA-256 it was parsed from,
+        and the BATX and parser versions that produced the sidecar
+    where <key> is derived from the absolute source path.
+
+    Sidecars written by another BATX or parser version are misses.
+
+    A sidecar is reused when size and mtime match; if only the mtime moved (e.g. the
+    file was copied or touched), the content hash decides and the metadata is refreshed.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+
+    def _paths(self, source: str) -> tuple[str, str]:
+        key = hashlib.sha256(os.path.abspath(source).encode("utf-8")).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, key)
+        return base + ".batx", base + ".json"
+
+    def load(self, source: str) -> Optional[TransactionTable]:
+        data_path, meta_path = self._paths(source)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            st = os.stat(source)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("format") != VERSION or meta.get("parser") != PARSER_VERSION:
+            return None
+        if meta.get("size") != st.st_size:
+            return None
+        if meta.get("mtime_ns") != st.st_mtime_ns:
+            if meta.get("sha256") != file_sha256(source):
+                return None
+            meta["mtime_ns"] = st.st_mtime_ns
+            self._write_meta(meta_path, meta)
+
+        try:
+            with open(data_path, "rb") as f:
+                return read_table(f)
+        except (OSError, BinaryFormatError):
+            return None
+
+    def store(self, source: str, table: TransactionTable) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, meta_path = self._paths(source)
+        st = os.stat(source)
+        meta = {
+            "source": os.path.abspath(source),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": file_sha256(source),
+            "format": VERSION,
+            "parser": PARSER_VERSION,
+        }
+        tmp = data_path + ".tmp"
+        with open(tmp, "wb") as f:
+            write_table(f, table)
+        os.replace(tmp, data_path)
+        self._write_meta(meta_path, meta)
+
+    def invalidate(self, source: str) -> None:
+        for path in self._paths(source):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _write_meta(meta_path: str, meta: dict) -> None:
+        tmp = meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, meta_path)
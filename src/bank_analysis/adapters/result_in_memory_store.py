@@ -1,21 +1,255 @@
 
 # src/bank_analysis/adapters/result_store.py
-from typing import Dict, Any
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
 from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class _Entry:
+    payload: Any
+    nbytes: int
+    last_access: float
+
+
+class _Stripe:
+    """One shard of the store: its own lock, LRU-ordered entries and counters."""
+    __slots__ = ("lock", "entries", "nbytes", "hits", "misses", "evictions", "expirations", "rejections")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+
+
+def estimate_size(obj: Any, sample: int = 64) -> int:
+    """
+    Approximate deep size of a payload in bytes.
+    - objects exposing an 'nbytes' attribute (e.g. TransactionTable) report themselves
+    - long lists/tuples are sampled: average size of the first 'sample' items x length
+    - shared objects are only counted once
+    """
+    seen: set = set()
+
+    def size(o: Any) -> int:
+        if id(o) in seen:
+            return 0
+        seen.add(id(o))
+
+        nbytes = getattr(o, "nbytes", None)
+        if isinstance(nbytes, int):
+            return nbytes
+        if isinstance(o, (str, bytes, int, float, bool)) or o is None:
+            return sys.getsizeof(o)
+
+        total = sys.getsizeof(o)
+        if isinstance(o, dict):
+            return total + sum(size(k) + size(v) for k, v in o.items())
+        if isinstance(o, (list, tuple, set, frozenset)):
+            items = list(o) if isinstance(o, (set, frozenset)) else o
+            if len(items) <= sample:
+                return total + sum(size(i) for i in items)
+            sampled = sum(size(i) for i in items[:sample])
+            return total + sampled * len(items) // sample
+        if is_dataclass(o):
+            return total + sum(size(getattr(o, f.name)) for f in fields(o))
+        if hasattr(o, "__dict__"):
+            return total + size(vars(o))
+        return total
+
+    return size(obj)
+
 
 class InMemoryResultStore:
-    def __init__(self):
-        self._lock = Lock()
-        self._store: Dict[str, Any] = {}
+    """
+    Session-keyed, in-process result cache.
+
+    Eviction (all limits optional; None means unbounded):
+      - max_sessions: maximum number of stored sessions
+      - max_bytes: maximum total estimated payload size (see estimate_size)
+      - ttl_seconds: entries idle for longer than this are dropped
+    When a limit is exceeded, the least recently used sessions are evicted first.
+    A payload larger than max_bytes on its own is rejected: put() returns False and
+    the 'rejections' counter is incremented. Payloads that grow after put() (lazily
+    derived results) are re-accounted with resize().
 
-    def put(self, session_id: str, payload: Any):
-        with self._lock:
-            self._store[session_id] = payload
+    Concurrency: keys are spread over lock stripes, so reads of different sessions
+    do not serialize on a single lock; only eviction walks all stripes.
+    """
+
+    def __init__(self,
+                 max_sessions: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 stripes: int = 16,
+                 size_of: Callable[[Any], int] = estimate_size,
+                 clock: Callable[[], float] = time.monotonic):
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._size_of = size_of
+        self._clock = clock
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self._evict_lock = Lock()
+
+    def _stripe(self, session_id: str) -> _Stripe:
+        return self._stripes[hash(session_id) % len(self._stripes)]
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.last_access > self.ttl_seconds
+
+    def put(self, session_id: str, payload: Any) -> bool:
+        """Store payload under session_id; False if it alone exceeds max_bytes (nothing stored)."""
+        entry = _Entry(payload, self._size_of(payload), self._clock())
+        stripe = self._stripe(session_id)
+        if self.max_bytes is not None and entry.nbytes > self.max_bytes:
+            with stripe.lock:
+                stripe.rejections += 1
+            return False
+        with stripe.lock:
+            old = stripe.entries.pop(session_id, None)
+            if old is not None:
+                stripe.nbytes -= old.nbytes
+            stripe.entries[session_id] = entry
+            stripe.nbytes += entry.nbytes
+        self._enforce_limits(keep=session_id)
+        return True
+
+    def resize(self, session_id: str) -> bool:
+        """
+        Re-estimate the size of a stored payload that has grown (or shrunk) in place,
+        then enforce the limits. Returns False if the entry is gone, or was dropped
+        because it alone now exceeds max_bytes.
+        """
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            entry = stripe.entries.get(session_id)
+        if entry is None:
+            return False
+        nbytes = self._size_of(entry.payload)
+        with stripe.lock:
+            if stripe.entries.get(session_id) is not entry:
+                return False
+            stripe.nbytes += nbytes - entry.nbytes
+            entry.nbytes = nbytes
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                del stripe.entries[session_id]
+                stripe.nbytes -= nbytes
+                stripe.rejections += 1
+                return False
+        self._enforce_limits(keep=session_id)
+        return True
 
     def get(self, session_id: str) -> Any | None:
-        with self._lock:
-            return self._store.get(session_id)
+        stripe = self._stripe(session_id)
+        now = self._clock()
+        with stripe.lock:
+            entry = stripe.entries.get(session_id)
+            if entry is None:
+                stripe.misses += 1
+                return None
+            if self._expired(entry, now):
+                del stripe.entries[session_id]
+                stripe.nbytes -= entry.nbytes
+                stripe.expirations += 1
+                stripe.misses += 1
+                return None
+            entry.last_access = now
+            stripe.entries.move_to_end(session_id)
+            stripe.hits += 1
+            return entry.payload
 
     def remove(self, session_id: str):
-        with self._lock:
-            self._store.pop(session_id, None)
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            entry = stripe.entries.pop(session_id, None)
+            if entry is not None:
+                stripe.nbytes -= entry.nbytes
+
+    def values(self) -> List[Any]:
+        """Snapshot of the live payloads (no effect on recency or hit counters)."""
+        now = self._clock()
+        out: List[Any] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                out.extend(e.payload for e in stripe.entries.values() if not self._expired(e, now))
+        return out
+
+    def stats(self) -> Dict[str, int]:
+        """Counters summed over all stripes."""
+        out = {"sessions": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0,
+               "rejections": 0}
+        for stripe in self._stripes:
+            with stripe.lock:
+                out["sessions"] += len(stripe.entries)
+                out["bytes"] += stripe.nbytes
+                out["hits"] += stripe.hits
+                out["misses"] += stripe.misses
+                out["evictions"] += stripe.evictions
+                out["expirations"] += stripe.expirations
+                out["rejections"] += stripe.rejections
+        return out
+
+    # === Eviction ===
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> None:
+        """Evict until within limits, never evicting 'keep' (the entry just stored)."""
+        with self._evict_lock:
+            self._purge_expired()
+            while self._over_limits():
+                if not self._evict_oldest(keep):
+                    break
+
+    def _purge_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        now = self._clock()
+        for stripe in self._stripes:
+            with stripe.lock:
+                # Entries are LRU-ordered within a stripe: expired ones are at the front
+                while stripe.entries:
+                    key, entry = next(iter(stripe.entries.items()))
+                    if not self._expired(entry, now):
+                        break
+                    del stripe.entries[key]
+                    stripe.nbytes -= entry.nbytes
+                    stripe.expirations += 1
+
+    def _over_limits(self) -> bool:
+        sessions = sum(len(s.entries) for s in self._stripes)
+        if self.max_sessions is not None and sessions > self.max_sessions:
+            return True
+        nbytes = sum(s.nbytes for s in self._stripes)
+        return self.max_bytes is not None and nbytes > self.max_bytes and sessions > 0
+
+    def _evict_oldest(self, keep: Optional[str] = None) -> bool:
+        """Evict the globally least recently used entry (oldest head across stripes), except keep."""
+        oldest: Optional[_Stripe] = None
+        oldest_key = oldest_access = None
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key, head in stripe.entries.items():
+                    if key == keep:
+                        continue  # the next entry is the stripe's oldest candidate
+                    if oldest_access is None or head.last_access < oldest_access:
+                        oldest, oldest_key, oldest_access = stripe, key, head.last_access
+                    break
+        if oldest is None:
+            return False
+        with oldest.lock:
+            entry = oldest.entries.pop(oldest_key, None)
+            if entry is None:
+                return True
+            oldest.nbytes -= entry.nbytes
+            oldest.evictions += 1
+        return True
@@ -1,30 +1,74 @@
+import sys
+from bisect import bisect_right
 from datetime import date, timedelta
-from typing import Sequence
+from typing import Iterable, List, Optional, Sequence
 from bank_analysis.domain.entities import Transaction
 from bank_analysis.ports.cycle_grouper import CycleGrouper
 
+OUTSIDE_LABEL = "Outside salary periods"
+
 class SalaryCycleGrouper(CycleGrouper):
     """
     Build periods from actual salary dates:
     - Each period starts on a salary date and ends the day before the next salary date.
     - The last period ends at the max date in the dataset.
     - ISO labels: 'YYYY-MM-DD to YYYY-MM-DD' for lexical == chronological sorting.
+
+    Period starts are kept as a sorted array of ordinals and resolved by bisection;
+    labels are built (and interned) once, at construction time.
     """
 
     def __init__(self, txns: Sequence[Transaction], salary_category: str = "Salaire fixe") -> None:
         # Collect unique salary dates
         salary_dates = sorted({t.date_op for t in txns if t.category == salary_category})
+        max_date = max((t.date_op for t in txns), default=None)
+        self._init_periods(salary_dates, max_date, salary_category)
+
+    def _init_periods(self, salary_dates: List[date], max_date: Optional[date],
+                      salary_category: str) -> None:
+        self.salary_category = salary_category
+        self._salary_dates = salary_dates
+        self._max_date = max_date
         self._periods: list[tuple[date, date]] = []
         if salary_dates:
-            max_date = max(t.date_op for t in txns)
             for i in range(len(salary_dates) - 1):
                 start = salary_dates[i]
                 end = salary_dates[i + 1] - timedelta(days=1)
                 self._periods.append((start, end))
             self._periods.append((salary_dates[-1], max_date))
 
+        self._starts: list[int] = [start.toordinal() for start, _ in self._periods]
+        self._ends: list[int] = [end.toordinal() for _, end in self._periods]
+        self._labels: list[str] = [
+            sys.intern(f"{start.isoformat()} to {end.isoformat()}") for start, end in self._periods
+        ]
+
+    def extended_with(self, txns: Iterable[Transaction]) -> "SalaryCycleGrouper":
+        """
+        Grouper for this dataset plus txns, without rescanning the history: new salary
+        dates are merged in (a new 'Salaire fixe' splits the last open period) and the
+        last period is stretched to the new max date.
+        """
+        salary_dates = set(self._salary_dates)
+        max_date = self._max_date
+        for t in txns:
+            if t.category == self.salary_category:
+                salary_dates.add(t.date_op)
+            if max_date is None or t.date_op > max_date:
+                max_date = t.date_op
+        out = type(self).__new__(type(self))
+        out._init_periods(sorted(salary_dates), max_date, self.salary_category)
+        return out
+
+    def _label_for_ordinal(self, ordinal: int) -> str:
+        i = bisect_right(self._starts, ordinal) - 1
+        if i >= 0 and ordinal <= self._ends[i]:
+            return self._labels[i]
+        return OUTSIDE_LABEL
+
     def label_for_date(self, d: date) -> str:
-        for start, end in self._periods:
-            if start <= d <= end:
-                return f"{start.isoformat()} to {end.isoformat()}"
-        return "Outside salary periods"
+        return self._label_for_ordinal(d.toordinal())
+
+    def labels_for_dates(self, dates: Iterable[date]) -> List[str]:
+        label_for_ordinal = self._label_for_ordinal
+        return [label_for_ordinal(d.toordinal()) for d in dates]
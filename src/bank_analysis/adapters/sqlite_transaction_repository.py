@@ -0,0 +1,260 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.matcher import _match_supplier
+from bank_analysis.domain.period_splicer import _parse_iso_date
+from bank_analysis.domain.reporting.category_rules import DEFAULT_CATEGORY_RULES, SupplierPattern
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.reporting.summary import build_summary
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.value_objects import BreakdownKind, CategoryBreakdown, MonthlySummary
+from bank_analysis.ports.cycle_grouper import CycleGrouper
+from bank_analysis.ports.transaction_repository import TransactionRepository
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    date_op TEXT NOT NULL,
+    month TEXT,
+    category TEXT,
+    category_parent TEXT,
+    amount REAL NOT NULL,
+    message TEXT,
+    supplier TEXT,
+    account TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_transactions_date ON transactions (dataset, date_op);
+CREATE INDEX IF NOT EXISTS ix_transactions_month ON transactions (dataset, month);
+CREATE INDEX IF NOT EXISTS ix_transactions_category ON transactions (dataset, category);
+CREATE INDEX IF NOT EXISTS ix_transactions_supplier ON transactions (dataset, supplier);
+"""
+
+_COLUMNS = "date_op, month, category, category_parent, amount, message, supplier, account"
+
+
+class SqliteTransactionRepository(TransactionRepository):
+    """
+    TransactionRepository on stdlib sqlite3.
+
+    - Dates are stored as ISO text, so date ranges are index range scans.
+    - add_many() inserts with executemany() inside a single transaction.
+    - Summary and breakdown totals are SQL aggregates (the summary is aggregated per
+      date in SQL, then folded into periods with the cycle grouper, which may be any
+      Python labelling rule). Totals can differ from the in-memory functions in the
+      last float bit before rounding, since rows are summed in index order.
+    - Supplier matching and case folding are registered as SQL functions, so the
+      filters keep the exact domain semantics.
+
+    Each thread gets its own connection; file databases use WAL so readers do not
+    block the writer. ':memory:' creates a private in-memory database shared by the
+    instance's connections.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        supplier_patterns: Tuple[SupplierPattern, ...] = DEFAULT_CATEGORY_RULES.supplier_patterns,
+    ) -> None:
+        self._memory = path == ":memory:"
+        self._uri = f"file:bank_analysis_{id(self)}?mode=memory&cache=shared" if self._memory else path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        @lru_cache(maxsize=4096)
+        def match_supplier(supplier: Optional[str]) -> int:
+            return 1 if _match_supplier(supplier, supplier_patterns) else 0
+        self._match_supplier = match_supplier
+
+        # Keeps an in-memory database alive, and creates the schema
+        self._anchor = self._connect()
+        with self._anchor:
+            self._anchor.executescript(_SCHEMA)
+
+    # ----- Connections -----
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._uri, uri=self._memory, timeout=30, check_same_thread=False)
+        if not self._memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.create_function("match_supplier", 1, self._match_supplier, deterministic=True)
+        conn.create_function("casefold", 1, _casefold, deterministic=True)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by the repository, whichever thread opened it."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    # ----- Writes -----
+
+    def add_many(self, dataset: str, transactions: Iterable[Transaction]) -> int:
+        with self._conn as conn:
+            cur = conn.executemany(
+                f"INSERT INTO transactions (dataset, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((dataset, *row) for row in _rows(transactions)),
+            )
+        return cur.rowcount
+
+    def has_dataset(self, dataset: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM transactions WHERE dataset = ? LIMIT 1", (dataset,)
+        ).fetchone()
+        return row is not None
+
+    def delete_dataset(self, dataset: str) -> None:
+        with self._conn as conn:
+            conn.execute("DELETE FROM transactions WHERE dataset = ?", (dataset,))
+
+    # ----- Queries -----
+
+    def transactions(self, dataset: str, period: Optional[str] = None) -> List[Transaction]:
+        where, params = "dataset = ?", [dataset]
+        if period is not None:
+            clause, extra = _period_clause(period)
+            where, params = f"{where} AND {clause}", params + extra
+        return self._select(where, params)
+
+    def monthly_summary(
+        self,
+        dataset: str,
+        cycle_grouper: CycleGrouper,
+        policy: BudgetPolicy = DEFAULT_POLICY,
+    ) -> List[MonthlySummary]:
+        counted, excluded_params = _counted_expense(policy)
+        rows = self._conn.execute(
+            f"""
+            SELECT date_op,
+                   SUM(CASE WHEN category = ? THEN amount ELSE 0 END),
+                   COUNT(CASE WHEN category = ? THEN 1 END),
+                   SUM(CASE WHEN {counted} THEN amount ELSE 0 END),
+                   COUNT(CASE WHEN {counted} THEN 1 END)
+            FROM transactions
+            WHERE dataset = ?
+            GROUP BY date_op
+            ORDER BY date_op
+            """,
+            [policy.salary_category, policy.salary_category,
+             *excluded_params, *excluded_params, dataset],
+        ).fetchall()
+
+        dates = [date.fromisoformat(r[0]) for r in rows]
+        if hasattr(cycle_grouper, "labels_for_dates"):
+            labels = cycle_grouper.labels_for_dates(dates)
+        else:
+            labels = [cycle_grouper.label_for_date(d) for d in dates]
+
+        salaries: dict[str, float] = defaultdict(float)
+        expenses: dict[str, float] = defaultdict(float)
+        ops_count: dict[str, int] = defaultdict(int)
+        for label, (_, salary, n_salary, expense, n_expense) in zip(labels, rows):
+            if n_salary:
+                salaries[label] += salary
+            if n_expense:
+                expenses[label] += expense  # negative sum
+                ops_count[label] += n_expense
+
+        return build_summary(sorted(set(salaries) | set(expenses)),
+                              salaries, expenses, ops_count, policy)
+
+    def category_breakdown(
+        self,
+        dataset: str,
+        period: Optional[str] = None,
+        policy: BudgetPolicy = DEFAULT_POLICY,
+    ) -> List[CategoryBreakdown]:
+        counted, params = _counted_expense(policy)
+        where, params = f"dataset = ? AND category IS NOT NULL AND {counted}", [dataset, *params]
+        if period is not None:
+            clause, extra = _period_clause(period)
+            where, params = f"{where} AND {clause}", params + extra
+        rows = self._conn.execute(
+            f"SELECT category, SUM(-amount), COUNT(*) FROM transactions WHERE {where} "
+            "GROUP BY category ORDER BY category",
+            params,
+        ).fetchall()
+        return [CategoryBreakdown(label=category, total=round(total, 2), nb_operations=count)
+                for category, total, count in rows]
+
+    def filter_transactions(
+        self,
+        dataset: str,
+        period: str,
+        label: str,
+        kind: BreakdownKind,
+    ) -> List[Transaction]:
+        clause, params = _period_clause(period)
+        where, params = f"dataset = ? AND {clause}", [dataset, *params]
+        if kind == BreakdownKind.SUPPLIER:
+            where += " AND match_supplier(supplier)"
+        else:
+            where += " AND casefold(category) = ?"
+            params.append(label.casefold())
+        return self._select(where, params)
+
+    def _select(self, where: str, params: list) -> List[Transaction]:
+        cur = self._conn.execute(f"SELECT {_COLUMNS} FROM transactions WHERE {where} ORDER BY id", params)
+        return [
+            Transaction(date_op=date.fromisoformat(d), month=month, category=category,
+                        category_parent=parent, amount=amount, message=message,
+                        supplier=supplier, account=account)
+            for d, month, category, parent, amount, message, supplier, account in cur
+        ]
+
+
+def _casefold(s: Optional[str]) -> Optional[str]:
+    return s.casefold() if s is not None else None
+
+
+def _rows(transactions: Iterable[Transaction]) -> Iterator[tuple]:
+    if isinstance(transactions, TransactionTable):
+        # Columnar source: read codes and dictionaries, no Transaction objects
+        t = transactions
+        months, categories = t.month_dict.values, t.category_dict.values
+        parents, suppliers = t.category_parent_dict.values, t.supplier_dict.values
+        accounts = t.account_dict.values
+        for o, m, c, p, amount, message, s, a in zip(t.date_ordinals, t.month_codes, t.category_codes,
+                                                     t.category_parent_codes, t.amounts, t.messages,
+                                                     t.supplier_codes, t.account_codes):
+            yield (date.fromordinal(o).isoformat(), months[m], categories[c], parents[p],
+                   amount, message, suppliers[s], accounts[a])
+        return
+    for tx in transactions:
+        yield (tx.date_op.isoformat(), tx.month, tx.category, tx.category_parent,
+               float(tx.amount), tx.message, getattr(tx, "supplier", ""), getattr(tx, "account", ""))
+
+
+def _period_clause(period: str) -> Tuple[str, list]:
+    """SQL condition for a period label, as in period_splicer.filter_transactions_by_period."""
+    period = period.strip()
+    if " to " in period:
+        start_str, end_str = period.split(" to ", 1)
+        return "date_op BETWEEN ? AND ?", [_parse_iso_date(start_str).isoformat(),
+                                           _parse_iso_date(end_str).isoformat()]
+    return "month = ?", [period]
+
+
+def _counted_expense(policy: BudgetPolicy) -> Tuple[str, list]:
+    """SQL condition for 'expense not in an excluded parent' (NULL parents are counted)."""
+    excluded = sorted(policy.exclude_parents)
+    placeholders = ", ".join("?" * len(excluded))
+    return f"(amount < 0 AND (category_parent IS NULL OR category_parent NOT IN ({placeholders})))", excluded
@@ -1,13 +1,17 @@
 
 from typing import Sequence, Any, List
 from dataclasses import asdict, is_dataclass
-from ..domain.reporting.policies import DEFAULT_POLICY
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
 from ..ports.presenter import PresenterPort
 from ..domain.value_objects import (
-  MonthlySummary, CategoryBreakdown, AggregateMetrics, FilteredSummary
+  MonthlySummary, CategoryBreakdown, AggregateMetrics, FilteredSummary, MultiAccountReports,
+  RollingSummary
 )
 
 class StdoutPresenter(PresenterPort):
+    def __init__(self, policy: BudgetPolicy = DEFAULT_POLICY) -> None:
+        self.policy = policy
+
     def present_monthly_summary(self, rows: Sequence[MonthlySummary]) -> None:
         print("\n=== Monthly Summary ===")
         if not rows:
@@ -35,6 +39,9 @@ class StdoutPresenter(PresenterPort):
     def present_filtered_summary(self, result: FilteredSummary) -> None:
         excluded_months = result.excluded_months or []
         print("\nExcluded months:", ", ".join(excluded_months) if excluded_months else "None")
+        for month in excluded_months:
+            if result.reasons.get(month):
+                print(f"  {month}: {'; '.join(result.reasons[month])}")
         print("\n=== Filtered Summary (normal months) ===")
         rows = result.filtered
         if not rows:
@@ -64,7 +71,7 @@ class StdoutPresenter(PresenterPort):
         print(f"Average savings: {aggregates.mean_savings:.2f} €")
         print(
             f"Average savings vs theoretical salary "
-            f"({DEFAULT_POLICY.REF_THEORETICAL_SALARY:.0f} €): "
+            f"({self.policy.ref_theoretical_salary:.0f} €): "
             f"{aggregates.mean_savings_vs_theoretical:.2f} €"
         )
 
@@ -87,6 +94,52 @@ class StdoutPresenter(PresenterPort):
             },
         )
 
+    def present_multi_account(self, reports: MultiAccountReports) -> None:
+        for account, account_reports in reports.accounts.items():
+            print(f"\n##### Account {account or '(unknown)'} #####")
+            self.present_monthly_summary(account_reports.monthly_summary)
+            self._present_breakdown_rows(account_reports.category_breakdown)
+        print(f"\n##### Consolidated ({len(reports.accounts)} accounts, "
+              f"{reports.cancelled_transfers} internal transfers cancelled) #####")
+        self.present_monthly_summary(reports.consolidated.monthly_summary)
+        self._present_breakdown_rows(reports.consolidated.category_breakdown)
+
+    def present_rolling_stats(self, rows: Sequence[RollingSummary]) -> None:
+        print("\n=== Rolling Statistics ===")
+        if not rows:
+            print("(no data)")
+            return
+        flat = []
+        for r in rows:
+            d = {"month": r.month, "periods": r.periods}
+            for metric in ("savings", "expenses"):
+                stats = getattr(r, metric)
+                d[f"{metric}_mean"], d[f"{metric}_median"] = stats.mean, stats.median
+                d[f"{metric}_std"] = stats.std
+                d[f"{metric}_range"] = f"{stats.min:.2f} .. {stats.max:.2f}"
+            flat.append(d)
+        money = [f"{m}_{s}" for m in ("savings", "expenses") for s in ("mean", "median", "std")]
+        self._print_table(
+            flat,
+            columns=[("month", "Month"), ("periods", "# Periods"),
+                     ("savings_mean", "Savings Mean"), ("savings_median", "Median"),
+                     ("savings_std", "Std"), ("savings_range", "Min .. Max"),
+                     ("expenses_mean", "Expenses Mean"), ("expenses_median", "Median"),
+                     ("expenses_std", "Std"), ("expenses_range", "Min .. Max")],
+            formats={name: self._fmt_money for name in money},
+        )
+
+    def _present_breakdown_rows(self, rows: Sequence[CategoryBreakdown]) -> None:
+        print("\n=== Category Breakdown ===")
+        if not rows:
+            print("(no data)")
+            return
+        self._print_table(
+            rows,
+            columns=[("label", "Category"), ("total", "Total"), ("nb_operations", "# Ops")],
+            formats={"total": self._fmt_money, "nb_operations": lambda v: f"{int(v)}"},
+        )
+
     # === Internal helpers ===
 
     @staticmethod
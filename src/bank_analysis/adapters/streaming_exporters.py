@@ -0,0 +1,119 @@
+import csv
+import json
+from datetime import date
+from typing import Dict, Iterable, Iterator, Sequence, Type
+
+from bank_analysis.adapters.binary_file_loader import BINARY_EXTENSION, write_binary_file
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.ports.exporter import TRANSACTION_FIELDS, ExporterPort
+
+
+# CSV transaction exports use the bank export headers, so CsvFileDataLoader and
+# CsvContentDataLoader read them back (amounts keep dot decimals, which they accept)
+CSV_TRANSACTION_HEADERS = ("dateOp", "month", "category", "categoryParent", "amount",
+                           "label", "supplierFound", "accountNum")
+
+
+def _transaction_rows(transactions: Iterable[Transaction]) -> Iterator[tuple]:
+    """Rows in TRANSACTION_FIELDS order, dates in ISO format."""
+    if isinstance(transactions, TransactionTable):
+        return _table_rows(transactions)
+    return ((tx.date_op.isoformat(), tx.month, tx.category, tx.category_parent, float(tx.amount),
+             tx.message, getattr(tx, "supplier", ""), getattr(tx, "account", ""))
+            for tx in transactions)
+
+
+def _table_rows(table: TransactionTable) -> Iterator[tuple]:
+    """Columnar source: rows straight from codes and dictionaries, no Transaction objects."""
+    months, categories = table.month_dict.values, table.category_dict.values
+    parents, suppliers = table.category_parent_dict.values, table.supplier_dict.values
+    accounts = table.account_dict.values
+    iso_dates: Dict[int, str] = {}
+    for o, m, c, p, amount, message, s, a in zip(
+            table.date_ordinals, table.month_codes, table.category_codes, table.category_parent_codes,
+            table.amounts, table.messages, table.supplier_codes, table.account_codes):
+        d = iso_dates.get(o)
+        if d is None:
+            d = iso_dates[o] = date.fromordinal(o).isoformat()
+        yield d, months[m], categories[c], parents[p], amount, message, suppliers[s], accounts[a]
+
+
+class CsvExporter(ExporterPort):
+    """
+    ';'-separated CSV with a header row (the bank exports' delimiter), UTF-8.
+    Transactions are written under the bank export headers (CSV_TRANSACTION_HEADERS),
+    so an exported file can be analysed again; a None category reads back as ''.
+    """
+
+    def __init__(self, delimiter: str = ";"):
+        self.delimiter = delimiter
+
+    def write_records(self, path: str, fields: Sequence[str], rows: Iterable[Sequence]) -> int:
+        n = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, delimiter=self.delimiter)
+            writer.writerow(fields)
+            for row in rows:
+                writer.writerow(row)
+                n += 1
+        return n
+
+    def write_transactions(self, path: str, transactions: Iterable[Transaction]) -> int:
+        return self.write_records(path, CSV_TRANSACTION_HEADERS, _transaction_rows(transactions))
+
+
+class JsonLinesExporter(ExporterPort):
+    """JSON Lines: one object per row, keys in 'fields' order, serialized into the file."""
+
+    def write_records(self, path: str, fields: Sequence[str], rows: Iterable[Sequence]) -> int:
+        n = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                json.dump(dict(zip(fields, row)), f, ensure_ascii=False)
+                f.write("\n")
+                n += 1
+        return n
+
+    def write_transactions(self, path: str, transactions: Iterable[Transaction]) -> int:
+        return self.write_records(path, TRANSACTION_FIELDS, _transaction_rows(transactions))
+
+
+class BinaryExporter(ExporterPort):
+    """
+    Columnar export in the BATX format (see binary_table_codec), written one row
+    group at a time. The format stores transactions only: exporter_for_path(records=True)
+    refuses it for summaries and breakdowns.
+    """
+    stores_records = False
+
+    def __init__(self, row_group_size: int = 64 * 1024):
+        self.row_group_size = row_group_size
+
+    def write_records(self, path: str, fields: Sequence[str], rows: Iterable[Sequence]) -> int:
+        raise ValueError(f"The {BINARY_EXTENSION} format only stores transactions.")
+
+    def write_transactions(self, path: str, transactions: Iterable[Transaction]) -> int:
+        return write_binary_file(path, transactions, self.row_group_size)
+
+
+EXPORTERS: Dict[str, Type[ExporterPort]] = {
+    ".csv": CsvExporter,
+    ".jsonl": JsonLinesExporter,
+    BINARY_EXTENSION: BinaryExporter,
+}
+
+
+def exporter_for_path(path: str, records: bool = False) -> ExporterPort:
+    """
+    Exporter chosen by the output file extension. With records=True (summary or
+    breakdown exports), formats that only store transactions are rejected here,
+    before anything is computed or written.
+    """
+    choices = {ext: exporter for ext, exporter in EXPORTERS.items()
+               if not records or exporter.stores_records}
+    for extension, exporter in choices.items():
+        if path.lower().endswith(extension):
+            return exporter()
+    what = "record" if records else "export"
+    raise ValueError(f"Unsupported {what} format for '{path}'. Expected one of: {', '.join(choices)}.")
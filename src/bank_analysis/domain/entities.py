@@ -10,3 +10,4 @@ class Transaction:
     amount: float              # negative => expense; positive => income
     message: str
     supplier: str =""
+    account: str = ""          # bank account number ('accountNum'), "" if unknown
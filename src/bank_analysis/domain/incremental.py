@@ -0,0 +1,162 @@
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import fused
+from bank_analysis.domain.reporting.category_rules import CategoryRules, DEFAULT_CATEGORY_RULES
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.value_objects import AppendResult, CategoryBreakdown, MonthlySummary
+from bank_analysis.ports.cycle_grouper import CycleGrouper
+
+
+def dedup_key(tx: Transaction) -> Hashable:
+    """Identity of a bank operation across overlapping statements."""
+    return tx.date_op, float(tx.amount), tx.message, getattr(tx, "account", "")
+
+
+class _SinglePeriod:
+    """Grouper labelling every date with one period (rows are pre-grouped)."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+
+    def label_for_date(self, d: date) -> str:
+        return self.label
+
+
+class IncrementalAnalysis:
+    """
+    A dataset that grows statement by statement, with per-period results
+    (monthly summary row, standard and enhanced breakdowns) kept up to date.
+
+    append() deduplicates the new rows by (date, amount, label, account), counting
+    occurrences so that identical operations within one statement are kept, while
+    re-importing an overlapping statement adds nothing. It then extends the cycle
+    grouper (CycleGrouper.extended_with), relabels each distinct date once, and
+    recomputes only the periods that gained rows or whose bounds moved, e.g. the
+    last salary period when a new 'Salaire fixe' splits it.
+
+    Each period is recomputed over its rows in dataset order, so results are
+    identical to a full fused.compute_fused_reports run over the whole dataset.
+    """
+
+    def __init__(
+        self,
+        cycle_grouper: CycleGrouper,
+        transactions: Iterable[Transaction] = (),
+        policy: BudgetPolicy = DEFAULT_POLICY,
+        rules: CategoryRules = DEFAULT_CATEGORY_RULES,
+    ) -> None:
+        self.cycle_grouper = cycle_grouper
+        self.policy = policy
+        self.rules = rules
+        self.table = TransactionTable()
+        self._key_counts: Counter = Counter()
+        self._rows_by_ordinal: Dict[int, List[int]] = defaultdict(list)
+        self._label_of_ordinal: Dict[int, str] = {}
+        self._summary: Dict[str, MonthlySummary] = {}
+        self._breakdowns: Dict[Tuple[str, str], List[CategoryBreakdown]] = {}
+        self._periods: set = set()
+        self.append(transactions)
+
+    # ----- Results -----
+
+    @property
+    def monthly_summary(self) -> List[MonthlySummary]:
+        return [self._summary[label] for label in sorted(self._summary)]
+
+    @property
+    def period_breakdowns(self) -> Dict[Tuple[str, str], List[CategoryBreakdown]]:
+        """(breakdown style, period) -> rows, as PrecomputePeriodBreakdownsUseCase returns."""
+        return dict(self._breakdowns)
+
+    @property
+    def periods(self) -> List[str]:
+        return sorted(self._periods)
+
+    # ----- Updates -----
+
+    def append(self, transactions: Iterable[Transaction]) -> AppendResult:
+        accepted: List[Transaction] = []
+        seen: Counter = Counter()
+        for tx in transactions:
+            key = dedup_key(tx)
+            seen[key] += 1
+            if seen[key] > self._key_counts[key]:
+                accepted.append(tx)
+        for key, count in seen.items():
+            if count > self._key_counts[key]:
+                self._key_counts[key] = count
+        duplicates = sum(seen.values()) - len(accepted)
+        if not accepted:
+            return AppendResult(added=0, duplicates=duplicates, recomputed_periods=[], removed_periods=[])
+
+        start = len(self.table)
+        self.table.extend(accepted)
+        touched = set()
+        for i in range(start, len(self.table)):
+            ordinal = self.table.date_ordinals[i]
+            self._rows_by_ordinal[ordinal].append(i)
+            touched.add(ordinal)
+
+        self.cycle_grouper = self.cycle_grouper.extended_with(accepted)
+        affected = self._relabel(touched)
+        removed = self._recompute(affected)
+        return AppendResult(
+            added=len(accepted),
+            duplicates=duplicates,
+            recomputed_periods=sorted(affected - removed),
+            removed_periods=sorted(removed),
+        )
+
+    def _relabel(self, touched: set) -> set:
+        """Label every distinct date with the current grouper; return the affected periods."""
+        ordinals = sorted(self._rows_by_ordinal)
+        dates = [date.fromordinal(o) for o in ordinals]
+        if hasattr(self.cycle_grouper, "labels_for_dates"):
+            labels = self.cycle_grouper.labels_for_dates(dates)
+        else:
+            labels = [self.cycle_grouper.label_for_date(d) for d in dates]
+
+        affected = set()
+        for ordinal, label in zip(ordinals, labels):
+            old = self._label_of_ordinal.get(ordinal)
+            if old != label:
+                if old is not None:
+                    affected.add(old)
+                affected.add(label)
+                self._label_of_ordinal[ordinal] = label
+            elif ordinal in touched:
+                affected.add(label)
+        return affected
+
+    def _recompute(self, affected: set) -> set:
+        """Rebuild the results of the affected periods; return those left without rows."""
+        rows_by_label: Dict[str, List[int]] = defaultdict(list)
+        for ordinal, label in self._label_of_ordinal.items():
+            if label in affected:
+                rows_by_label[label].extend(self._rows_by_ordinal[ordinal])
+
+        removed = set()
+        for label in affected:
+            rows = rows_by_label.get(label)
+            self._summary.pop(label, None)
+            self._breakdowns.pop(("standard", label), None)
+            self._breakdowns.pop(("enhanced", label), None)
+            if not rows:
+                self._periods.discard(label)
+                removed.add(label)
+                continue
+
+            # Dataset order, as a full run would see them
+            rows.sort()
+            reports = fused.compute_fused_reports(
+                self.table.take(rows), _SinglePeriod(label), self.policy, self.rules)
+            self._periods.add(label)
+            if reports.monthly_summary:
+                self._summary[label] = reports.monthly_summary[0]
+            self._breakdowns[("standard", label)] = reports.period_breakdowns[label]
+            self._breakdowns[("enhanced", label)] = reports.period_enhanced_breakdowns[label]
+        return removed
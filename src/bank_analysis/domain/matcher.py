@@ -1,7 +1,13 @@
-from typing import Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from bank_analysis.domain.reporting.category_rules import SupplierPattern
 
+# Inline-able regex flags ((?imsx:...) scoped groups)
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
 
 def _case_insensitive_equal(a: Optional[str], b: Optional[str]) -> bool:
     """
@@ -30,8 +36,74 @@ def _match_supplier(supplier_found: Optional[str], patterns: Tuple[SupplierPatte
     """
     if not supplier_found:
         return None
-    s = supplier_found.strip().casefold()
+    try:
+        matcher = supplier_matcher(patterns)
+    except TypeError:  # unhashable pattern collection: no compiled matcher
+        return _first_match(supplier_found.strip().casefold(), patterns)
+    return matcher.match(supplier_found)
+
+
+def _first_match(s: str, patterns: Tuple[SupplierPattern, ...]) -> Optional[str]:
     for sp in patterns:
         if sp.regex.search(s):
             return sp.name
-    return None
\ No newline at end of file
+    return None
+
+
+class SupplierMatcher:
+    """
+    Compiled form of a supplier pattern list, same results as trying each pattern
+    in turn:
+      - all patterns are combined into one alternation of named groups, so a
+        supplier matching none of them (the common case) costs a single scan;
+      - a hit on pattern k only needs patterns 0..k-1 re-checked, since the first
+        pattern in rule order wins even if a later one matches further left;
+      - results are memoized per distinct supplier string (merchants repeat).
+    Pattern lists using backreferences, which cannot be combined, are tried in turn.
+    """
+
+    def __init__(self, patterns: Tuple[SupplierPattern, ...], memo_size: int = 65536) -> None:
+        self.patterns = tuple(patterns)
+        self._memo: Dict[str, Optional[str]] = {}
+        self._memo_size = memo_size
+        self._combined = None
+        if self.patterns and not any(_BACKREFERENCE.search(sp.regex.pattern) for sp in self.patterns):
+            try:
+                self._combined = re.compile("|".join(
+                    f"(?P<_{i}>{_scoped(sp.regex)})" for i, sp in enumerate(self.patterns)))
+            except re.error:
+                self._combined = None
+
+    def match(self, supplier_found: Optional[str]) -> Optional[str]:
+        if not supplier_found:
+            return None
+        name = self._memo.get(supplier_found, _MISSING)
+        if name is _MISSING:
+            if len(self._memo) >= self._memo_size:
+                self._memo.clear()
+            name = self._memo[supplier_found] = self._resolve(supplier_found.strip().casefold())
+        return name
+
+    def _resolve(self, s: str) -> Optional[str]:
+        if self._combined is None:
+            return _first_match(s, self.patterns)
+        m = self._combined.search(s)
+        if m is None:
+            return None
+        k = int(m.lastgroup[1:])
+        return _first_match(s, self.patterns[:k]) or self.patterns[k].name
+
+
+_MISSING = object()
+
+
+def _scoped(regex: re.Pattern) -> str:
+    """The pattern wrapped in a scoped-flags group carrying its own flags."""
+    letters = "".join(letter for flag, letter in _INLINE_FLAGS if regex.flags & flag)
+    return f"(?{letters}:{regex.pattern})" if letters else f"(?:{regex.pattern})"
+
+
+@lru_cache(maxsize=32)
+def supplier_matcher(patterns: Tuple[SupplierPattern, ...]) -> SupplierMatcher:
+    """Shared SupplierMatcher for a pattern tuple (rules are frozen, so built once)."""
+    return SupplierMatcher(patterns)
\ No newline at end of file
@@ -2,6 +2,7 @@
 from datetime import date, datetime
 from typing import Sequence
 from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
 
 def _parse_iso_date(s: str) -> date:
     """Parse an ISO date 'YYYY-MM-DD' to datetime.date (no pandas)."""
@@ -12,16 +13,20 @@ def _parse_iso_date(s: str) -> date:
 def filter_transactions_by_period(
     txns: Sequence[Transaction],
     period: str,
-) -> list[Transaction]:
+) -> Sequence[Transaction]:
     """
     Period formats supported:
     - Salary cycle label: 'YYYY-MM-DD to YYYY-MM-DD'  (inclusive bounds)
     - Calendar month: 'YYYY-MM'
 
     Returns the transactions whose date/month falls within the period.
+    A TransactionTable input yields a TransactionTable (filtered on its columns).
     """
     period = period.strip()
 
+    if isinstance(txns, TransactionTable):
+        return _filter_table_by_period(txns, period)
+
     # Salary cycle style: 'YYYY-MM-DD to YYYY-MM-DD'
     if " to " in period:
         start_str, end_str = period.split(" to ", 1)
@@ -36,3 +41,16 @@ def filter_transactions_by_period(
     # Calendar month style: 'YYYY-MM'
     # We rely on your Transaction.month field (already 'YYYY-MM')
     return [t for t in txns if t.month == period]
+
+def _filter_table_by_period(table: TransactionTable, period: str) -> TransactionTable:
+    """Columnar variant: compares date ordinals or month codes instead of building rows."""
+    if " to " in period:
+        start_str, end_str = period.split(" to ", 1)
+        start = _parse_iso_date(start_str).toordinal()
+        end = _parse_iso_date(end_str).toordinal()
+        return table.take(i for i, o in enumerate(table.date_ordinals) if start <= o <= end)
+
+    month_code = table.month_dict.lookup(period)
+    if month_code is None:
+        return table.take(())
+    return table.take(i for i, m in enumerate(table.month_codes) if m == month_code)
@@ -1,8 +1,9 @@
 from collections import defaultdict
-from typing import Sequence, List
+from typing import Sequence, List, Mapping
 
 from bank_analysis.domain.entities import Transaction
 from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.transaction_table import TransactionTable
 from bank_analysis.domain.value_objects import CategoryBreakdown
 
 
@@ -21,6 +22,9 @@ def compute_category_breakdown(
   Returns:
       List[CategoryBreakdown]: sorted by category.
   """
+  if isinstance(transactions, TransactionTable):
+    return _compute_category_breakdown_columnar(transactions, policy)
+
   totals = defaultdict(float)
   counts = defaultdict(int)
 
@@ -36,8 +40,15 @@ def compute_category_breakdown(
       totals[category] += -tx.amount
       counts[category] += 1
 
-  # Build rows sorted by category_parent, and round totals to 2 decimals
-  rows = [
+  return build_rows(totals, counts)
+
+
+def build_rows(
+    totals: Mapping[str, float],
+    counts: Mapping[str, int],
+) -> List[CategoryBreakdown]:
+  """Build rows sorted by category, rounding totals to 2 decimals."""
+  return [
     CategoryBreakdown(
         label=category,
         total=round(totals[category], 2),
@@ -46,4 +57,35 @@ def compute_category_breakdown(
     for category in sorted(totals.keys())
   ]
 
-  return rows
+
+def _compute_category_breakdown_columnar(
+    table: TransactionTable,
+    policy: BudgetPolicy,
+) -> List[CategoryBreakdown]:
+  """
+  Same semantics as compute_category_breakdown, grouped by dictionary code:
+  the exclusion test is evaluated once per distinct category_parent, and the
+  per-row loop only touches integer codes and floats.
+  """
+  excluded = [cp in policy.exclude_parents for cp in table.category_parent_dict.values]
+  missing_code = table.category_dict.lookup(None)
+  n_codes = len(table.category_dict)
+  totals = [0.0] * n_codes
+  counts = [0] * n_codes
+
+  for code, parent_code, amount in zip(table.category_codes,
+                                       table.category_parent_codes,
+                                       table.amounts):
+    if amount < 0 and not excluded[parent_code] and code != missing_code:
+      totals[code] += -amount
+      counts[code] += 1
+
+  values = table.category_dict.values
+  return [
+    CategoryBreakdown(
+        label=values[code],
+        total=round(totals[code], 2),
+        nb_operations=counts[code],
+    )
+    for code in sorted((c for c in range(n_codes) if counts[c]), key=values.__getitem__)
+  ]
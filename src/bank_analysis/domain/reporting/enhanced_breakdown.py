@@ -1,5 +1,6 @@
 from collections import defaultdict
-from typing import Sequence, List, Dict
+from functools import lru_cache
+from typing import Sequence, List, Dict, Optional, Tuple
 
 from bank_analysis.domain.entities import Transaction
 from bank_analysis.domain.matcher import _case_insensitive_equal, _contains_any, \
@@ -9,8 +10,108 @@ from bank_analysis.domain.reporting.category_rules import (
     CategoryRules,
     DEFAULT_CATEGORY_RULES
 )
+from bank_analysis.domain.transaction_table import TransactionTable
 from bank_analysis.domain.value_objects import CategoryBreakdown, BreakdownKind
 
+REIMBURSE_LABEL = "Remboursements"
+
+# (is_salary_category, expense slot) where the slot is (kind, label) or None (internal)
+Classification = Tuple[bool, Optional[Tuple[str, str]]]
+
+_MEMO_SIZE = 65536
+
+
+class TransactionClassifier:
+    """
+    Enhanced-breakdown classification rules, prepared once for a (policy, rules) pair.
+
+    classify() resolves the row-independent part from (category, category_parent, supplier):
+      - is_salary_category: exact (case-insensitive) match on rules.salary_category;
+        the row is SALARY only if its amount is positive
+      - expense slot, by precedence: None for INTERNAL transfers, then
+        MANDATORY -> REIMBURSEMENTS -> SUPPLIER -> OTHER, as (kind, label)
+    slot_for() adds the amount and returns (kind, label, signed amount) or None.
+
+    classification() memoizes classify() per distinct triple: rows repeat a small
+    set of (category, category_parent, supplier) values. classifier_for() shares one
+    classifier, hence one memo, per (policy, rules) pair across calls.
+    """
+
+    def __init__(self, policy: BudgetPolicy = DEFAULT_POLICY,
+                 rules: CategoryRules = DEFAULT_CATEGORY_RULES) -> None:
+        self.policy = policy
+        self.rules = rules
+        self.salary_label = rules.salary_category
+        # Prepare canonicalization map for mandatory categories (lower -> canonical)
+        self._mandatory_map = {m.casefold(): m for m in rules.mandatory_categories}
+        self._reimbursement_needles = tuple(k.casefold() for k in rules.reimbursement_keywords)
+        self._memo: Dict[Tuple[Optional[str], Optional[str], Optional[str]], Classification] = {}
+
+    def classification(self, category: Optional[str], category_parent: Optional[str],
+                       supplier: Optional[str]) -> Classification:
+        key = (category, category_parent, supplier)
+        classification = self._memo.get(key)
+        if classification is None:
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            classification = self._memo[key] = self.classify(category, category_parent, supplier)
+        return classification
+
+    def classify(self, category: Optional[str], category_parent: Optional[str],
+                 supplier: Optional[str]) -> Classification:
+        is_salary_category = _case_insensitive_equal(category, self.salary_label)
+
+        # Exclude internal transfers
+        if (category_parent in self.policy.exclude_parents) if category_parent else False:
+            return is_salary_category, None
+
+        # MANDATORY (canonical label)
+        label = self._mandatory_map.get((category or "").casefold())
+        if label is not None:
+            return is_salary_category, ("MANDATORY", label)
+
+        # REIMBURSEMENTS (merged)
+        if _contains_any(category, self._reimbursement_needles):
+            return is_salary_category, ("REIMBURSEMENTS", REIMBURSE_LABEL)
+
+        # SUPPLIER (excluded from OTHER)
+        supplier_name = _match_supplier(supplier, self.rules.supplier_patterns)
+        if supplier_name is not None:
+            return is_salary_category, ("SUPPLIER", supplier_name)
+
+        # OTHER (remaining expenses)
+        return is_salary_category, ("OTHER", (category or "Autres").strip())
+
+    def slot_for(self, category: Optional[str], category_parent: Optional[str],
+                 supplier: Optional[str], amount: float) -> Optional[Tuple[str, str, float]]:
+        return self.resolve(self.classification(category, category_parent, supplier), amount)
+
+    def resolve(self, classification: Classification,
+                amount: float) -> Optional[Tuple[str, str, float]]:
+        """Combine a classification with the row amount into (kind, label, signed amount)."""
+        is_salary_category, expense_slot = classification
+        # SALARY (positive amounts only), excluded from expense sections
+        if is_salary_category and amount > 0:
+            return "SALARY", self.salary_label, float(amount)
+        if expense_slot is None:
+            return None
+        # Expense totals use absolute values of negative amounts
+        return expense_slot[0], expense_slot[1], -float(amount)
+
+
+@lru_cache(maxsize=16)
+def _shared_classifier(policy: BudgetPolicy, rules: CategoryRules) -> TransactionClassifier:
+    return TransactionClassifier(policy, rules)
+
+
+def classifier_for(policy: BudgetPolicy = DEFAULT_POLICY,
+                   rules: CategoryRules = DEFAULT_CATEGORY_RULES) -> TransactionClassifier:
+    """Shared classifier for (policy, rules); a private one if they are not hashable."""
+    try:
+        return _shared_classifier(policy, rules)
+    except TypeError:
+        return TransactionClassifier(policy, rules)
+
 
 def compute_category_breakdown(
     transactions: Sequence[Transaction],
@@ -39,63 +140,138 @@ def compute_category_breakdown(
       - Non-salary credits (amount >= 0) are ignored for expense sections.
       - Expense totals use absolute values of negative amounts.
     """
-    # Prepare canonicalization map for mandatory categories (lower -> canonical)
-    mandatory_map = {m.casefold(): m for m in rules.mandatory_categories}
-    reimbursement_needles = tuple(k.casefold() for k in rules.reimbursement_keywords)
-    salary_label = rules.salary_category
-    REIMBURSE_LABEL = "Remboursements"
+    classifier = classifier_for(policy, rules)
+
+    if isinstance(transactions, TransactionTable):
+        return _compute_category_breakdown_columnar(transactions, classifier)
 
     # Accumulators: kind -> label -> total / count
     acc_total: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
     acc_count: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
 
     for tx in transactions:
-        # Classification flags
-        is_internal = (tx.category_parent in policy.exclude_parents) if tx.category_parent else False
-        is_salary = _case_insensitive_equal(tx.category, salary_label) and (tx.amount > 0)
-
-        cat_lower = (tx.category or "").casefold()
-        is_mandatory = cat_lower in mandatory_map
-        is_reimbursement = _contains_any(tx.category, reimbursement_needles)
-        supplier_name = _match_supplier(getattr(tx, "supplier", None), rules.supplier_patterns)
-
-        # SALARY (positive amounts only)
-        if is_salary:
-            acc_total["SALARY"][salary_label] += float(tx.amount)
-            acc_count["SALARY"][salary_label] += 1
-            continue  # excluded from expense sections
+        slot = classifier.slot_for(tx.category, tx.category_parent,
+                                   getattr(tx, "supplier", None), tx.amount)
+        if slot is None:
+            continue  # internal transfer
+        kind, label, signed_amount = slot
+        acc_total[kind][label] += signed_amount
+        acc_count[kind][label] += 1
 
-        amount_abs = -float(tx.amount)
+    return build_rows(acc_total, acc_count)
 
-        # Exclude internal transfers
-        if is_internal:
+
+def discard_dictionary_flags(table: TransactionTable, policy: BudgetPolicy, rules: CategoryRules) -> None:
+    """Drop the predicates stored on table for (policy, rules), e.g. after a rules change."""
+    for key in list(table.derived):
+        if (isinstance(key, tuple) and key[0] == "enhanced_breakdown"
+                and key[1].policy == policy and key[1].rules == rules):
+            table.derived.pop(key, None)
+
+
+def dictionary_flags(table: TransactionTable, classifier: TransactionClassifier) -> tuple:
+    """
+    Classification predicates evaluated once per distinct dictionary value, stored
+    on the table (table.derived, shared with its take() results) so every later
+    breakdown of the dataset, e.g. one per period, reuses them. Recomputed if the
+    dictionaries have grown since.
+    """
+    sizes = (len(table.category_dict), len(table.category_parent_dict), len(table.supplier_dict))
+    key = ("enhanced_breakdown", classifier)
+    cached = table.derived.get(key)
+    if cached is not None and cached[0] == sizes:
+        return cached[1]
+
+    policy, rules = classifier.policy, classifier.rules
+    mandatory_map = classifier._mandatory_map
+    reimbursement_needles = classifier._reimbursement_needles
+    categories = table.category_dict.values
+    flags = (
+        [_case_insensitive_equal(c, classifier.salary_label) for c in categories],
+        [mandatory_map.get((c or "").casefold()) for c in categories],
+        [_contains_any(c, reimbursement_needles) for c in categories],
+        [(c or "Autres").strip() for c in categories],
+        [(cp in policy.exclude_parents) if cp else False for cp in table.category_parent_dict.values],
+        [_match_supplier(s, rules.supplier_patterns) for s in table.supplier_dict.values],
+    )
+    table.derived[key] = (sizes, flags)
+    return flags
+
+
+def code_classification(flags: tuple, category_code: int, parent_code: int,
+                        supplier_code: int) -> Classification:
+    """TransactionClassifier.classify() for one (category, parent, supplier) code triple of the flags' table."""
+    (is_salary_cat, mandatory_label, is_reimbursement, other_label,
+     is_internal, supplier_name) = flags
+    if is_internal[parent_code]:
+        return is_salary_cat[category_code], None
+    label = mandatory_label[category_code]
+    if label is not None:
+        return is_salary_cat[category_code], ("MANDATORY", label)
+    if is_reimbursement[category_code]:
+        return is_salary_cat[category_code], ("REIMBURSEMENTS", REIMBURSE_LABEL)
+    label = supplier_name[supplier_code]
+    if label is not None:
+        return is_salary_cat[category_code], ("SUPPLIER", label)
+    return is_salary_cat[category_code], ("OTHER", other_label[category_code])
+
+
+def _compute_category_breakdown_columnar(
+    table: TransactionTable,
+    classifier: TransactionClassifier,
+) -> List[CategoryBreakdown]:
+    """
+    Columnar variant: classification predicates are evaluated once per distinct
+    dictionary value (category, category_parent, supplier), then the per-row loop
+    only combines precomputed flags by code.
+    """
+    salary_label = classifier.salary_label
+    (is_salary_cat, mandatory_label, is_reimbursement, other_label,
+     is_internal, supplier_name) = dictionary_flags(table, classifier)
+
+    acc_total: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    acc_count: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    for cat, parent, sup, amount in zip(table.category_codes, table.category_parent_codes,
+                                        table.supplier_codes, table.amounts):
+        if is_salary_cat[cat] and amount > 0:
+            acc_total["SALARY"][salary_label] += amount
+            acc_count["SALARY"][salary_label] += 1
             continue
 
-        # MANDATORY (canonical label)
-        if is_mandatory:
-            label = mandatory_map[cat_lower]
+        if is_internal[parent]:
+            continue
+
+        amount_abs = -amount
+        label = mandatory_label[cat]
+        if label is not None:
             acc_total["MANDATORY"][label] += amount_abs
             acc_count["MANDATORY"][label] += 1
-            continue  # excluded from other sections
+            continue
 
-        # REIMBURSEMENTS (merged)
-        if is_reimbursement:
+        if is_reimbursement[cat]:
             acc_total["REIMBURSEMENTS"][REIMBURSE_LABEL] += amount_abs
             acc_count["REIMBURSEMENTS"][REIMBURSE_LABEL] += 1
-            continue  # excluded from other sections
+            continue
 
-        # SUPPLIER (excluded from OTHER)
-        if supplier_name is not None:
-            acc_total["SUPPLIER"][supplier_name] += amount_abs
-            acc_count["SUPPLIER"][supplier_name] += 1
+        label = supplier_name[sup]
+        if label is not None:
+            acc_total["SUPPLIER"][label] += amount_abs
+            acc_count["SUPPLIER"][label] += 1
             continue
 
-        # OTHER (remaining expenses)
-        label = (tx.category or "Autres").strip()
+        label = other_label[cat]
         acc_total["OTHER"][label] += amount_abs
         acc_count["OTHER"][label] += 1
 
-    # Build flat, ordered rows
+    return build_rows(acc_total, acc_count)
+
+
+def build_rows(
+    acc_total: Dict[str, Dict[str, float]],
+    acc_count: Dict[str, Dict[str, int]],
+) -> List[CategoryBreakdown]:
+    """Build flat rows ordered by kind, then label."""
     rows: List[CategoryBreakdown] = []
     for kind in (
         BreakdownKind.SALARY,
@@ -1,31 +1,36 @@
-from typing import List
+from typing import List, Mapping, Optional, Sequence
 
 from bank_analysis.domain import period_splicer
 from bank_analysis.domain.entities import Transaction
 from bank_analysis.domain.matcher import _match_supplier
+from bank_analysis.domain.reporting import outliers
 from bank_analysis.domain.reporting.category_rules import DEFAULT_CATEGORY_RULES
+from bank_analysis.domain.reporting.outliers import DEFAULT_OUTLIER_POLICY, OutlierPolicy
 from bank_analysis.domain.value_objects import MonthlySummary, FilteredSummary, \
-  BreakdownKind
+  BreakdownKind, CategoryBreakdown
 
 
 def filter_atypical_months(
-    summary: List[MonthlySummary]
+    summary: List[MonthlySummary],
+    policy: OutlierPolicy = DEFAULT_OUTLIER_POLICY,
+    period_breakdowns: Optional[Mapping[str, Sequence[CategoryBreakdown]]] = None,
 ) -> FilteredSummary:
   """
-  Exclude months with negative savings or negative theoretical delta.
+  Exclude the periods flagged by the policy's detectors (by default, months with
+  negative savings or negative theoretical delta).
 
   Args:
       summary: List of MonthlySummaryRow DTOs.
+      policy: detectors to run, see outliers.OutlierPolicy.
+      period_breakdowns: period label -> breakdown rows, for the category detector.
 
   Returns:
-      FilteredSummaryResult(filtered=[...], excluded_months=[...])
+      FilteredSummaryResult(filtered=[...], excluded_months=[...], reasons={...})
   """
-  excluded_months = [
-    s.month for s in summary
-    if (s.total_savings < 0) or (s.total_savings_vs_theoretical < 0)
-  ]
-  filtered = [s for s in summary if s.month not in excluded_months]
-  return FilteredSummary(filtered=filtered, excluded_months=excluded_months)
+  reasons = outliers.detect_atypical_periods(summary, period_breakdowns, policy)
+  excluded_months = list(reasons)
+  filtered = [s for s in summary if s.month not in reasons]
+  return FilteredSummary(filtered=filtered, excluded_months=excluded_months, reasons=reasons)
 
 
 def filter_transactions_by_period_label_and_kind(
@@ -0,0 +1,196 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import breakdown, enhanced_breakdown, summary
+from bank_analysis.domain.reporting.category_rules import CategoryRules, DEFAULT_CATEGORY_RULES
+from bank_analysis.domain.reporting.enhanced_breakdown import (
+    TransactionClassifier, classifier_for, code_classification, dictionary_flags,
+)
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.value_objects import FusedReports
+from bank_analysis.ports.cycle_grouper import CycleGrouper
+
+
+def compute_fused_reports(
+    txns: Iterable[Transaction],
+    cycle_grouper: CycleGrouper,
+    policy: BudgetPolicy = DEFAULT_POLICY,
+    rules: CategoryRules = DEFAULT_CATEGORY_RULES,
+) -> FusedReports:
+  """
+  Single scan over the transactions feeding every accumulator at once:
+    - the per-period monthly summary
+    - the global plain category breakdown
+    - the per-period plain breakdown
+    - the per-period enhanced breakdown
+
+  Each accumulator sees the rows in the same order as the dedicated functions
+  (summary.compute_monthly_summary_core, breakdown.compute_category_breakdown,
+  enhanced_breakdown.compute_category_breakdown), so results are identical.
+  Period labels and classifications are memoized per distinct date / per
+  distinct (category, category_parent, supplier); the classifications also in the
+  classifier shared by every analysis with the same policy and rules.
+  A TransactionTable is scanned by code instead (see _compute_fused_reports_columnar).
+  """
+  classifier = classifier_for(policy, rules)
+  if isinstance(txns, TransactionTable):
+    return _compute_fused_reports_columnar(txns, cycle_grouper, policy, classifier)
+
+  label_cache: Dict[date, str] = {}
+  class_cache: dict = {}
+
+  # Summary accumulators
+  salaries: Dict[str, float] = defaultdict(float)
+  expenses: Dict[str, float] = defaultdict(float)
+  ops_count: Dict[str, int] = defaultdict(int)
+
+  # Plain breakdown accumulators (global and per period)
+  totals: Dict[str, float] = defaultdict(float)
+  counts: Dict[str, int] = defaultdict(int)
+  period_totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+  period_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+  # Enhanced breakdown accumulators: period -> kind -> label
+  enh_totals: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(
+      lambda: defaultdict(lambda: defaultdict(float)))
+  enh_counts: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
+      lambda: defaultdict(lambda: defaultdict(int)))
+
+  for t in txns:
+    label = label_cache.get(t.date_op)
+    if label is None:
+      label = label_cache[t.date_op] = cycle_grouper.label_for_date(t.date_op)
+
+    amount = float(t.amount)
+    parent = t.category_parent
+    category = t.category
+    is_expense = amount < 0 and parent not in policy.exclude_parents
+
+    # Monthly summary
+    if category == policy.salary_category:
+      salaries[label] += amount
+    if is_expense:
+      expenses[label] += amount  # negative sum
+      ops_count[label] += 1
+
+    # Plain breakdown
+    if is_expense and category is not None:
+      totals[category] += -amount
+      counts[category] += 1
+      period_totals[label][category] += -amount
+      period_counts[label][category] += 1
+
+    # Enhanced breakdown
+    supplier = getattr(t, "supplier", None)
+    key = (category, parent, supplier)
+    classification = class_cache.get(key)
+    if classification is None:
+      classification = class_cache[key] = classifier.classification(category, parent, supplier)
+    slot = classifier.resolve(classification, amount)
+    if slot is not None:
+      kind, row_label, signed_amount = slot
+      enh_totals[label][kind][row_label] += signed_amount
+      enh_counts[label][kind][row_label] += 1
+
+  periods = sorted(set(label_cache.values()))
+  return _build_reports(periods, salaries, expenses, ops_count, totals, counts,
+                        period_totals, period_counts, enh_totals, enh_counts, policy)
+
+
+def _compute_fused_reports_columnar(
+    table: TransactionTable,
+    cycle_grouper: CycleGrouper,
+    policy: BudgetPolicy,
+    classifier: TransactionClassifier,
+) -> FusedReports:
+  """
+  Same single scan over a TransactionTable, without materializing rows:
+    1. label each distinct date once (batched when the grouper supports it)
+    2. evaluate the summary predicates once per dictionary code, and reuse the
+       enhanced-breakdown flags stored on the table (dictionary_flags)
+    3. walk the code columns, classifying each distinct (category, parent, supplier)
+       code triple once
+
+  Rows are accumulated in table order, so results match the row-wise scan.
+  """
+  ordinals = table.date_ordinals
+  distinct = sorted(set(ordinals))
+  distinct_dates = [date.fromordinal(o) for o in distinct]
+  if hasattr(cycle_grouper, "labels_for_dates"):
+    labels = cycle_grouper.labels_for_dates(distinct_dates)
+  else:
+    labels = [cycle_grouper.label_for_date(d) for d in distinct_dates]
+  label_of = dict(zip(distinct, labels))
+
+  salary_code = table.category_dict.lookup(policy.salary_category)
+  excluded = [cp in policy.exclude_parents for cp in table.category_parent_dict.values]
+  categories = table.category_dict.values
+  flags = dictionary_flags(table, classifier)
+  class_cache: dict = {}
+
+  salaries: Dict[str, float] = defaultdict(float)
+  expenses: Dict[str, float] = defaultdict(float)
+  ops_count: Dict[str, int] = defaultdict(int)
+  totals: Dict[str, float] = defaultdict(float)
+  counts: Dict[str, int] = defaultdict(int)
+  period_totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+  period_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+  enh_totals: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(
+      lambda: defaultdict(lambda: defaultdict(float)))
+  enh_counts: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
+      lambda: defaultdict(lambda: defaultdict(int)))
+
+  for o, cat, parent, sup, amount in zip(ordinals, table.category_codes, table.category_parent_codes,
+                                         table.supplier_codes, table.amounts):
+    label = label_of[o]
+    is_expense = amount < 0 and not excluded[parent]
+
+    # Monthly summary
+    if cat == salary_code:
+      salaries[label] += amount
+    if is_expense:
+      expenses[label] += amount  # negative sum
+      ops_count[label] += 1
+
+    # Plain breakdown
+    category = categories[cat]
+    if is_expense and category is not None:
+      totals[category] += -amount
+      counts[category] += 1
+      period_totals[label][category] += -amount
+      period_counts[label][category] += 1
+
+    # Enhanced breakdown
+    key = (cat, parent, sup)
+    classification = class_cache.get(key)
+    if classification is None:
+      classification = class_cache[key] = code_classification(flags, cat, parent, sup)
+    slot = classifier.resolve(classification, amount)
+    if slot is not None:
+      kind, row_label, signed_amount = slot
+      enh_totals[label][kind][row_label] += signed_amount
+      enh_counts[label][kind][row_label] += 1
+
+  return _build_reports(sorted(set(labels)), salaries, expenses, ops_count, totals, counts,
+                        period_totals, period_counts, enh_totals, enh_counts, policy)
+
+
+def _build_reports(periods, salaries, expenses, ops_count, totals, counts,
+                   period_totals, period_counts, enh_totals, enh_counts,
+                   policy: BudgetPolicy) -> FusedReports:
+  return FusedReports(
+      monthly_summary=summary.build_summary(
+          sorted(set(salaries) | set(expenses)), salaries, expenses, ops_count, policy),
+      category_breakdown=breakdown.build_rows(totals, counts),
+      period_breakdowns={
+          p: breakdown.build_rows(period_totals.get(p, {}), period_counts.get(p, {}))
+          for p in periods
+      },
+      period_enhanced_breakdowns={
+          p: enhanced_breakdown.build_rows(enh_totals.get(p, {}), enh_counts.get(p, {}))
+          for p in periods
+      },
+  )
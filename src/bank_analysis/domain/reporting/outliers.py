@@ -0,0 +1,157 @@
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from bank_analysis.domain.reporting.rolling import RollingWindow, _interpolated_percentile
+from bank_analysis.domain.value_objects import CategoryBreakdown, MonthlySummary
+
+# Consistency constants: for normally distributed data, 1.4826 * MAD and
+# 1.2533 * mean absolute deviation both estimate the standard deviation.
+_MAD_SCALE = 1.4826
+_MEAN_AD_SCALE = 1.2533
+
+
+@dataclass(frozen=True)
+class OutlierPolicy:
+    """
+    Which detectors flag a period as atypical (None disables a detector):
+    - negative_savings: savings or savings vs theoretical salary below zero
+    - mad_threshold: |robust z-score| (median / MAD) of a metric above this value
+    - iqr_factor: a metric outside [Q1 - k*IQR, Q3 + k*IQR]
+    - category_threshold: a category's total deviates from the median of its previous
+      'category_window' periods by more than this fraction of that median, and by at
+      least 'category_min_amount'
+    - metrics: MonthlySummary fields checked by the MAD and IQR detectors
+    """
+    negative_savings: bool = True
+    mad_threshold: Optional[float] = None
+    iqr_factor: Optional[float] = None
+    category_threshold: Optional[float] = None
+    category_window: int = 6
+    category_min_amount: float = 100.0
+    metrics: Tuple[str, ...] = ("total_savings", "total_expenses")
+
+
+DEFAULT_OUTLIER_POLICY = OutlierPolicy()
+
+DETECTORS = ("negative", "mad", "iqr", "category")
+
+
+def policy_for_detectors(names: Iterable[str], base: OutlierPolicy = DEFAULT_OUTLIER_POLICY) -> OutlierPolicy:
+    """Policy running exactly the named detectors, with usual thresholds for the statistical ones."""
+    names = set(names)
+    unknown = names - set(DETECTORS)
+    if unknown:
+        raise ValueError(f"Unknown outlier detectors: {', '.join(sorted(unknown))} "
+                         f"(expected some of {', '.join(DETECTORS)}).")
+    return replace(
+        base,
+        negative_savings="negative" in names,
+        mad_threshold=(base.mad_threshold or 3.5) if "mad" in names else None,
+        iqr_factor=(base.iqr_factor or 1.5) if "iqr" in names else None,
+        category_threshold=(base.category_threshold or 1.0) if "category" in names else None,
+    )
+
+
+def detect_atypical_periods(
+    summary: Sequence[MonthlySummary],
+    period_breakdowns: Optional[Mapping[str, Sequence[CategoryBreakdown]]] = None,
+    policy: OutlierPolicy = DEFAULT_OUTLIER_POLICY,
+) -> Dict[str, List[str]]:
+    """
+    Run the policy's detectors over the summary (one column per metric) and, for the
+    category detector, over the period x category matrix of period_breakdowns
+    (period label -> breakdown rows; missing rows count as 0).
+
+    Returns flagged period -> reasons, in summary order. Each detector is one pass
+    over its columns plus a sort, so the cost grows linearly with the history
+    (n log n for the sorts, n log w for the rolling baselines).
+    """
+    months = [s.month for s in summary]
+    flagged: List[List[str]] = [[] for _ in months]
+
+    if policy.negative_savings:
+        for i, s in enumerate(summary):
+            if s.total_savings < 0:
+                flagged[i].append(f"negative savings ({s.total_savings:.2f})")
+            if s.total_savings_vs_theoretical < 0:
+                flagged[i].append(f"negative savings vs theoretical ({s.total_savings_vs_theoretical:.2f})")
+
+    if policy.mad_threshold is not None or policy.iqr_factor is not None:
+        for metric in policy.metrics:
+            column = [float(getattr(s, metric)) for s in summary]
+            name = metric.replace("total_", "").replace("_", " ")
+            if policy.mad_threshold is not None:
+                for i, z in _mad_outliers(column, policy.mad_threshold):
+                    flagged[i].append(f"{name} robust z-score {z:+.1f}")
+            if policy.iqr_factor is not None:
+                for i, (lo, hi) in _iqr_outliers(column, policy.iqr_factor):
+                    flagged[i].append(f"{name} {column[i]:.2f} outside IQR fences [{lo:.2f}, {hi:.2f}]")
+
+    if policy.category_threshold is not None and period_breakdowns:
+        for i, reason in _category_deviations(months, period_breakdowns, policy):
+            flagged[i].append(reason)
+
+    return {month: reasons for month, reasons in zip(months, flagged) if reasons}
+
+
+def _mad_outliers(column: Sequence[float], threshold: float) -> List[Tuple[int, float]]:
+    """(index, robust z-score) of the values whose |z| exceeds threshold."""
+    if len(column) < 3:
+        return []
+    median = _interpolated_percentile(sorted(column), 50.0)
+    deviations = sorted(abs(x - median) for x in column)
+    scale = _MAD_SCALE * _interpolated_percentile(deviations, 50.0)
+    if scale == 0.0:
+        # More than half the values are equal: fall back to the mean absolute deviation
+        scale = _MEAN_AD_SCALE * sum(deviations) / len(deviations)
+        if scale == 0.0:
+            return []
+    out = []
+    for i, x in enumerate(column):
+        z = (x - median) / scale
+        if abs(z) > threshold:
+            out.append((i, z))
+    return out
+
+
+def _iqr_outliers(column: Sequence[float], factor: float) -> List[Tuple[int, Tuple[float, float]]]:
+    """(index, (low fence, high fence)) of the values outside the fences."""
+    if len(column) < 4:
+        return []
+    s = sorted(column)
+    q1, q3 = _interpolated_percentile(s, 25.0), _interpolated_percentile(s, 75.0)
+    lo, hi = q1 - factor * (q3 - q1), q3 + factor * (q3 - q1)
+    return [(i, (lo, hi)) for i, x in enumerate(column) if x < lo or x > hi]
+
+
+def _category_deviations(
+    months: Sequence[str],
+    period_breakdowns: Mapping[str, Sequence[CategoryBreakdown]],
+    policy: OutlierPolicy,
+) -> List[Tuple[int, str]]:
+    """
+    (index, reason) for each period where a category's total deviates from its rolling
+    baseline, the median of that category over the previous 'category_window' periods.
+    Periods without a full window of history are not checked.
+    """
+    n = len(months)
+    matrix: Dict[str, List[float]] = {}
+    for j, month in enumerate(months):
+        for row in period_breakdowns.get(month, ()):
+            column = matrix.get(row.label)
+            if column is None:
+                column = matrix[row.label] = [0.0] * n
+            column[j] += row.total
+
+    out: List[Tuple[int, str]] = []
+    for label, column in matrix.items():
+        baseline = RollingWindow(policy.category_window)
+        for j, x in enumerate(column):
+            if len(baseline) == policy.category_window:
+                base = baseline.median
+                deviation = abs(x - base)
+                if deviation >= policy.category_min_amount and deviation > policy.category_threshold * abs(base):
+                    out.append((j, f"{label} {x:.2f} vs baseline {base:.2f}"))
+            baseline.push(x)
+    out.sort(key=lambda item: item[0])
+    return out
@@ -0,0 +1,139 @@
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Iterable, List, Sequence
+
+from bank_analysis.domain.value_objects import MonthlySummary, RollingStats, RollingSummary
+
+DEFAULT_PERCENTILES = (10.0, 90.0)
+
+
+def _interpolated_percentile(sorted_values: Sequence[float], q: float) -> float:
+    """q-th percentile (0-100) of an already sorted, non-empty sequence."""
+    s = sorted_values
+    pos = (len(s) - 1) * q / 100.0
+    lo = int(pos)
+    if lo + 1 >= len(s):
+        return s[-1]
+    return s[lo] + (s[lo + 1] - s[lo]) * (pos - lo)
+
+
+class RollingWindow:
+    """
+    Sliding window over the last 'size' values of a stream, updated per push:
+    - mean and variance: running moments (Welford), updated for the value entering
+      and the value leaving the window, O(1)
+    - min and max: monotonic deques, O(1) amortized
+    - median and percentiles: the window kept sorted; a push bisects to insert and
+      to drop (O(log w) comparisons) but shifts the list, so it is O(w) moves, a
+      memmove of a few pointers for the window sizes used here
+    """
+
+    __slots__ = ("size", "_values", "_sorted", "_mins", "_maxs", "_pushed", "_mean", "_m2")
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("Window size must be >= 1.")
+        self.size = size
+        self._values: deque = deque()
+        self._sorted: List[float] = []
+        # (push index, value), values increasing / decreasing from the front
+        self._mins: deque = deque()
+        self._maxs: deque = deque()
+        self._pushed = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x: float) -> None:
+        x = float(x)
+        if len(self._values) == self.size:
+            old = self._values.popleft()
+            del self._sorted[bisect_left(self._sorted, old)]
+            n = len(self._values)
+            if n == 0:
+                self._mean = self._m2 = 0.0
+            else:
+                delta = old - self._mean
+                self._mean -= delta / n
+                self._m2 = max(self._m2 - delta * (old - self._mean), 0.0)
+        self._values.append(x)
+        insort(self._sorted, x)
+        self._push_extremum(self._mins, x, lambda back: back >= x)
+        self._push_extremum(self._maxs, x, lambda back: back <= x)
+        self._pushed += 1
+        delta = x - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (x - self._mean)
+
+    def _push_extremum(self, candidates: deque, x: float, dominated) -> None:
+        while candidates and dominated(candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._pushed, x))
+        # Drop the front once it has left the window
+        if candidates[0][0] <= self._pushed - self.size:
+            candidates.popleft()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        n = len(self._values)
+        return math.sqrt(self._m2 / (n - 1)) if n > 1 else 0.0
+
+    @property
+    def min(self) -> float:
+        return self._mins[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._maxs[0][1]
+
+    def percentile(self, q: float) -> float:
+        """q-th percentile (0-100), linear interpolation between closest ranks."""
+        return _interpolated_percentile(self._sorted, q)
+
+    @property
+    def median(self) -> float:
+        return self.percentile(50.0)
+
+    def stats(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> RollingStats:
+        return RollingStats(
+            mean=round(self.mean, 2),
+            median=round(self.median, 2),
+            std=round(self.std, 2),
+            min=round(self.min, 2),
+            max=round(self.max, 2),
+            percentiles={q: round(self.percentile(q), 2) for q in percentiles},
+        )
+
+
+def compute_rolling_stats(
+    summary: Sequence[MonthlySummary],
+    window: int = 3,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> List[RollingSummary]:
+    """
+    Rolling statistics of savings and expenses, one row per period, over the window
+    of the last 'window' periods ending there (fewer for the first periods).
+    Summary rows are taken in the given (chronological) order; each period costs
+    one window update, whatever the length of the history.
+    """
+    if any(not 0 <= q <= 100 for q in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100.")
+    savings, expenses = RollingWindow(window), RollingWindow(window)
+    out: List[RollingSummary] = []
+    for row in summary:
+        savings.push(row.total_savings)
+        expenses.push(row.total_expenses)
+        out.append(RollingSummary(
+            month=row.month,
+            periods=len(savings),
+            savings=savings.stats(percentiles),
+            expenses=expenses.stats(percentiles),
+        ))
+    return out
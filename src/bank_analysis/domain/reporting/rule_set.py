@@ -0,0 +1,125 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+
+from bank_analysis.domain.reporting.category_rules import (
+    CategoryRules, DEFAULT_CATEGORY_RULES, SupplierPattern,
+)
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """
+    Budget policy and classification rules in force, with a version stamp.
+    Results derived from them (classifications, summaries, breakdowns) are cached
+    under the version, so they are only recomputed when the rules change.
+    """
+    version: str
+    policy: BudgetPolicy
+    rules: CategoryRules
+
+
+DEFAULT_RULE_SET = RuleSet(version="default", policy=DEFAULT_POLICY, rules=DEFAULT_CATEGORY_RULES)
+
+
+def rule_set_from_dict(data: Mapping[str, Any], version: str) -> RuleSet:
+    """
+    Build a RuleSet from a config document; missing sections keep the defaults:
+
+        {"version": "...",
+         "policy": {"salary_category": "...", "exclude_parents": [...],
+                    "ref_theoretical_salary": 3700.0},
+         "rules": {"mandatory_categories": [...], "salary_category": "...",
+                   "reimbursement_keywords": [...],
+                   "supplier_patterns": [{"name": "Lidl", "regex": "\\\\blidl\\\\b"}, ...]}}
+
+    Supplier regexes are compiled case-insensitive. Raises ValueError on invalid
+    documents (unknown keys, wrong types, bad regexes).
+    """
+    if not isinstance(data, Mapping):
+        raise ValueError("Rules config must be an object.")
+    _check_keys(data, {"version", "policy", "rules"}, "config")
+    policy_data = data.get("policy", {})
+    rules_data = data.get("rules", {})
+    _check_keys(policy_data, {"salary_category", "exclude_parents", "ref_theoretical_salary"}, "policy")
+    _check_keys(rules_data, {"mandatory_categories", "salary_category", "reimbursement_keywords",
+                             "supplier_patterns"}, "rules")
+
+    policy = BudgetPolicy(
+        salary_category=_str(policy_data, "salary_category", DEFAULT_POLICY.salary_category),
+        exclude_parents=_str_set(policy_data, "exclude_parents", DEFAULT_POLICY.exclude_parents),
+        ref_theoretical_salary=_number(policy_data, "ref_theoretical_salary",
+                                       DEFAULT_POLICY.ref_theoretical_salary),
+    )
+    patterns = DEFAULT_CATEGORY_RULES.supplier_patterns
+    if "supplier_patterns" in rules_data:
+        patterns = tuple(_supplier_pattern(p) for p in rules_data["supplier_patterns"])
+    rules = CategoryRules(
+        mandatory_categories=_str_set(rules_data, "mandatory_categories",
+                                      DEFAULT_CATEGORY_RULES.mandatory_categories),
+        salary_category=_str(rules_data, "salary_category", DEFAULT_CATEGORY_RULES.salary_category),
+        reimbursement_keywords=_str_set(rules_data, "reimbursement_keywords",
+                                        DEFAULT_CATEGORY_RULES.reimbursement_keywords),
+        supplier_patterns=patterns,
+    )
+    return RuleSet(version=version, policy=policy, rules=rules)
+
+
+def rule_set_to_dict(rule_set: RuleSet) -> Dict[str, Any]:
+    """Config document for a RuleSet (inverse of rule_set_from_dict)."""
+    policy, rules = rule_set.policy, rule_set.rules
+    return {
+        "version": rule_set.version,
+        "policy": {
+            "salary_category": policy.salary_category,
+            "exclude_parents": sorted(policy.exclude_parents),
+            "ref_theoretical_salary": policy.ref_theoretical_salary,
+        },
+        "rules": {
+            "mandatory_categories": sorted(rules.mandatory_categories),
+            "salary_category": rules.salary_category,
+            "reimbursement_keywords": sorted(rules.reimbursement_keywords),
+            "supplier_patterns": [{"name": p.name, "regex": p.regex.pattern}
+                                  for p in rules.supplier_patterns],
+        },
+    }
+
+
+def _check_keys(section: Any, allowed: set, where: str) -> None:
+    if not isinstance(section, Mapping):
+        raise ValueError(f"Rules config: '{where}' must be an object.")
+    unknown = set(section) - allowed
+    if unknown:
+        raise ValueError(f"Rules config: unknown key(s) in '{where}': {', '.join(sorted(unknown))}.")
+
+
+def _str(section: Mapping[str, Any], key: str, default: str) -> str:
+    value = section.get(key, default)
+    if not isinstance(value, str):
+        raise ValueError(f"Rules config: '{key}' must be a string.")
+    return value
+
+
+def _number(section: Mapping[str, Any], key: str, default: float) -> float:
+    value = section.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Rules config: '{key}' must be a number.")
+    return float(value)
+
+
+def _str_set(section: Mapping[str, Any], key: str, default: frozenset) -> frozenset:
+    value = section.get(key, default)
+    if not isinstance(value, (list, tuple, set, frozenset)) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"Rules config: '{key}' must be a list of strings.")
+    return frozenset(value)
+
+
+def _supplier_pattern(item: Any) -> SupplierPattern:
+    if not isinstance(item, Mapping) or not isinstance(item.get("name"), str) \
+            or not isinstance(item.get("regex"), str):
+        raise ValueError("Rules config: supplier patterns need a 'name' and a 'regex' string.")
+    try:
+        return SupplierPattern(item["name"], re.compile(item["regex"], re.IGNORECASE))
+    except re.error as e:
+        raise ValueError(f"Rules config: invalid regex for supplier '{item['name']}': {e}") from e
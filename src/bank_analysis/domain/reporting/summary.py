@@ -1,20 +1,28 @@
 from collections import defaultdict
-from typing import Sequence
+from datetime import date
+from typing import Iterable, Mapping
 
 from bank_analysis.domain.entities import Transaction
 from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.transaction_table import TransactionTable
 from bank_analysis.domain.value_objects import MonthlySummary
 from bank_analysis.ports.cycle_grouper import CycleGrouper
 
 
 def compute_monthly_summary_core(
-    txns: Sequence[Transaction],
+    txns: Iterable[Transaction],
     cycle_grouper: CycleGrouper,
     policy: BudgetPolicy = DEFAULT_POLICY,
 ) -> list[MonthlySummary]:
   """
   Pure domain computation. Groups using the provided CycleGrouper.
+  Transactions are consumed in a single pass, so a streaming iterator is accepted.
+  A TransactionTable goes to the columnar engine instead of being materialized
+  row by row (same results).
   """
+  if isinstance(txns, TransactionTable):
+    return compute_monthly_summary_vectorized(txns, cycle_grouper, policy)
+
   salaries: dict[str, float] = defaultdict(float)
   expenses: dict[str, float] = defaultdict(float)
   ops_count: dict[str, int] = defaultdict(int)
@@ -27,7 +35,77 @@ def compute_monthly_summary_core(
       expenses[label] += float(t.amount)  # negative sum
       ops_count[label] += 1
 
-  groups = sorted(set(salaries) | set(expenses))
+  return build_summary(sorted(set(salaries) | set(expenses)),
+                        salaries, expenses, ops_count, policy)
+
+
+def compute_monthly_summary_vectorized(
+    txns: Iterable[Transaction],
+    cycle_grouper: CycleGrouper,
+    policy: BudgetPolicy = DEFAULT_POLICY,
+) -> list[MonthlySummary]:
+  """
+  Columnar engine producing the same MonthlySummary list as compute_monthly_summary_core.
+
+    1. label each distinct date once, then map every row to a period index
+    2. evaluate the salary / exclusion predicates once per dictionary code
+    3. accumulate salaries, expenses and op counts into per-period slots
+
+  Amounts are added in row order within each period, so sums (and therefore
+  the rounded outputs) are bit-for-bit identical to the row-wise engine.
+  """
+  table = txns if isinstance(txns, TransactionTable) else TransactionTable.from_transactions(txns)
+
+  # 1) Period index per row
+  ordinals = table.date_ordinals
+  distinct = sorted(set(ordinals))
+  distinct_dates = [date.fromordinal(o) for o in distinct]
+  if hasattr(cycle_grouper, "labels_for_dates"):
+    labels = cycle_grouper.labels_for_dates(distinct_dates)
+  else:
+    labels = [cycle_grouper.label_for_date(d) for d in distinct_dates]
+  period_labels = sorted(set(labels))
+  slot_of_label = {label: i for i, label in enumerate(period_labels)}
+  slot_of_ordinal = {o: slot_of_label[label] for o, label in zip(distinct, labels)}
+  period_idx = [slot_of_ordinal[o] for o in ordinals]
+
+  # 2) Per-code predicates
+  salary_code = table.category_dict.lookup(policy.salary_category)
+  excluded = [cp in policy.exclude_parents for cp in table.category_parent_dict.values]
+
+  # 3) Masked per-period sums
+  n = len(period_labels)
+  salaries = [0.0] * n
+  expenses = [0.0] * n
+  ops_count = [0] * n
+  has_salary = [False] * n
+  for p, cat, parent, amount in zip(period_idx, table.category_codes,
+                                    table.category_parent_codes, table.amounts):
+    if cat == salary_code:
+      salaries[p] += amount
+      has_salary[p] = True
+    if amount < 0 and not excluded[parent]:
+      expenses[p] += amount  # negative sum
+      ops_count[p] += 1
+
+  groups = [label for i, label in enumerate(period_labels) if has_salary[i] or ops_count[i]]
+  return build_summary(
+      groups,
+      {label: salaries[slot_of_label[label]] for label in groups},
+      {label: expenses[slot_of_label[label]] for label in groups},
+      {label: ops_count[slot_of_label[label]] for label in groups},
+      policy,
+  )
+
+
+def build_summary(
+    groups: Iterable[str],
+    salaries: Mapping[str, float],
+    expenses: Mapping[str, float],
+    ops_count: Mapping[str, int],
+    policy: BudgetPolicy,
+) -> list[MonthlySummary]:
+  """Apply the rounding rules and build one MonthlySummary per group, in order."""
   out: list[MonthlySummary] = []
   for g in groups:
     total_salary = round(salaries.get(g, 0.0), 2)
@@ -45,4 +123,4 @@ def compute_monthly_summary_core(
         total_savings=total_savings,
         total_savings_vs_theoretical=total_vs_theoretical,
     ))
-  return out
\ No newline at end of file
+  return out
@@ -0,0 +1,110 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.matcher import _match_supplier
+from bank_analysis.domain.period_splicer import _parse_iso_date
+from bank_analysis.domain.reporting.category_rules import DEFAULT_CATEGORY_RULES, SupplierPattern
+from bank_analysis.domain.value_objects import BreakdownKind
+
+
+class TransactionIndex:
+    """
+    Drill-down index over a fixed list of transactions, built lazily:
+      - period -> row ids: date-range periods ('YYYY-MM-DD to YYYY-MM-DD') resolve to a
+        contiguous range of the date-sorted rows (bisection); calendar periods ('YYYY-MM')
+        use a month -> row ids map built on first use
+      - (period, casefolded category) -> row ids
+      - (period, supplier name) -> row ids
+    Per-period maps are built on the first query for that period. Row ids are returned
+    in the original order, so lookups match filtering.filter_transactions_by_period_label_and_kind.
+    Builds are idempotent: concurrent first accesses at worst compute the same map twice.
+    """
+
+    def __init__(
+        self,
+        transactions: Sequence[Transaction],
+        supplier_patterns: Tuple[SupplierPattern, ...] = DEFAULT_CATEGORY_RULES.supplier_patterns,
+    ) -> None:
+        self.transactions = transactions
+        self._supplier_patterns = supplier_patterns
+        self._date_order: Optional[List[int]] = None
+        self._sorted_ordinals: Optional[List[int]] = None
+        self._by_month: Optional[Dict[str, List[int]]] = None
+        self._period_rows: Dict[str, List[int]] = {}
+        self._by_category: Dict[str, Dict[str, List[int]]] = {}
+        self._by_supplier: Dict[str, Dict[str, List[int]]] = {}
+
+    # ----- Row id lookups -----
+
+    def rows_for_period(self, period: str) -> List[int]:
+        period = period.strip()
+        rows = self._period_rows.get(period)
+        if rows is None:
+            rows = self._period_rows[period] = self._resolve_period(period)
+        return rows
+
+    def rows_for_category(self, period: str, label: str) -> List[int]:
+        by_category = self._by_category.get(period)
+        if by_category is None:
+            by_category = defaultdict(list)
+            for i in self.rows_for_period(period):
+                category = self.transactions[i].category
+                if category is not None:
+                    by_category[category.casefold()].append(i)
+            self._by_category[period] = by_category = dict(by_category)
+        return by_category.get(label.casefold(), [])
+
+    def rows_for_supplier(self, period: str, name: Optional[str] = None) -> List[int]:
+        """Rows of the period matched to supplier 'name', or to any supplier if name is None."""
+        by_supplier = self._by_supplier.get(period)
+        if by_supplier is None:
+            by_supplier = defaultdict(list)
+            for i in self.rows_for_period(period):
+                matched = _match_supplier(getattr(self.transactions[i], "supplier", None),
+                                          self._supplier_patterns)
+                if matched:
+                    by_supplier[matched].append(i)
+            self._by_supplier[period] = by_supplier = dict(by_supplier)
+        if name is not None:
+            return by_supplier.get(name, [])
+        return sorted(i for rows in by_supplier.values() for i in rows)
+
+    # ----- Transaction lookups -----
+
+    def filter(self, period: str, label: str, kind: BreakdownKind) -> List[Transaction]:
+        """Index-backed equivalent of filtering.filter_transactions_by_period_label_and_kind."""
+        if kind == BreakdownKind.SUPPLIER:
+            rows = self.rows_for_supplier(period)
+        else:
+            rows = self.rows_for_category(period, label)
+        return [self.transactions[i] for i in rows]
+
+    # ----- Internals -----
+
+    def _resolve_period(self, period: str) -> List[int]:
+        # Salary cycle style: 'YYYY-MM-DD to YYYY-MM-DD' (inclusive bounds)
+        if " to " in period:
+            start_str, end_str = period.split(" to ", 1)
+            start = _parse_iso_date(start_str).toordinal()
+            end = _parse_iso_date(end_str).toordinal()
+            order, ordinals = self._date_sorted()
+            lo, hi = bisect_left(ordinals, start), bisect_right(ordinals, end)
+            return sorted(order[lo:hi])
+
+        # Calendar month style: 'YYYY-MM' on Transaction.month
+        if self._by_month is None:
+            by_month: Dict[str, List[int]] = defaultdict(list)
+            for i, t in enumerate(self.transactions):
+                by_month[t.month].append(i)
+            self._by_month = dict(by_month)
+        return self._by_month.get(period, [])
+
+    def _date_sorted(self) -> Tuple[List[int], List[int]]:
+        if self._date_order is None or self._sorted_ordinals is None:
+            ordinals = [t.date_op.toordinal() for t in self.transactions]
+            order = sorted(range(len(ordinals)), key=ordinals.__getitem__)
+            self._sorted_ordinals = [ordinals[i] for i in order]
+            self._date_order = order
+        return self._date_order, self._sorted_ordinals
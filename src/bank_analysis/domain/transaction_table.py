@@ -0,0 +1,215 @@
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Union, overload
+
+from bank_analysis.domain.entities import Transaction
+
+
+class ColumnDictionary:
+    """
+    Dictionary encoding for a low-cardinality string column.
+    - values: distinct values, indexed by their integer code (append-only)
+    - code_for(value): returns the code of a value, registering it if unseen
+    """
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values: Iterable[Optional[str]] = ()) -> None:
+        self.values: List[Optional[str]] = []
+        self._codes: Dict[Hashable, int] = {}
+        for v in values:
+            self.code_for(v)
+
+    def code_for(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """Return the code of an already-registered value, or None."""
+        return self._codes.get(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class TransactionTable(Sequence):
+    """
+    Columnar, array-backed storage for transactions.
+
+    Columns:
+      - date_ordinals: array('i') of date.toordinal() values
+      - amounts: array('d') (negative => expense; positive => income)
+      - month_codes / category_codes / category_parent_codes / supplier_codes /
+        account_codes: array('i') of codes into the matching ColumnDictionary
+      - messages: free-text labels, kept as a plain list (not dictionary-encoded)
+
+    The table behaves as a read-only Sequence[Transaction], so code written
+    against lists keeps working; Transaction objects are only built on access.
+    Reporting functions detect the table and aggregate over the columns directly.
+    """
+
+    def __init__(
+        self,
+        month_dict: Optional[ColumnDictionary] = None,
+        category_dict: Optional[ColumnDictionary] = None,
+        category_parent_dict: Optional[ColumnDictionary] = None,
+        supplier_dict: Optional[ColumnDictionary] = None,
+        account_dict: Optional[ColumnDictionary] = None,
+    ) -> None:
+        self.date_ordinals = array("i")
+        self.amounts = array("d")
+        self.month_codes = array("i")
+        self.category_codes = array("i")
+        self.category_parent_codes = array("i")
+        self.supplier_codes = array("i")
+        self.account_codes = array("i")
+        self.messages: List[str] = []
+        # Memoized results that only depend on dictionary values (e.g. classifications),
+        # shared with take() results since their codes mean the same values
+        self.derived: Dict[Hashable, Any] = {}
+
+        self.month_dict = month_dict if month_dict is not None else ColumnDictionary()
+        self.category_dict = category_dict if category_dict is not None else ColumnDictionary()
+        self.category_parent_dict = (
+            category_parent_dict if category_parent_dict is not None else ColumnDictionary()
+        )
+        self.supplier_dict = supplier_dict if supplier_dict is not None else ColumnDictionary()
+        self.account_dict = account_dict if account_dict is not None else ColumnDictionary()
+
+    # ----- Building -----
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionTable":
+        table = cls()
+        table.extend(transactions)
+        return table
+
+    def append_values(
+        self,
+        date_op: date,
+        month: str,
+        category: Optional[str],
+        category_parent: Optional[str],
+        amount: float,
+        message: str,
+        supplier: Optional[str] = "",
+        account: Optional[str] = "",
+    ) -> None:
+        """Append one row from raw field values (same order as Transaction fields)."""
+        self.date_ordinals.append(date_op.toordinal())
+        self.amounts.append(float(amount))
+        self.month_codes.append(self.month_dict.code_for(month))
+        self.category_codes.append(self.category_dict.code_for(category))
+        self.category_parent_codes.append(self.category_parent_dict.code_for(category_parent))
+        self.supplier_codes.append(self.supplier_dict.code_for(supplier))
+        self.account_codes.append(self.account_dict.code_for(account))
+        self.messages.append(message)
+
+    def append(self, tx: Transaction) -> None:
+        self.append_values(
+            tx.date_op, tx.month, tx.category, tx.category_parent,
+            tx.amount, tx.message, getattr(tx, "supplier", ""), getattr(tx, "account", ""),
+        )
+
+    def extend(self, transactions: Iterable[Transaction]) -> None:
+        for tx in transactions:
+            self.append(tx)
+
+    def extend_table(self, other: "TransactionTable") -> None:
+        """Append all rows of another table, remapping its codes onto this table's dictionaries."""
+        self.date_ordinals.extend(other.date_ordinals)
+        self.amounts.extend(other.amounts)
+        for dict_name, codes_name in (("month_dict", "month_codes"),
+                                      ("category_dict", "category_codes"),
+                                      ("category_parent_dict", "category_parent_codes"),
+                                      ("supplier_dict", "supplier_codes"),
+                                      ("account_dict", "account_codes")):
+            target = getattr(self, dict_name)
+            if target is getattr(other, dict_name):
+                # Shared dictionary (take() results, BATX row groups): codes are valid as is
+                getattr(self, codes_name).extend(getattr(other, codes_name))
+                continue
+            remap = [target.code_for(v) for v in getattr(other, dict_name).values]
+            getattr(self, codes_name).extend([remap[c] for c in getattr(other, codes_name)])
+        self.messages.extend(other.messages)
+
+    def take(self, indices: Iterable[int]) -> "TransactionTable":
+        """
+        Return a new table with the given rows, in the given order.
+        Dictionaries are shared with this table (codes stay valid).
+        """
+        out = TransactionTable(self.month_dict, self.category_dict,
+                               self.category_parent_dict, self.supplier_dict, self.account_dict)
+        idx = list(indices)
+        out.date_ordinals = array("i", [self.date_ordinals[i] for i in idx])
+        out.amounts = array("d", [self.amounts[i] for i in idx])
+        out.month_codes = array("i", [self.month_codes[i] for i in idx])
+        out.category_codes = array("i", [self.category_codes[i] for i in idx])
+        out.category_parent_codes = array("i", [self.category_parent_codes[i] for i in idx])
+        out.supplier_codes = array("i", [self.supplier_codes[i] for i in idx])
+        out.account_codes = array("i", [self.account_codes[i] for i in idx])
+        out.messages = [self.messages[i] for i in idx]
+        out.derived = self.derived
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint: column buffers, messages and dictionaries."""
+        columns = (self.date_ordinals, self.amounts, self.month_codes, self.category_codes,
+                   self.category_parent_codes, self.supplier_codes, self.account_codes)
+        total = sum(sys.getsizeof(c) for c in columns)
+        total += sys.getsizeof(self.messages) + sum(sys.getsizeof(m) for m in self.messages)
+        for d in (self.month_dict, self.category_dict, self.category_parent_dict,
+                  self.supplier_dict, self.account_dict):
+            total += sys.getsizeof(d.values) + sum(sys.getsizeof(v) for v in d.values)
+        return total
+
+    # ----- Sequence[Transaction] protocol -----
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @overload
+    def __getitem__(self, i: int) -> Transaction: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "TransactionTable": ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Transaction, "TransactionTable"]:
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("TransactionTable index out of range")
+        return self._build(
+            self.date_ordinals[i], self.month_codes[i], self.category_codes[i],
+            self.category_parent_codes[i], self.amounts[i], self.messages[i],
+            self.supplier_codes[i], self.account_codes[i],
+        )
+
+    def __iter__(self) -> Iterator[Transaction]:
+        build = self._build
+        for row in zip(self.date_ordinals, self.month_codes, self.category_codes,
+                       self.category_parent_codes, self.amounts, self.messages,
+                       self.supplier_codes, self.account_codes):
+            yield build(*row)
+
+    def _build(self, ordinal: int, month: int, category: int, parent: int,
+               amount: float, message: str, supplier: int, account: int) -> Transaction:
+        return Transaction(
+            date_op=date.fromordinal(ordinal),
+            month=self.month_dict.values[month],
+            category=self.category_dict.values[category],
+            category_parent=self.category_parent_dict.values[parent],
+            amount=amount,
+            message=message,
+            supplier=self.supplier_dict.values[supplier],
+            account=self.account_dict.values[account],
+        )
@@ -0,0 +1,69 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+
+
+def match_internal_transfers(
+    transactions: Sequence[Transaction],
+    policy: BudgetPolicy = DEFAULT_POLICY,
+    max_days: int = 3,
+) -> List[Tuple[int, int]]:
+    """
+    Pair the two legs of transfers between our own accounts: a debit on one account
+    and a credit of the same amount (to the cent) on another account, at most
+    max_days apart, where at least one leg is an internal movement
+    (category_parent in policy.exclude_parents). Rows without an account are never
+    paired.
+
+    Debits are taken in date order and each is paired with the closest unpaired
+    credit. Returns (debit index, credit index) pairs.
+    """
+    credits: Dict[int, List[int]] = defaultdict(list)
+    debits: List[int] = []
+    for i, t in enumerate(transactions):
+        if not getattr(t, "account", ""):
+            continue
+        if t.amount > 0:
+            credits[round(t.amount * 100)].append(i)
+        elif t.amount < 0:
+            debits.append(i)
+
+    internal = policy.exclude_parents
+    paired = set()
+    pairs: List[Tuple[int, int]] = []
+    for i in sorted(debits, key=lambda k: transactions[k].date_op):
+        debit = transactions[i]
+        best, best_gap = None, max_days + 1
+        for j in credits.get(round(-debit.amount * 100), ()):
+            if j in paired:
+                continue
+            credit = transactions[j]
+            if credit.account == debit.account:
+                continue
+            if debit.category_parent not in internal and credit.category_parent not in internal:
+                continue
+            gap = abs((credit.date_op - debit.date_op).days)
+            if gap < best_gap:
+                best, best_gap = j, gap
+        if best is not None:
+            paired.add(best)
+            pairs.append((i, best))
+    return pairs
+
+
+def cancel_internal_transfers(
+    transactions: Sequence[Transaction],
+    policy: BudgetPolicy = DEFAULT_POLICY,
+    max_days: int = 3,
+) -> Tuple[List[Transaction], int]:
+    """
+    Consolidated view of several accounts: drop both legs of every transfer between
+    them (see match_internal_transfers), so money moved from one account to another
+    is neither an expense nor an income. Returns (kept rows, number of transfers).
+    """
+    pairs = match_internal_transfers(transactions, policy, max_days)
+    dropped = {i for pair in pairs for i in pair}
+    kept = [t for i, t in enumerate(transactions) if i not in dropped]
+    return kept, len(pairs)
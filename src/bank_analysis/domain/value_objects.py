@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
 
 
 # ===== Domain DTOs =====
@@ -52,5 +52,100 @@ class AggregateMetrics:
 
 @dataclass(frozen=True)
 class FilteredSummary:
+    """
+    Summary with atypical periods removed:
+    - excluded_months: excluded period labels, in summary order
+    - reasons: excluded period -> why each detector flagged it
+    """
     filtered: List[MonthlySummary]
-    excluded_months: List[str]
\ No newline at end of file
+    excluded_months: List[str]
+    reasons: Dict[str, List[str]] = field(default_factory=dict)
+
+@dataclass(frozen=True)
+class FusedReports:
+    """
+    Everything computed by the single-scan analysis pipeline:
+    - monthly_summary: per-period summary (same as compute_monthly_summary_core)
+    - category_breakdown: plain breakdown over all transactions
+    - period_breakdowns: period label -> plain breakdown of that period
+    - period_enhanced_breakdowns: period label -> enhanced breakdown of that period
+    """
+    monthly_summary: List[MonthlySummary]
+    category_breakdown: List[CategoryBreakdown]
+    period_breakdowns: Dict[str, List[CategoryBreakdown]]
+    period_enhanced_breakdowns: Dict[str, List[CategoryBreakdown]]
+
+@dataclass(frozen=True)
+class AppendResult:
+    """
+    Outcome of appending a statement to an incremental dataset:
+    - added / duplicates: rows kept / skipped as already present
+    - recomputed_periods: periods whose results were rebuilt (new rows or new bounds)
+    - removed_periods: periods that no longer exist (e.g. the last salary period,
+      replaced by its split or stretched version)
+    """
+    added: int
+    duplicates: int
+    recomputed_periods: List[str]
+    removed_periods: List[str]
+
+@dataclass(frozen=True)
+class MultiAccountReports:
+    """
+    Reports over several accounts, all grouped into the same periods:
+    - accounts: account -> reports on that account's rows alone
+    - consolidated: reports on all accounts, transfers between them cancelled
+    - cancelled_transfers: number of transfers removed from the consolidated view
+    """
+    accounts: Dict[str, FusedReports]
+    consolidated: FusedReports
+    cancelled_transfers: int
+
+@dataclass(frozen=True)
+class FileAnalysis:
+    """Non-interactive analysis of one export, as written by batch runs."""
+    source: str
+    monthly_summary: List[MonthlySummary]
+    excluded_months: List[str]
+    aggregates: AggregateMetrics
+    category_breakdown: List[CategoryBreakdown]
+    period_enhanced_breakdowns: Dict[str, List[CategoryBreakdown]]
+
+
+@dataclass(frozen=True)
+class BatchFileResult:
+    """
+    Outcome of one file in a batch run:
+    - rows: transactions loaded (0 on failure)
+    - outputs: paths written
+    - timings: stage -> seconds ('load', 'analyze', 'write', 'total')
+    - error: failure message, None on success
+    """
+    source: str
+    rows: int
+    outputs: List[str]
+    timings: Dict[str, float]
+    error: Optional[str] = None
+
+@dataclass(frozen=True)
+class RollingStats:
+    """
+    Statistics of one metric over a sliding window of periods:
+    - std: sample standard deviation (0.0 for a single period)
+    - percentiles: percentile (0-100) -> value, linear interpolation
+    """
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    percentiles: Dict[float, float]
+
+
+@dataclass(frozen=True)
+class RollingSummary:
+    """Rolling statistics at one period, over the window ending there ('periods' rows)."""
+    month: str
+    periods: int
+    savings: RollingStats
+    expenses: RollingStats
@@ -1,18 +1,40 @@
 import argparse
+import functools
+import os
+import sys
+import time
 
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
 from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
+from bank_analysis.domain.incremental import IncrementalAnalysis
+from src.bank_analysis.usecases.append_transactions import AppendTransactionsUseCase
+from src.bank_analysis.usecases.batch_analysis import BatchAnalysisUseCase
+from src.bank_analysis.usecases.multi_account_analysis import MultiAccountAnalysisUseCase
 from src.bank_analysis.usecases.compute_aggregates import \
   ComputeAggregatesUseCase
 from src.bank_analysis.usecases.compute_category_breakdown import \
   ComputeCategoryBreakdownUseCase
 from src.bank_analysis.usecases.compute_monthly_summary import \
   ComputeMonthlySummaryUseCase
+from src.bank_analysis.usecases.compute_rolling_stats import ComputeRollingStatsUseCase
 from src.bank_analysis.usecases.data_loading import DataLoadingUseCase
 from src.bank_analysis.usecases.export_use_case import ExportUseCase
 from src.bank_analysis.usecases.filter_atypical_months import \
   FilterAtypicalMonthsUseCase
+from src.bank_analysis.usecases.precompute_period_breakdowns import \
+  PrecomputePeriodBreakdownsUseCase
+from ..adapters.binary_file_loader import (
+    BINARY_EXTENSION, BinaryFileDataLoader, append_binary_file, write_binary_file,
+)
+from ..adapters.binary_table_codec import BinaryFormatError
 from ..adapters.csv_file_loader import CsvFileDataLoader
+from ..adapters.file_report_writer import FORMATS, FileReportWriter
+from ..adapters.json_rules_provider import load_rule_set
+from ..domain.reporting.outliers import DETECTORS, policy_for_detectors
+from ..domain.reporting.rule_set import DEFAULT_RULE_SET
+from ..adapters.multi_file_loader import MultiFileDataLoader
 from ..adapters.stdout_presenter import StdoutPresenter
+from ..adapters.streaming_exporters import CsvExporter, exporter_for_path
 
 def choose_file_interactive(files):
     print("Available CSV files:")
@@ -29,18 +51,102 @@ def choose_file_interactive(files):
             print("Please enter a valid number.")
 
 def run(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "batch":
+        return run_batch(argv[1:])
+
     parser = argparse.ArgumentParser(prog="bank-analysis")
     parser.add_argument("--csv", "-c", help="Path to accounts CSV")
+    parser.add_argument("--cache-dir", help="Directory for the parsed-CSV cache (enables caching)")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Ignore any cached parse and rebuild it from the CSV")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse large CSV files with this many processes (memory-mapped chunks); "
+                             "with --all/--glob, load this many files at once")
+    parser.add_argument("--convert", metavar="OUT" + BINARY_EXTENSION,
+                        help="Convert --csv to the binary format at this path, then exit")
+    parser.add_argument("--export-transactions", metavar="OUT",
+                        help="Stream the --csv transactions to OUT (.csv, .jsonl or "
+                             + BINARY_EXTENSION + "), then exit")
+    parser.add_argument("--append", metavar="NEW_CSV",
+                        help="Append this statement to the --csv" + BINARY_EXTENSION + " history "
+                             "(skipping rows already imported) as a new row group, and analyse the "
+                             "result. The history is still read and its periods recomputed on each "
+                             "run: only the file write is incremental")
+    parser.add_argument("--rules", help="JSON rules config (budget policy, categories, suppliers)")
+    parser.add_argument("--detectors", default="negative",
+                        help="Comma-separated atypical month detectors, among "
+                             + ", ".join(DETECTORS) + " (default: negative)")
+    parser.add_argument("--rolling", type=int, metavar="N",
+                        help="Also show rolling statistics over windows of N periods")
+    parser.add_argument("--all", action="store_true",
+                        help="Analyse every CSV in the directory together: per-account and "
+                             "consolidated reports, transfers between the accounts cancelled")
+    parser.add_argument("--glob", metavar="PATTERN",
+                        help="Like --all, for the files matching this pattern")
     args = parser.parse_args(argv)
+    rule_set = load_rule_set(args.rules) if args.rules else DEFAULT_RULE_SET
+
+    if args.all or args.glob:
+        run_multi_account(args.glob, workers=args.workers, rule_set=rule_set)
+        return
+
+    if args.refresh_cache and not args.cache_dir:
+        parser.error("--refresh-cache requires --cache-dir")
+    loader = CsvFileDataLoader(base_path=".", cache_dir=args.cache_dir,
+                               refresh_cache=args.refresh_cache, workers=args.workers)
+
+    if args.convert:
+        if not args.csv:
+            parser.error("--convert requires --csv")
+        rows = write_binary_file(args.convert, loader.iter_transactions(args.csv))
+        print(f"Wrote {rows} transactions to {args.convert}")
+        return
+
+    if args.export_transactions:
+        if not args.csv:
+            parser.error("--export-transactions requires --csv")
+        source = BinaryFileDataLoader(base_path=".") if args.csv.lower().endswith(BINARY_EXTENSION) else loader
+        rows = ExportUseCase(exporter_for_path(args.export_transactions)).export_transactions(
+            args.export_transactions, source.iter_transactions(args.csv))
+        print(f"Wrote {rows} transactions to {args.export_transactions}")
+        return
+
+    if args.append and not (args.csv and args.csv.lower().endswith(BINARY_EXTENSION)):
+        parser.error("--append requires --csv HISTORY" + BINARY_EXTENSION)
 
-    loader = CsvFileDataLoader(base_path=".")
+    analysis = None
+    if args.append:
+        history = BinaryFileDataLoader(base_path=".").load_table(args.csv)
+        analysis = IncrementalAnalysis(SalaryCycleGrouper(history, rule_set.policy.salary_category),
+                                       history, rule_set.policy, rule_set.rules)
+        result = AppendTransactionsUseCase(analysis).execute(loader.iter_transactions(args.append))
+        if result.added:
+            try:
+                append_binary_file(args.csv, analysis.table[len(analysis.table) - result.added:])
+            except BinaryFormatError:
+                # Older format version: rewrite the whole history in the current one
+                write_binary_file(args.csv, analysis.table)
+        print(f"Appended {result.added} transactions to {args.csv} "
+              f"({result.duplicates} already present)")
+        if result.recomputed_periods:
+            print("Recomputed periods: " + ", ".join(result.recomputed_periods))
+
+    if args.csv and args.csv.lower().endswith(BINARY_EXTENSION):
+        # Converted exports are read as is, no CSV parsing
+        loader = BinaryFileDataLoader(base_path=".")
 
     data_loader_uc = DataLoadingUseCase(loader)
 
-    filter_uc = FilterAtypicalMonthsUseCase()
+    try:
+        detectors = [name.strip() for name in args.detectors.split(",") if name.strip()]
+        outlier_policy = policy_for_detectors(detectors)
+    except ValueError as e:
+        parser.error(str(e))
+    filter_uc = FilterAtypicalMonthsUseCase(outlier_policy)
     aggregates_uc = ComputeAggregatesUseCase()
-    category_breakdown_uc = ComputeCategoryBreakdownUseCase()
-    export_uc = ExportUseCase()
+    category_breakdown_uc = ComputeCategoryBreakdownUseCase(rule_set.policy)
+    export_uc = ExportUseCase(CsvExporter())
 
     if args.csv:
         csv_path = args.csv
@@ -61,19 +167,33 @@ def run(argv=None):
 
     export_choice = input("\nDo you want to export the filtered summary and category breakdown to CSV? (y/n): ").strip().lower()
 
-    presenter = StdoutPresenter()
+    presenter = StdoutPresenter(rule_set.policy)
 
-    transactions = data_loader_uc.execute(csv_path)
+    if analysis is not None:
+        # Appended dataset: periods are already up to date
+        transactions = analysis.table
+        monthly_summary = analysis.monthly_summary
+    else:
+        transactions = data_loader_uc.execute(csv_path)
 
-    cycle_grouper = SalaryCycleGrouper(transactions)
-    monthly_summary_uc = ComputeMonthlySummaryUseCase(cycle_grouper)
+        cycle_grouper = SalaryCycleGrouper(transactions, rule_set.policy.salary_category)
+        monthly_summary_uc = ComputeMonthlySummaryUseCase(cycle_grouper, policy=rule_set.policy)
 
-    monthly_summary = monthly_summary_uc.execute(transactions)
+        monthly_summary = monthly_summary_uc.execute(transactions)
     summary=monthly_summary
     presenter.present_monthly_summary(monthly_summary)
 
     if do_filter:
-        filtered_atypical_months = filter_uc.execute(monthly_summary)
+        period_breakdowns = None
+        if outlier_policy.category_threshold is not None:
+            if analysis is not None:
+                breakdowns = analysis.period_breakdowns
+            else:
+                breakdowns = PrecomputePeriodBreakdownsUseCase(
+                    cycle_grouper, rule_set.policy, rule_set.rules).execute(transactions)
+            period_breakdowns = {period: rows for (style, period), rows in breakdowns.items()
+                                 if style == "standard"}
+        filtered_atypical_months = filter_uc.execute(monthly_summary, period_breakdowns)
         summary=filtered_atypical_months.filtered
         presenter.present_filtered_summary(filtered_atypical_months)
         aggregates = aggregates_uc.execute(summary)
@@ -82,6 +202,9 @@ def run(argv=None):
 
     presenter.present_aggregates(aggregates)
 
+    if args.rolling:
+        presenter.present_rolling_stats(ComputeRollingStatsUseCase(args.rolling).execute(summary))
+
     category_breakdown = None
     if show_breakdown:
         category_breakdown = category_breakdown_uc.execute(transactions)
@@ -92,5 +215,80 @@ def run(argv=None):
         export_uc.execute(export_paths, summary, category_breakdown)
 
 
+def run_multi_account(pattern=None, workers=None, rule_set=DEFAULT_RULE_SET):
+    multi_loader = MultiFileDataLoader(base_path=".", workers=workers)
+    paths = multi_loader.list_files(pattern)
+    if not paths:
+        print("No CSV files found." if pattern is None else f"No files match {pattern}.")
+        return
+    print("\nSelected files: " + ", ".join(paths) + "\n")
+
+    transactions = multi_loader.load_table(paths)
+    grouper = SalaryCycleGrouper(transactions, rule_set.policy.salary_category)
+    reports = MultiAccountAnalysisUseCase(grouper, rule_set.policy,
+                                          rules=rule_set.rules).execute(transactions)
+    StdoutPresenter(rule_set.policy).present_multi_account(reports)
+
+
+GROUPERS = {"salary": SalaryCycleGrouper, "calendar": CalendarCycleGrouper.for_transactions}
+
+
+def grouper_factory(cycle, rule_set=DEFAULT_RULE_SET):
+    """Grouper factory for the cycle, using the rule set's salary category (picklable for --workers)."""
+    if cycle == "salary":
+        return functools.partial(SalaryCycleGrouper, salary_category=rule_set.policy.salary_category)
+    return GROUPERS[cycle]
+
+
+def run_batch(argv):
+    """
+    bank-analysis batch [options] PATH...: non-interactive analysis of many files
+    for scheduled runs. Returns the exit status (1 if any file failed).
+    """
+    parser = argparse.ArgumentParser(prog="bank-analysis batch")
+    parser.add_argument("paths", nargs="+", help="CSV files, or directories to scan for CSV files")
+    parser.add_argument("--out-dir", "-o", required=True, help="Directory for the outputs")
+    parser.add_argument("--format", choices=FORMATS, default="json", help="Output format per file")
+    parser.add_argument("--cycle", choices=sorted(GROUPERS), default="salary",
+                        help="Period grouping: salary cycles or calendar months")
+    parser.add_argument("--filter-atypical", action="store_true",
+                        help="Exclude atypical months from the aggregates")
+    parser.add_argument("--workers", type=int, default=1, help="Process files in this many processes")
+    parser.add_argument("--cache-dir", help="Directory for the parsed-CSV cache (enables caching)")
+    parser.add_argument("--rules", help="JSON rules config (budget policy, categories, suppliers)")
+    args = parser.parse_args(argv)
+    rule_set = load_rule_set(args.rules) if args.rules else DEFAULT_RULE_SET
+
+    sources = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            files = CsvFileDataLoader(base_path=path).list_csv_files()
+            sources.extend(os.path.join(path, f) for f in sorted(files))
+        else:
+            sources.append(path)
+    if not sources:
+        print("No CSV files found.", file=sys.stderr)
+        return 1
+
+    writer = FileReportWriter(args.out_dir, args.format)
+    batch_uc = BatchAnalysisUseCase(CsvFileDataLoader(cache_dir=args.cache_dir), writer,
+                                    grouper_factory(args.cycle, rule_set), filter_atypical=args.filter_atypical,
+                                    workers=args.workers, policy=rule_set.policy, rules=rule_set.rules)
+    start = time.perf_counter()
+    try:
+        results = batch_uc.execute(sources)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    manifest = writer.write_manifest(results, wall_seconds=time.perf_counter() - start)
+
+    for r in results:
+        stages = " ".join(f"{k}={v:.3f}s" for k, v in r.timings.items())
+        status = "ok" if r.error is None else f"FAILED {r.error}"
+        print(f"{r.source}: {r.rows} rows {stages} {status}")
+    print(f"Manifest: {manifest}")
+    return 1 if any(r.error is not None for r in results) else 0
+
+
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    sys.exit(run())
\ No newline at end of file
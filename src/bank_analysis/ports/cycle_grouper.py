@@ -1,6 +1,24 @@
-from typing import Protocol
+from typing import Iterable, List, Protocol
 from datetime import date
 
+from bank_analysis.domain.entities import Transaction
+
 class CycleGrouper(Protocol):
     def label_for_date(self, d: date) -> str:
         """Return a period label for a given date (e.g., 'YYYY-MM', or 'YYYY-MM-DD to YYYY-MM-DD')."""
+
+    def labels_for_dates(self, dates: Iterable[date]) -> List[str]:
+        """
+        Batch variant of label_for_date: label a whole column of dates at once.
+        Groupers subclassing this protocol inherit this default; override it when
+        a cheaper bulk lookup exists.
+        """
+        return [self.label_for_date(d) for d in dates]
+
+
+    def extended_with(self, txns: Iterable[Transaction]) -> "CycleGrouper":
+        """
+        Grouper to use once txns are appended to the dataset this grouper was built for.
+        Groupers whose periods do not depend on the data (calendar months) return self.
+        """
+        return self
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Sequence
+
+from bank_analysis.domain.entities import Transaction
+
+TRANSACTION_FIELDS = ("date_op", "month", "category", "category_parent", "amount",
+                      "message", "supplier", "account")
+
+
+class ExporterPort(ABC):
+    """
+    Abstract port for writing rows to a file, one row at a time.
+    stores_records is False for transaction-only formats, whose write_records() raises.
+    """
+    stores_records = True
+
+    @abstractmethod
+    def write_records(self, path: str, fields: Sequence[str], rows: Iterable[Sequence]) -> int:
+        """
+        Write rows (value tuples in 'fields' order) to path, consuming the iterable
+        incrementally. Returns the number of rows written.
+        """
+        raise NotImplementedError
+
+    def write_transactions(self, path: str, transactions: Iterable[Transaction]) -> int:
+        """
+        Write transactions (TRANSACTION_FIELDS, dates in ISO format).
+        The default goes through write_records(); columnar adapters may override it.
+        """
+        rows = ((tx.date_op.isoformat(), tx.month, tx.category, tx.category_parent, float(tx.amount),
+                 tx.message, getattr(tx, "supplier", ""), getattr(tx, "account", ""))
+                for tx in transactions)
+        return self.write_records(path, TRANSACTION_FIELDS, rows)
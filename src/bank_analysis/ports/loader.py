@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Sequence
+from typing import Iterator, List, Optional, Sequence
 from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
 
 class DataLoaderPort(ABC):
     """Abstract port for loading transaction data in domain form."""
@@ -17,3 +18,26 @@ class DataLoaderPort(ABC):
         date_op (date), month (YYYY-MM), category, category_parent, amount (float).
         """
         raise NotImplementedError
+
+    def iter_transactions(self, source: str) -> Iterator[Transaction]:
+        """
+        Yield normalized transactions one by one, without materializing the full list.
+        Adapters able to read their source incrementally should override this;
+        the default simply iterates over load_and_prepare().
+        """
+        return iter(self.load_and_prepare(source))
+
+    def load_table(self, source: str) -> TransactionTable:
+        """
+        Return the transactions as a columnar TransactionTable.
+        The default builds the table from iter_transactions(), so no intermediate
+        list of Transaction objects is kept.
+        """
+        return TransactionTable.from_transactions(self.iter_transactions(source))
+
+    def load_parallel(self, source: str, workers: Optional[int] = None) -> TransactionTable:
+        """
+        Return the transactions as a TransactionTable, parsing the source with up to
+        'workers' processes where the adapter supports it (default: load_table()).
+        """
+        return self.load_table(source)
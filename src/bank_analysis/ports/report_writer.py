@@ -0,0 +1,12 @@
+from typing import List, Optional, Protocol, Sequence
+
+from ..domain.value_objects import BatchFileResult, FileAnalysis
+
+class ReportWriterPort(Protocol):
+    """Port for machine-readable outputs of batch runs."""
+    def plan(self, sources: Sequence[str]) -> None:
+        """Reserve distinct outputs for a run's sources; raises ValueError if that is impossible."""
+        ...
+    def write(self, analysis: FileAnalysis) -> List[str]: ...
+    def write_manifest(self, results: Sequence[BatchFileResult],
+                       wall_seconds: Optional[float] = None) -> str: ...
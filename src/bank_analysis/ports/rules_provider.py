@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List
+
+from bank_analysis.domain.reporting.rule_set import DEFAULT_RULE_SET, RuleSet
+
+
+class RulesProviderPort(ABC):
+    """Abstract port supplying the rule set in force, possibly changing over time."""
+
+    def __init__(self) -> None:
+        self._listeners: List[Callable[[RuleSet, RuleSet], None]] = []
+
+    @abstractmethod
+    def current(self) -> RuleSet:
+        """The rule set to use now (adapters may reload it here)."""
+        raise NotImplementedError
+
+    def on_change(self, listener: Callable[[RuleSet, RuleSet], None]) -> None:
+        """Call listener(old, new) whenever current() starts returning a new version."""
+        self._listeners.append(listener)
+
+    def _notify(self, old: RuleSet, new: RuleSet) -> None:
+        for listener in list(self._listeners):
+            listener(old, new)
+
+
+class StaticRulesProvider(RulesProviderPort):
+    """Fixed rule set (the built-in defaults unless given)."""
+
+    def __init__(self, rule_set: RuleSet = DEFAULT_RULE_SET) -> None:
+        super().__init__()
+        self._rule_set = rule_set
+
+    def current(self) -> RuleSet:
+        return self._rule_set
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from bank_analysis.domain.value_objects import BreakdownKind, CategoryBreakdown, MonthlySummary
+from bank_analysis.ports.cycle_grouper import CycleGrouper
+
+
+class TransactionRepository(ABC):
+    """
+    Port for a persistent, queryable store of transactions.
+    Transactions are grouped in named datasets (e.g. one per upload digest or account),
+    so a single store can serve many users and keep years of history.
+    Query results match the in-memory domain functions they mirror.
+    """
+
+    @abstractmethod
+    def add_many(self, dataset: str, transactions: Iterable[Transaction]) -> int:
+        """Append transactions to a dataset; returns the number of rows inserted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_dataset(self, dataset: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_dataset(self, dataset: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def transactions(self, dataset: str, period: Optional[str] = None) -> List[Transaction]:
+        """Transactions of the dataset (optionally of one period), in insertion order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def monthly_summary(
+        self,
+        dataset: str,
+        cycle_grouper: CycleGrouper,
+        policy: BudgetPolicy = DEFAULT_POLICY,
+    ) -> List[MonthlySummary]:
+        """
+        Same rows as summary.compute_monthly_summary_core over the dataset. Totals are
+        equal after rounding to cents: adapters may sum in another order, so the
+        unrounded float sums can differ in the last bits.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def category_breakdown(
+        self,
+        dataset: str,
+        period: Optional[str] = None,
+        policy: BudgetPolicy = DEFAULT_POLICY,
+    ) -> List[CategoryBreakdown]:
+        """
+        Same rows as breakdown.compute_category_breakdown over the dataset (or one
+        period), totals equal after rounding to cents (see monthly_summary).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def filter_transactions(
+        self,
+        dataset: str,
+        period: str,
+        label: str,
+        kind: BreakdownKind,
+    ) -> List[Transaction]:
+        """Same rows as filtering.filter_transactions_by_period_label_and_kind."""
+        raise NotImplementedError
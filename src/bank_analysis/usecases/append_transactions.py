@@ -0,0 +1,17 @@
+from typing import Iterable
+
+from ..domain.entities import Transaction
+from ..domain.incremental import IncrementalAnalysis
+from ..domain.value_objects import AppendResult
+
+
+class AppendTransactionsUseCase:
+    """
+    Append a new statement to an analysed dataset: rows already present are
+    skipped and only the periods touched by the new rows are recomputed.
+    """
+    def __init__(self, analysis: IncrementalAnalysis):
+        self.analysis = analysis
+
+    def execute(self, transactions: Iterable[Transaction]) -> AppendResult:
+        return self.analysis.append(transactions)
@@ -1,14 +1,15 @@
 from typing import List, Sequence
 from ..domain.reporting import breakdown
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
 from ..domain.value_objects import CategoryBreakdown
 from ..domain.entities import Transaction
 
 
 class ComputeCategoryBreakdownUseCase:
-    def __init__(self):
-      pass
+    def __init__(self, policy: BudgetPolicy = DEFAULT_POLICY):
+      self.policy = policy
 
     def execute(self, transactions: Sequence[Transaction]) -> List[CategoryBreakdown]:
         if transactions is None or len(transactions) == 0:
             raise ValueError("transactions is None or empty. Cannot compute category breakdown.")
-        return breakdown.compute_category_breakdown(transactions)
+        return breakdown.compute_category_breakdown(transactions, policy=self.policy)
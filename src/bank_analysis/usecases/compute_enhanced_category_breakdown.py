@@ -1,14 +1,18 @@
 from typing import List, Sequence
 from ..domain.reporting import enhanced_breakdown
+from ..domain.reporting.category_rules import CategoryRules, DEFAULT_CATEGORY_RULES
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
 from ..domain.value_objects import CategoryBreakdown
 from ..domain.entities import Transaction
 
 
 class ComputeEnhancedCategoryBreakdownUseCase:
-    def __init__(self):
-      pass
+    def __init__(self, policy: BudgetPolicy = DEFAULT_POLICY,
+                 rules: CategoryRules = DEFAULT_CATEGORY_RULES):
+      self.policy = policy
+      self.rules = rules
 
     def execute(self, transactions: Sequence[Transaction]) -> List[CategoryBreakdown]:
         if transactions is None or len(transactions) == 0:
             raise ValueError("transactions is None or empty. Cannot compute category breakdown.")
-        return enhanced_breakdown.compute_category_breakdown(transactions)
+        return enhanced_breakdown.compute_category_breakdown(transactions, self.policy, self.rules)
@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from ..domain.entities import Transaction
+from ..domain.reporting import fused
+from ..domain.value_objects import FusedReports
+from ..ports.cycle_grouper import CycleGrouper
+
+
+class ComputeFusedReportsUseCase:
+    def __init__(self, cycle_grouper: CycleGrouper):
+        self.cycle_grouper = cycle_grouper
+
+    def execute(self, transactions: Sequence[Transaction]) -> FusedReports:
+        if transactions is None or len(transactions) == 0:
+            raise ValueError("transactions is None or empty. Cannot compute reports.")
+        return fused.compute_fused_reports(transactions, cycle_grouper=self.cycle_grouper)
@@ -1,19 +1,31 @@
-from typing import Sequence
+from typing import Iterable
 from ..domain.reporting import summary
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
 from ..domain.value_objects import MonthlySummary
 from ..domain.entities import Transaction
 from ..ports.cycle_grouper import CycleGrouper
 
+ENGINES = {
+    "rowwise": summary.compute_monthly_summary_core,
+    "vectorized": summary.compute_monthly_summary_vectorized,
+}
+
 
 class ComputeMonthlySummaryUseCase:
     def __init__(self,
-                 cycle_grouper: CycleGrouper
+                 cycle_grouper: CycleGrouper,
+                 engine: str = "rowwise",
+                 policy: BudgetPolicy = DEFAULT_POLICY
     ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown summary engine '{engine}'. Expected one of: {', '.join(ENGINES)}.")
         self.cycle_grouper = cycle_grouper
+        self.engine = engine
+        self.policy = policy
 
     def execute(self,
-        txns: Sequence[Transaction]
+        txns: Iterable[Transaction]
     ) -> list[MonthlySummary]:
-      return summary.compute_monthly_summary_core(txns,
-                                                  cycle_grouper=self.cycle_grouper)
-
+      return ENGINES[self.engine](txns,
+                                  cycle_grouper=self.cycle_grouper,
+                                  policy=self.policy)
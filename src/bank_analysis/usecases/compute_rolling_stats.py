@@ -0,0 +1,17 @@
+from typing import List, Sequence
+
+from ..domain.reporting import rolling
+from ..domain.value_objects import MonthlySummary, RollingSummary
+
+
+class ComputeRollingStatsUseCase:
+    def __init__(self, window: int = 3, percentiles: Sequence[float] = rolling.DEFAULT_PERCENTILES):
+        if window < 1:
+            raise ValueError("Rolling window must be at least 1 period.")
+        self.window = window
+        self.percentiles = tuple(percentiles)
+
+    def execute(self, summary: Sequence[MonthlySummary]) -> List[RollingSummary]:
+        if summary is None:
+            raise ValueError("Summary cannot be None.")
+        return rolling.compute_rolling_stats(summary, self.window, self.percentiles)
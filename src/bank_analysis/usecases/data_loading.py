@@ -1,5 +1,7 @@
-from typing import Sequence
+from itertools import chain
+from typing import Iterator, Sequence
 from ..domain.entities import Transaction
+from ..domain.transaction_table import TransactionTable
 from ..ports.loader import DataLoaderPort
 
 class DataLoadingUseCase:
@@ -13,3 +15,25 @@ class DataLoadingUseCase:
         if len(transactions) == 0:
             raise ValueError("Loaded content is empty.")
         return transactions
+
+    def stream(self, csv_path: str) -> Iterator[Transaction]:
+        """
+        Streaming variant of execute(): yields transactions as the loader reads them,
+        so consumers that only need a single pass never hold the full list in memory.
+        The first row is read eagerly, so empty content raises here like execute().
+        """
+        if not csv_path:
+            raise ValueError("CSV path cannot be empty.")
+        rows = iter(self.loader.iter_transactions(csv_path))
+        for first in rows:
+            return chain((first,), rows)
+        raise ValueError("Loaded content is empty.")
+
+    def execute_table(self, csv_path: str) -> TransactionTable:
+        """Columnar variant of execute(): the loader fills a TransactionTable directly."""
+        if not csv_path:
+            raise ValueError("CSV path cannot be empty.")
+        table = self.loader.load_table(csv_path)
+        if len(table) == 0:
+            raise ValueError("Loaded content is empty.")
+        return table
@@ -1,11 +1,42 @@
+from dataclasses import fields
+from enum import Enum
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from ..domain.entities import Transaction
+from ..domain.value_objects import CategoryBreakdown, MonthlySummary
+from ..ports.exporter import ExporterPort
+
+
+def _dto_rows(rows: Iterable, names: Sequence[str]) -> Iterator[tuple]:
+    for row in rows:
+        yield tuple(v.value if isinstance(v, Enum) else v for v in (getattr(row, n) for n in names))
+
+
 class ExportUseCase:
-    def __init__(self):
-        pass
-
-    def execute(self, export_paths, summary, category_breakdown) -> None:
-      # Optional export
-      if export_paths and export_paths.get("summary"):
-        summary.to_csv(export_paths["summary"], index=False, sep=";")
-      if export_paths and export_paths.get(
-          "breakdown") and category_breakdown is not None:
-        category_breakdown.to_csv(export_paths["breakdown"], index=False, sep=";")
\ No newline at end of file
+    """
+    Export the analysis results (monthly summary, category breakdown) or the
+    transactions themselves through an exporter, which writes rows as they are
+    produced: nothing is materialized beyond the sequences passed in.
+    """
+    def __init__(self, exporter: ExporterPort):
+        self.exporter = exporter
+
+    def execute(self, export_paths: Optional[dict], summary: Sequence[MonthlySummary],
+                category_breakdown: Optional[Sequence[CategoryBreakdown]]) -> Dict[str, int]:
+        """Write 'summary' and 'breakdown' to the paths given; returns rows written per key."""
+        written: Dict[str, int] = {}
+        if export_paths and export_paths.get("summary"):
+            names = [f.name for f in fields(MonthlySummary)]
+            written["summary"] = self.exporter.write_records(
+                export_paths["summary"], names, _dto_rows(summary, names))
+        if export_paths and export_paths.get("breakdown") and category_breakdown is not None:
+            names = [f.name for f in fields(CategoryBreakdown)]
+            written["breakdown"] = self.exporter.write_records(
+                export_paths["breakdown"], names, _dto_rows(category_breakdown, names))
+        return written
+
+    def export_transactions(self, path: str, transactions: Iterable[Transaction]) -> int:
+        """Stream transactions (a list, table or generator) to path; returns rows written."""
+        if not path:
+            raise ValueError("Export path cannot be empty.")
+        return self.exporter.write_transactions(path, transactions)
@@ -1,9 +1,14 @@
-from typing import List
+from typing import List, Mapping, Optional, Sequence
 from ..domain.reporting import filtering
-from ..domain.value_objects import MonthlySummary, FilteredSummary
+from ..domain.reporting.outliers import DEFAULT_OUTLIER_POLICY, OutlierPolicy
+from ..domain.value_objects import CategoryBreakdown, MonthlySummary, FilteredSummary
 
 class FilterAtypicalMonthsUseCase:
-    def execute(self, monthly_summary: List[MonthlySummary]) -> FilteredSummary:
+    def __init__(self, policy: OutlierPolicy = DEFAULT_OUTLIER_POLICY):
+        self.policy = policy
+
+    def execute(self, monthly_summary: List[MonthlySummary],
+                period_breakdowns: Optional[Mapping[str, Sequence[CategoryBreakdown]]] = None) -> FilteredSummary:
         if not monthly_summary:
             raise ValueError("Monthly summary list is empty.")
-        return filtering.filter_atypical_months(monthly_summary)
+        return filtering.filter_atypical_months(monthly_summary, self.policy, period_breakdowns)
@@ -2,6 +2,7 @@ from typing import List
 
 from ..domain.entities import Transaction
 from ..domain.reporting import filtering
+from ..domain.transaction_index import TransactionIndex
 from ..domain.value_objects import BreakdownKind
 
 
@@ -14,3 +15,13 @@ class FilterTransactionsUseCase:
         if not transactions:
             raise ValueError(" no transactions provided")
         return filtering.filter_transactions_by_period_label_and_kind(transactions, period, label, kind)
+
+    def execute_indexed(self,
+        index: TransactionIndex,
+        period: str,
+        label: str,
+        kind: BreakdownKind) -> list[Transaction]:
+        """Same result as execute(), answered from a prebuilt TransactionIndex."""
+        if index is None or not index.transactions:
+            raise ValueError(" no transactions provided")
+        return index.filter(period, label, kind)
@@ -2,6 +2,7 @@
 from typing import Optional
 from .compute_aggregates import ComputeAggregatesUseCase
 from .compute_category_breakdown import ComputeCategoryBreakdownUseCase
+from .compute_fused_reports import ComputeFusedReportsUseCase
 from .compute_monthly_summary import ComputeMonthlySummaryUseCase
 from .data_loading import DataLoadingUseCase
 from .filter_atypical_months import FilterAtypicalMonthsUseCase
@@ -18,7 +19,13 @@ class FullGlobalAnalysisUseCase:
     def run_full_analysis(self, csv_path: str,
                           do_filter_atypical: bool = False,
                           show_category_breakdown: bool = False,
-                          export_paths: Optional[dict] = None) -> dict:
+                          export_paths: Optional[dict] = None,
+                          fused: bool = False) -> dict:
+        """
+        fused=True computes the summary, the global breakdown and the per-period
+        plain/enhanced breakdowns in a single scan; the result then also carries
+        'period_breakdowns' and 'period_enhanced_breakdowns'.
+        """
 
         data_loader_uc = DataLoadingUseCase(self.loader)
         monthly_summary_uc = ComputeMonthlySummaryUseCase(self.cycle_grouper)
@@ -26,8 +33,18 @@ class FullGlobalAnalysisUseCase:
         aggregates_uc = ComputeAggregatesUseCase()
         category_breakdown_uc = ComputeCategoryBreakdownUseCase()
 
-        transactions = data_loader_uc.execute(csv_path)
-        monthly_summary = monthly_summary_uc.execute(transactions)
+        fused_reports = None
+        if fused:
+            transactions = data_loader_uc.execute(csv_path)
+            fused_reports = ComputeFusedReportsUseCase(self.cycle_grouper).execute(transactions)
+            monthly_summary = fused_reports.monthly_summary
+        elif show_category_breakdown:
+            transactions = data_loader_uc.execute(csv_path)
+            monthly_summary = monthly_summary_uc.execute(transactions)
+        else:
+            # The summary alone needs a single pass: stream rows without materializing them
+            transactions = None
+            monthly_summary = monthly_summary_uc.execute(data_loader_uc.stream(csv_path))
 
         if do_filter_atypical:
             filtered_summary_result  = filter_uc.execute(monthly_summary)
@@ -40,12 +57,19 @@ class FullGlobalAnalysisUseCase:
         aggregates = aggregates_uc.execute(filtered_summary)
         category_breakdown = None
         if show_category_breakdown:
-            category_breakdown = category_breakdown_uc.execute(transactions)
+            if fused_reports is not None:
+                category_breakdown = fused_reports.category_breakdown
+            else:
+                category_breakdown = category_breakdown_uc.execute(transactions)
 
-        return {
+        result = {
             "monthly_summary": monthly_summary,
             "filtered_summary": filtered_summary,
             "excluded_months": excluded_months,
             "aggregates": aggregates,
             "category_breakdown": category_breakdown
         }
+        if fused_reports is not None:
+            result["period_breakdowns"] = fused_reports.period_breakdowns
+            result["period_enhanced_breakdowns"] = fused_reports.period_enhanced_breakdowns
+        return result
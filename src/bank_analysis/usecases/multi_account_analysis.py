@@ -0,0 +1,45 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+from ..domain.entities import Transaction
+from ..domain.reporting import fused
+from ..domain.reporting.category_rules import CategoryRules, DEFAULT_CATEGORY_RULES
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from ..domain.transfers import cancel_internal_transfers
+from ..domain.value_objects import MultiAccountReports
+from ..ports.cycle_grouper import CycleGrouper
+
+
+class MultiAccountAnalysisUseCase:
+    """
+    Per-account and consolidated reports over transactions from several accounts.
+    Every report uses the same cycle grouper, so periods line up across accounts
+    (e.g. salary periods from the current account also split the savings account).
+    The consolidated reports drop transfers between the analysed accounts.
+    """
+    def __init__(self, cycle_grouper: CycleGrouper, policy: BudgetPolicy = DEFAULT_POLICY,
+                 transfer_max_days: int = 3, rules: CategoryRules = DEFAULT_CATEGORY_RULES):
+        self.cycle_grouper = cycle_grouper
+        self.policy = policy
+        self.rules = rules
+        self.transfer_max_days = transfer_max_days
+
+    def execute(self, transactions: Sequence[Transaction]) -> MultiAccountReports:
+        if transactions is None or len(transactions) == 0:
+            raise ValueError("transactions is None or empty. Cannot compute reports.")
+        rows = list(transactions)
+
+        by_account: Dict[str, List[Transaction]] = defaultdict(list)
+        for t in rows:
+            by_account[getattr(t, "account", "")].append(t)
+        accounts = {
+            account: fused.compute_fused_reports(txns, self.cycle_grouper, self.policy, self.rules)
+            for account, txns in sorted(by_account.items())
+        }
+
+        kept, cancelled = cancel_internal_transfers(rows, self.policy, self.transfer_max_days)
+        return MultiAccountReports(
+            accounts=accounts,
+            consolidated=fused.compute_fused_reports(kept, self.cycle_grouper, self.policy, self.rules),
+            cancelled_transfers=cancelled,
+        )
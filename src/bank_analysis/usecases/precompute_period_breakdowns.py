@@ -0,0 +1,34 @@
+from typing import Dict, List, Sequence, Tuple
+
+from ..domain.entities import Transaction
+from ..domain.reporting import fused
+from ..domain.reporting.category_rules import CategoryRules, DEFAULT_CATEGORY_RULES
+from ..domain.reporting.policies import BudgetPolicy, DEFAULT_POLICY
+from ..domain.value_objects import CategoryBreakdown
+from ..ports.cycle_grouper import CycleGrouper
+
+BREAKDOWN_STYLES = ("standard", "enhanced")
+
+
+class PrecomputePeriodBreakdownsUseCase:
+    """
+    Build the breakdown of every period, for every breakdown style, in one scan.
+    Returns a mapping (breakdown_style, period label) -> rows, so serving a
+    period's details is a dictionary lookup.
+    """
+    def __init__(self, cycle_grouper: CycleGrouper, policy: BudgetPolicy = DEFAULT_POLICY,
+                 rules: CategoryRules = DEFAULT_CATEGORY_RULES):
+        self.cycle_grouper = cycle_grouper
+        self.policy = policy
+        self.rules = rules
+
+    def execute(self, transactions: Sequence[Transaction]) -> Dict[Tuple[str, str], List[CategoryBreakdown]]:
+        if transactions is None or len(transactions) == 0:
+            raise ValueError("transactions is None or empty. Cannot precompute breakdowns.")
+        reports = fused.compute_fused_reports(transactions, self.cycle_grouper, self.policy, self.rules)
+        out: Dict[Tuple[str, str], List[CategoryBreakdown]] = {}
+        for period, rows in reports.period_breakdowns.items():
+            out[("standard", period)] = rows
+        for period, rows in reports.period_enhanced_breakdowns.items():
+            out[("enhanced", period)] = rows
+        return out
@@ -0,0 +1,105 @@
+import io
+from datetime import date
+
+from bank_analysis.adapters.analysis_cache import CachedAnalysis, ContentAddressedCache, HashingReader
+from bank_analysis.adapters.csv_content_loader import CsvContentDataLoader
+from bank_analysis.adapters.result_in_memory_store import InMemoryResultStore
+from bank_analysis.domain.entities import Transaction
+
+CSV = "dateOp;category;categoryParent;amount\n2025-01-10;Groceries;Essentials;-21,70\n"
+
+
+class CountingLoader(CsvContentDataLoader):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def load_and_prepare(self, source):
+        self.calls += 1
+        return super().load_and_prepare(source)
+
+
+def test_digest_depends_on_content_and_options():
+    d = ContentAddressedCache.digest
+    assert d(CSV, loader="a") == d(CSV.encode("utf-8"), loader="a")
+    assert d(CSV, loader="a") != d(CSV, loader="b")
+    assert d(CSV, loader="a") != d(CSV + "\n", loader="a")
+
+
+def test_same_upload_is_parsed_once_and_derived_results_are_memoized():
+    cache = ContentAddressedCache()
+    loader = CountingLoader()
+    digest = ContentAddressedCache.digest(CSV, loader="csv")
+
+    first = cache.get_or_load(digest, lambda: loader.load_and_prepare(CSV))
+    second = cache.get_or_load(digest, lambda: loader.load_and_prepare(CSV))
+    assert first is second
+    assert loader.calls == 1
+    assert first.transactions[0].amount == -21.70
+
+    computed = []
+    def compute():
+        computed.append(1)
+        return len(first.transactions)
+    assert first.derived(("summary", "calendar"), compute) == 1
+    assert second.derived(("summary", "calendar"), compute) == 1
+    assert computed == [1]
+
+
+def test_concurrent_first_uses_of_a_derived_key_compute_once():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+
+    analysis = CachedAnalysis("d", [])
+    release, calls = Event(), []
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "summary"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(analysis.derived, ("summary", "v1"), compute) for _ in range(4)]
+        release.set()
+        assert [f.result() for f in futures] == ["summary"] * 4
+    assert calls == [1]
+
+    analysis.derived(("summary", "v2"), lambda: "new")
+    analysis.discard_derived(lambda k: k[-1] == "v1")
+    assert analysis.derived_keys() == [("summary", "v2")]
+
+
+def test_cache_is_size_bounded():
+    cache = ContentAddressedCache(InMemoryResultStore(max_sessions=1))
+    tx = [Transaction(date_op=date(2025, 1, 1), month="2025-01", category="c", category_parent="p", amount=-1.0, message="m")]
+    cache.get_or_load("a", lambda: tx)
+    cache.get_or_load("b", lambda: tx)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_streamed_upload_is_hashed_while_parsed():
+    cache = ContentAddressedCache()
+    hasher = ContentAddressedCache.hasher(loader="a")
+    reader = HashingReader(io.BytesIO(CSV.encode("utf-8")), hasher)
+    txns = CsvContentDataLoader().load_table(reader)
+    digest = reader.hexdigest()
+    assert digest == ContentAddressedCache.digest(CSV, loader="a")
+    assert reader.size == len(CSV.encode("utf-8"))
+
+    entry = cache.add(digest, txns)
+    assert len(entry.transactions) == 1
+    # An existing entry wins, keeping its derived results
+    assert cache.add(digest, []) is entry
+    assert cache.get_or_load(digest, lambda: []) is entry
+
+
+def test_derived_results_are_reaccounted_in_the_store():
+    store = InMemoryResultStore(size_of=lambda entry: 10 * (1 + len(entry.derived_keys())))
+    cache = ContentAddressedCache(store)
+    analysis = cache.get_or_load("d", lambda: [])
+    assert store.stats()["bytes"] == 10
+    analysis.derived(("summary", "v1"), lambda: [])
+    assert store.stats()["bytes"] == 20
+    analysis.discard_derived(lambda k: True)
+    assert store.stats()["bytes"] == 10
@@ -0,0 +1,98 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.adapters.file_report_writer import FileReportWriter
+from bank_analysis.domain.reporting.fused import compute_fused_reports
+from bank_analysis.entrypoints.cli import run
+from bank_analysis.usecases.batch_analysis import BatchAnalysisUseCase
+
+CSV = (
+    "dateOp;label;category;categoryParent;supplierFound;amount\n"
+    "2024-05-25;\"SALAIRE\";\"Salaire fixe\";\"Revenus\";\"\";3000,00\n"
+    "2024-05-26;\"LIDL\";\"Alimentation\";\"Vie quotidienne\";\"lidl\";-80,00\n"
+    "2024-06-02;\"LOYER\";\"Loyers, charges\";\"Logement\";\"\";-900,00\n"
+)
+
+
+def _write_inputs(tmp_path: Path) -> Path:
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    (inputs / "a.csv").write_text(CSV, encoding="utf-8")
+    (inputs / "b.csv").write_text(CSV.replace("-80,00", "-95,50"), encoding="utf-8")
+    (inputs / "empty.csv").write_text("dateOp;amount\n", encoding="utf-8")
+    return inputs
+
+
+def test_batch_use_case_writes_json_per_file_and_reports_failures(tmp_path: Path):
+    inputs = _write_inputs(tmp_path)
+    writer = FileReportWriter(str(tmp_path / "out"), "json")
+    uc = BatchAnalysisUseCase(CsvFileDataLoader(), writer, CalendarCycleGrouper.for_transactions, workers=2)
+    results = uc.execute([str(inputs / n) for n in ("a.csv", "b.csv", "empty.csv")])
+
+    a, b, empty = results
+    assert (a.rows, a.error) == (3, None)
+    assert set(a.timings) == {"load", "analyze", "write", "total"}
+    assert empty.rows == 0 and "empty" in empty.error and empty.outputs == []
+
+    doc = json.loads(Path(a.outputs[0]).read_text(encoding="utf-8"))
+    txns = CsvFileDataLoader().load_and_prepare(str(inputs / "a.csv"))
+    expected = compute_fused_reports(txns, CalendarCycleGrouper())
+    assert [row["month"] for row in doc["monthly_summary"]] == ["2024-05", "2024-06"]
+    assert doc["monthly_summary"][0]["total_expenses"] == expected.monthly_summary[0].total_expenses
+    assert {row["kind"] for row in doc["period_enhanced_breakdowns"]["2024-06"]} == {"MANDATORY"}
+
+    manifest = json.loads(Path(writer.write_manifest(results)).read_text(encoding="utf-8"))
+    assert (manifest["files"], manifest["failed"], manifest["rows"]) == (3, 1, 6)
+
+
+def test_cli_batch_scans_directories_and_writes_csv(tmp_path: Path, capsys):
+    inputs = _write_inputs(tmp_path)
+    out = tmp_path / "out"
+    status = run(["batch", str(inputs), "-o", str(out), "--format", "csv",
+                  "--cycle", "calendar", "--filter-atypical"])
+
+    assert status == 1  # empty.csv failed, the other files were still written
+    assert sorted(p.name for p in out.iterdir()) == [
+        "a.breakdown.csv", "a.summary.csv", "b.breakdown.csv", "b.summary.csv", "batch_report.json"]
+    with open(out / "a.summary.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f, delimiter=";"))
+    assert rows[0][-1] == "excluded"
+    assert [(r[0], r[-1]) for r in rows[1:]] == [("2024-05", "0"), ("2024-06", "1")]
+    assert "a.csv: 3 rows load=" in capsys.readouterr().out
+
+
+def test_batch_outputs_of_same_named_files_do_not_collide(tmp_path: Path):
+    for d in ("a", "b"):
+        (tmp_path / d).mkdir()
+        (tmp_path / d / "export.csv").write_text(CSV, encoding="utf-8")
+    out = tmp_path / "out"
+    status = run(["batch", str(tmp_path / "a"), str(tmp_path / "b"), "-o", str(out), "--cycle", "calendar"])
+
+    assert status == 0
+    assert sorted(p.name for p in out.iterdir()) == ["a__export.json", "b__export.json", "batch_report.json"]
+
+    writer = FileReportWriter(str(out))
+    same = str(tmp_path / "a" / "export.csv")
+    for sources in ([same, same], [same, str(tmp_path / "a" / "." / "export.csv")]):
+        with pytest.raises(ValueError):
+            writer.plan(sources)
+
+
+def test_cli_batch_groups_salary_cycles_on_the_rules_salary_category(tmp_path: Path):
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    (inputs / "a.csv").write_text(CSV.replace("Salaire fixe", "Paie"), encoding="utf-8")
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({"policy": {"salary_category": "Paie"}}), encoding="utf-8")
+    out = tmp_path / "out"
+
+    for workers in ("1", "2"):
+        assert run(["batch", str(inputs), "-o", str(out), "--rules", str(rules), "--workers", workers]) == 0
+        doc = json.loads((out / "a.json").read_text(encoding="utf-8"))
+        assert [(row["month"], row["total_salary"]) for row in doc["monthly_summary"]] == [
+            ("2024-05-25 to 2024-06-02", 3000.0)]
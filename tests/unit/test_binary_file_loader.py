@@ -0,0 +1,90 @@
+import dataclasses
+import struct
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters.binary_file_loader import BinaryFileDataLoader, append_binary_file, write_binary_file
+from bank_analysis.adapters.binary_table_codec import BinaryFormatError
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.entrypoints.cli import run
+
+CSV = (
+    "dateOp;label;category;categoryParent;supplierFound;amount\n"
+    "2024-07-31;\"CARTE TOTO\";\"Bien-être\";\"Vie quotidienne\";\"yves rocher\";-49,40\n"
+    "2024-08-01;\"VIR INST\";\"Virements reçus\";\"Virements reçus\";\"\";266,00\n"
+    "2024-08-02;\"PRLV\";\"Bien-être\";\"Vie quotidienne\";\"yves rocher\";-0,10\n"
+)
+
+
+def test_convert_then_load_round_trips(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    expected = list(CsvFileDataLoader().load_and_prepare(str(csv_path)))
+
+    out = str(tmp_path / "export.batx")
+    # Tiny row groups: dictionaries are shared across groups, deltas only
+    assert write_binary_file(out, iter(expected), row_group_size=2) == 3
+
+    loader = BinaryFileDataLoader(base_path=str(tmp_path))
+    assert loader.list_csv_files() == ["export.batx"]
+    table = loader.load_table(out)
+    assert list(table) == expected
+    assert table.supplier_dict.values == ["yves rocher", ""]
+    assert list(loader.iter_transactions(out)) == expected
+
+    # A table source is written as-is, group by group
+    write_binary_file(out, table, row_group_size=1)
+    assert list(loader.load_and_prepare(out)) == expected
+
+
+def test_cli_convert(tmp_path: Path, capsys):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    out = tmp_path / "export.batx"
+
+    run(["--csv", str(csv_path), "--convert", str(out)])
+
+    assert "Wrote 3 transactions" in capsys.readouterr().out
+    assert len(BinaryFileDataLoader().load_table(str(out))) == 3
+
+
+def test_append_extends_the_file_in_place(tmp_path: Path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    txns = list(CsvFileDataLoader().load_and_prepare(str(csv_path)))
+    out = str(tmp_path / "history.batx")
+    write_binary_file(out, txns[:2])
+    before = Path(out).read_bytes()
+
+    assert append_binary_file(out, txns[2:]) == 1
+    assert append_binary_file(out, [dataclasses.replace(txns[0], category="Nouveau")]) == 1
+
+    after = Path(out).read_bytes()
+    assert after[:len(before) - 9] == before[:-9]  # only the end marker was overwritten
+    table = BinaryFileDataLoader().load_table(out)
+    assert list(table)[:3] == txns
+    assert table[3].category == "Nouveau"
+
+    # Older format versions are left untouched (the CLI rewrites them instead)
+    old = b"BATX" + struct.pack("<HH", 1, 0) + after[8:]
+    Path(out).write_bytes(old)
+    with pytest.raises(BinaryFormatError):
+        append_binary_file(out, txns[:1])
+    assert Path(out).read_bytes() == old
+
+
+def test_cli_append_writes_only_the_new_rows(tmp_path: Path, monkeypatch, capsys):
+    history = tmp_path / "history.csv"
+    history.write_text(CSV, encoding="utf-8")
+    out = tmp_path / "history.batx"
+    run(["--csv", str(history), "--convert", str(out)])
+    statement = tmp_path / "new.csv"
+    statement.write_text(CSV + "2024-08-25;\"SALAIRE\";\"Salaire fixe\";\"Revenus\";\"\";3000,00\n",
+                         encoding="utf-8")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "n")
+
+    run(["--csv", str(out), "--append", str(statement)])
+
+    assert "Appended 1 transactions" in capsys.readouterr().out
+    assert [t.amount for t in BinaryFileDataLoader().load_table(str(out))] == [-49.40, 266.0, -0.10, 3000.0]
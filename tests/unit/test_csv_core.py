@@ -0,0 +1,53 @@
+import io
+from pathlib import Path
+
+from bank_analysis.adapters.csv_content_loader import CsvContentDataLoader
+from bank_analysis.adapters.csv_core import iter_decoded_lines, iter_records
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+
+CSV = (
+    "\ufeffdateOp;label;category;categoryParent;supplierFound;amount\r\n"
+    '2024-07-31;"CARTE; TOTO";"Bien-être";"Vie quotidienne";"yves rocher";-49,40\r\n'
+    '"2024-08-01";"VIR\nINST";"Virements reçus";"Virements reçus";"";"1\xa0266,00"\r\n'
+)
+
+
+def test_every_source_kind_parses_the_same(tmp_path: Path):
+    path = tmp_path / "export.csv"
+    path.write_text(CSV, encoding="utf-8")
+    data = CSV.encode("utf-8")
+
+    expected = list(iter_records(path))
+    assert len(expected) == 2 and expected[1][4] == 1266.0
+    for source in (CSV, data, bytearray(data), io.BytesIO(data),
+                   io.StringIO(CSV, newline=""), CSV.splitlines(keepends=True)):
+        assert list(iter_records(source)) == expected
+
+    stream = io.BytesIO(data)
+    list(iter_records(stream))
+    assert not stream.closed
+    assert CsvContentDataLoader().load_and_prepare(CSV) == CsvFileDataLoader().load_and_prepare(str(path))
+
+
+def test_content_loader_detects_comma_delimiter_and_quoted_header():
+    text = '"dateOp","amount","label"\n"2025-01-02","-1.5","x"\n'
+    txns = CsvContentDataLoader().load_and_prepare(text)
+    assert [(t.amount, t.message) for t in txns] == [(-1.5, "x")]
+
+
+def test_content_loader_parallel_matches_sequential():
+    text = CSV + "".join(CSV.splitlines(keepends=True)[1:]) * 40
+    sequential = CsvContentDataLoader().load_table(text)
+    parallel = CsvContentDataLoader(workers=2, parallel_min_bytes=0).load_and_prepare(text)
+    assert len(parallel) == 82
+    assert list(parallel) == list(sequential)
+
+
+def test_decoded_lines_survive_chunk_boundaries():
+    data = ("\ufeff" + "dateOp;amount;label\r\n2025-01-02;-1,5;\"é\nü\"\r\n2025-01-03;2,0;€").encode("utf-8")
+    for chunk_size in (1, 2, 3, 7, 1 << 16):
+        lines = list(iter_decoded_lines(io.BytesIO(data), chunk_size=chunk_size))
+        assert "".join(lines) == data.decode("utf-8-sig")
+        assert lines[-1] == "2025-01-03;2,0;€"
+    records = list(iter_records(io.BytesIO(data)))
+    assert [r[5] for r in records] == ["é\nü", "€"]
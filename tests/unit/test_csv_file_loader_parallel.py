@@ -0,0 +1,61 @@
+import mmap
+from pathlib import Path
+
+from bank_analysis.adapters import csv_core
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+
+HEADER = "dateOp;label;category;categoryParent;supplierFound;amount\r\n"
+ROWS = [
+    '2024-07-31;"CARTE; TOTO";"Bien-être";"Vie quotidienne";"yves rocher";-49,40\r\n',
+    '2024-08-01;"VIR\r\nINST ""multi"" ligne";"Virements reçus";"Virements reçus";"";266,00\r\n',
+    '"2024-08-02";"PRLV\nSEPA;";"Abonnements";"Logement";"edf";"-1 234,56"\r\n',
+    'not-a-date;"ignored";"x";"y";"";1,00\r\n',
+]
+
+
+def _write(tmp_path: Path, copies: int = 50) -> str:
+    p = tmp_path / "export.csv"
+    p.write_bytes(("\ufeff" + HEADER + "".join(ROWS * copies)).encode("utf-8"))
+    return str(p)
+
+
+def test_record_boundaries_never_split_quoted_fields(tmp_path):
+    path = _write(tmp_path)
+    sequential = list(CsvFileDataLoader().load_table(path))
+    assert len(sequential) == 150
+    headers = ["dateOp", "label", "category", "categoryParent", "supplierFound", "amount"]
+
+    for n_chunks in (1, 2, 7, 64, 1000):
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.find(b"\n") + 1
+            bounds = csv_core.record_boundaries(mm, start, n_chunks)
+        assert bounds[0] == start and bounds[-1] == Path(path).stat().st_size
+        assert bounds == sorted(set(bounds))
+
+        merged = []
+        for begin, end in zip(bounds, bounds[1:]):
+            merged.extend(csv_core._parse_file_chunk(path, begin, end, ";", headers))
+        assert merged == sequential
+
+
+def test_parallel_load_matches_sequential(tmp_path):
+    path = _write(tmp_path)
+    sequential = CsvFileDataLoader().load_table(path)
+
+    loader = CsvFileDataLoader(workers=2, parallel_min_bytes=0)
+    parallel = loader.load_and_prepare(path)
+
+    assert list(parallel) == list(sequential)
+    assert parallel[1].message == 'VIR\r\nINST "multi" ligne'
+    assert parallel[2].amount == -1234.56
+
+
+def test_parallel_load_handles_empty_and_invalid_files(tmp_path):
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    bad = tmp_path / "bad.csv"
+    bad.write_text("foo;bar\n1;2\n", encoding="utf-8")
+
+    loader = CsvFileDataLoader(workers=2, parallel_min_bytes=0)
+    assert len(loader.load_table(str(empty))) == 0
+    assert len(loader.load_table(str(bad))) == 0
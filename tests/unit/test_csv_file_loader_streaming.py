@@ -0,0 +1,61 @@
+import types
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.usecases.data_loading import DataLoadingUseCase
+
+CSV = (
+    "\ufeffdateOp;label;category;categoryParent;supplierFound;amount\n"
+    "2024-07-31;\"CARTE 30/07/24 TOTO\";\"Bien-être\";\"Vie quotidienne\";\"yves rocher\";-49,40\n"
+    "2024-07-31;\"VIR INST\";\"Virements reçus\";\"Virements reçus\";\"madame\";266,00\n"
+    "not-a-date;\"BROKEN\";\"X\";\"Y\";\"\";-1,00\n"
+)
+
+
+def _write(tmp_path: Path, text: str) -> str:
+    p = tmp_path / "txns.csv"
+    p.write_text(text, encoding="utf-8")
+    return str(p)
+
+
+def test_iter_transactions_is_a_lazy_generator(tmp_path: Path):
+    path = _write(tmp_path, CSV)
+    it = CsvFileDataLoader().iter_transactions(path)
+    assert isinstance(it, types.GeneratorType)
+
+    first = next(it)
+    assert first.amount == -49.40
+    assert first.category == "Bien-être"
+    assert first.supplier == "yves rocher"
+    assert first.month == "2024-07"
+    assert [t.amount for t in it] == [266.0]
+
+
+def test_streaming_and_list_modes_agree(tmp_path: Path):
+    path = _write(tmp_path, CSV)
+    loader = CsvFileDataLoader()
+    assert list(loader.iter_transactions(path)) == list(loader.load_and_prepare(path))
+
+
+def test_streaming_normalizes_header_only_once_with_nbsp(tmp_path: Path):
+    path = _write(tmp_path, "dateOp\xa0,amount ,category\n2025-01-10,\"-150,50\",Groceries\n")
+    txns = list(CsvFileDataLoader().iter_transactions(path))
+    assert len(txns) == 1
+    assert txns[0].amount == -150.50
+    assert txns[0].category == "Groceries"
+
+
+def test_streaming_invalid_header_or_empty_file_yields_nothing(tmp_path: Path):
+    loader = CsvFileDataLoader()
+    assert list(loader.iter_transactions(_write(tmp_path, ""))) == []
+    assert list(loader.iter_transactions(_write(tmp_path, "foo;bar\n1;2\n"))) == []
+
+
+def test_data_loading_usecase_stream(tmp_path: Path):
+    path = _write(tmp_path, CSV)
+    uc = DataLoadingUseCase(CsvFileDataLoader())
+    assert [t.amount for t in uc.stream(path)] == [-49.40, 266.0]
+    with pytest.raises(ValueError, match="empty"):
+        uc.stream(_write(tmp_path, "dateOp;amount\n"))
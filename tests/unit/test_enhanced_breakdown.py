@@ -1,5 +1,6 @@
 
 # tests/domain/reporting/test_category_breakdown_v2.py
+import dataclasses
 import datetime as dt
 import pytest
 
@@ -248,3 +249,53 @@ def test_zero_double_counting_across_kinds():
     assert kinds_per_label["Impôts & taxes"] == {BreakdownKind.MANDATORY}
     assert kinds_per_label["Salaire fixe"] == {BreakdownKind.SALARY}
     assert kinds_per_label["Remboursements"] == {BreakdownKind.REIMBURSEMENTS}
+
+
+def test_classification_runs_once_per_distinct_triple(monkeypatch):
+    from dataclasses import replace
+    from bank_analysis.domain.reporting import enhanced_breakdown
+    from bank_analysis.domain.transaction_table import TransactionTable
+
+    # A policy of its own, so the shared classifier (and memo) is fresh
+    policy = replace(DEFAULT_POLICY, ref_theoretical_salary=1234.0)
+    classifier = enhanced_breakdown.classifier_for(policy, DEFAULT_CATEGORY_RULES)
+    assert enhanced_breakdown.classifier_for(policy, DEFAULT_CATEGORY_RULES) is classifier
+    calls = []
+    real_classify = classifier.classify
+    monkeypatch.setattr(classifier, "classify", lambda *triple: calls.append(triple) or real_classify(*triple))
+
+    txs = [mk_tx(-10.0, "Alimentation", parent="Vie quotidienne", supplier="LIDL 42"),
+           mk_tx(-5.0, "Alimentation", parent="Vie quotidienne", supplier="Monoprix")] * 50
+    rows = compute_category_breakdown(txs, policy=policy)
+    assert len(calls) == 2
+    assert rows == compute_category_breakdown(TransactionTable.from_transactions(txs), policy=policy)
+    compute_category_breakdown(txs[:10], policy=policy)
+    assert len(calls) == 2
+
+
+def test_dictionary_flags_are_stored_on_the_table_and_reused_by_subsets():
+    from bank_analysis.domain.transaction_table import TransactionTable
+
+    txs = [mk_tx(-10.0, "Loyers, charges", parent="Logement"),
+           mk_tx(-3.0, "Alimentation", parent="Vie quotidienne", supplier="lidl"),
+           mk_tx(-4.0, "Alimentation", parent="Vie quotidienne", supplier="lidl", date=dt.date(2025, 2, 1))]
+    table = TransactionTable.from_transactions(txs)
+    compute_category_breakdown(table)
+    (flags,) = table.derived.values()
+
+    subset = table.take([1, 2])
+    assert compute_category_breakdown(subset) == compute_category_breakdown(txs[1:])
+    assert list(subset.derived.values()) == [flags]
+
+    # New dictionary values invalidate the stored flags
+    table.append(mk_tx(-1.0, "Remboursement de frais", parent="Santé"))
+    assert compute_category_breakdown(table) == compute_category_breakdown(txs + [table[3]])
+
+    # A rules change drops the flags stored for the old rules only
+    from bank_analysis.domain.reporting.enhanced_breakdown import discard_dictionary_flags
+    other_policy = dataclasses.replace(DEFAULT_POLICY, exclude_parents=frozenset())
+    compute_category_breakdown(table, policy=other_policy)
+    assert len(table.derived) == 2
+    discard_dictionary_flags(table, DEFAULT_POLICY, DEFAULT_CATEGORY_RULES)
+    (key,) = table.derived
+    assert key[1].policy == other_policy
@@ -0,0 +1,89 @@
+import csv
+import dataclasses
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters.binary_file_loader import BinaryFileDataLoader
+from bank_analysis.adapters.csv_content_loader import CsvContentDataLoader
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.adapters.streaming_exporters import CsvExporter, JsonLinesExporter, exporter_for_path
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.value_objects import BreakdownKind, CategoryBreakdown, MonthlySummary
+from bank_analysis.entrypoints.cli import run
+from bank_analysis.usecases.export_use_case import ExportUseCase
+
+SUMMARY = [MonthlySummary("2024-05", 3000.0, 980.5, 3, 2019.5, 2719.5),
+           MonthlySummary("2024-06", 0.0, 900.0, 1, -900.0, 2800.0)]
+BREAKDOWN = [CategoryBreakdown("Loyers, charges", 900.0, 1, BreakdownKind.MANDATORY),
+             CategoryBreakdown("Lidl", 80.5, 2, BreakdownKind.SUPPLIER)]
+TXNS = [
+    Transaction(date(2024, 5, 26), "2024-05", "Alimentation", "Vie quotidienne", -80.5, "LIDL; \"42\"", "lidl", "FR01"),
+    Transaction(date(2024, 6, 2), "2024-06", None, "Divers", -900.0, "LOYER", "", ""),
+]
+
+
+def test_summary_and_breakdown_export_to_semicolon_csv(tmp_path: Path):
+    paths = {"summary": str(tmp_path / "summary.csv"), "breakdown": str(tmp_path / "breakdown.csv")}
+    assert ExportUseCase(CsvExporter()).execute(paths, SUMMARY, BREAKDOWN) == {"summary": 2, "breakdown": 2}
+
+    with open(paths["summary"], encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f, delimiter=";"))
+    assert rows[0][:2] == ["month", "total_salary"]
+    assert rows[2] == ["2024-06", "0.0", "900.0", "1", "-900.0", "2800.0"]
+    with open(paths["breakdown"], encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f, delimiter=";"))[1] == ["Loyers, charges", "900.0", "1", "MANDATORY"]
+
+
+@pytest.mark.parametrize("source", [lambda: iter(TXNS), lambda: TransactionTable.from_transactions(TXNS)])
+def test_transactions_stream_to_json_lines_and_csv(tmp_path: Path, source):
+    uc = ExportUseCase(JsonLinesExporter())
+    assert uc.export_transactions(str(tmp_path / "t.jsonl"), source()) == 2
+    lines = (tmp_path / "t.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == {"date_op": "2024-05-26", "month": "2024-05", "category": "Alimentation",
+                                    "category_parent": "Vie quotidienne", "amount": -80.5,
+                                    "message": "LIDL; \"42\"", "supplier": "lidl", "account": "FR01"}
+    assert json.loads(lines[1])["category"] is None
+
+    ExportUseCase(CsvExporter()).export_transactions(str(tmp_path / "t.csv"), source())
+    with open(tmp_path / "t.csv", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f, delimiter=";"))[1][5] == "LIDL; \"42\""
+
+
+def test_columnar_export_and_format_selection(tmp_path: Path):
+    out = str(tmp_path / "t.batx")
+    assert ExportUseCase(exporter_for_path(out)).export_transactions(out, iter(TXNS)) == 2
+    assert list(BinaryFileDataLoader().load_table(out)) == TXNS
+    with pytest.raises(ValueError):
+        ExportUseCase(exporter_for_path(out)).execute({"summary": out}, SUMMARY, None)
+    # Summaries and breakdowns are refused the transaction-only format up front
+    with pytest.raises(ValueError, match="record format"):
+        exporter_for_path(out, records=True)
+    assert isinstance(exporter_for_path("s.jsonl", records=True), JsonLinesExporter)
+    with pytest.raises(ValueError):
+        exporter_for_path("t.parquet")
+
+
+@pytest.mark.parametrize("source", [lambda: iter(TXNS), lambda: TransactionTable.from_transactions(TXNS)])
+def test_csv_transaction_export_reads_back_through_the_loaders(tmp_path: Path, source):
+    out = tmp_path / "t.csv"
+    ExportUseCase(CsvExporter()).export_transactions(str(out), source())
+
+    assert out.read_text(encoding="utf-8").splitlines()[0] == \
+        "dateOp;month;category;categoryParent;amount;label;supplierFound;accountNum"
+    expected = [TXNS[0], dataclasses.replace(TXNS[1], category="")]
+    assert list(CsvFileDataLoader().load_and_prepare(str(out))) == expected
+    assert list(CsvContentDataLoader().load_and_prepare(out.read_bytes())) == expected
+
+
+def test_cli_export_transactions(tmp_path: Path, capsys):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("dateOp;category;categoryParent;amount\n2024-05-02;Loisirs;Loisirs;-15,00\n",
+                        encoding="utf-8")
+    out = tmp_path / "export.jsonl"
+    run(["--csv", str(csv_path), "--export-transactions", str(out)])
+    assert json.loads(out.read_text(encoding="utf-8"))["amount"] == -15.0
+    assert "Wrote 1 transactions" in capsys.readouterr().out
@@ -0,0 +1,41 @@
+import pytest
+
+from bank_analysis.adapters.csv_content_loader import CsvContentDataLoader
+from bank_analysis.adapters.field_parsers import (
+    RowParser, _strip_nbsp, clean_text, parse_amount, parse_amount_fast, parse_date, parse_date_fast,
+)
+
+AMOUNTS = ["-49,40", "266,00", " 12.5 ", '"-3,10"', "-1\xa0234,56", "1 000,00", '"1 000"',
+           "１２,５", "", "   ", None, "abc", '"', '""', "1e3", '"1",2', "-0,00"]
+DATES = ["2024-07-31", '"2024-07-31"', " 2024-07-31 ", "2024-02-30", "20240731",
+         "2024-07-31T10:00", "31/07/2024", "", None, "２０２４-07-31"]
+TEXTS = ["  yves rocher ", "Bien-être", "a\xa0b", "ﬁ", "", None, " X "]
+
+
+@pytest.mark.parametrize("value", AMOUNTS)
+def test_fast_amount_matches_reference(value):
+    assert parse_amount_fast(value) == parse_amount(value)
+
+
+@pytest.mark.parametrize("value", DATES)
+def test_fast_date_matches_reference(value):
+    assert parse_date_fast(value) == parse_date(value)
+
+
+@pytest.mark.parametrize("value", TEXTS)
+def test_clean_text_matches_reference(value):
+    assert clean_text(value) == _strip_nbsp(value)
+
+
+def test_row_parser_resolves_normalized_headers_once():
+    parse_row = RowParser(["\ufeffdateOp", "amount\xa0", "label"])
+    assert parse_row.headers == ["dateOp", "amount", "label"]
+    assert parse_row(["2025-01-02", "-1,5", " x "])[4:6] == (-1.5, "x")
+    # Short rows read missing cells as empty, like csv.DictReader
+    assert parse_row(["2025-01-02", "-1,5"])[5] == ""
+    assert parse_row(["2025-01-02"]) is None
+    assert not RowParser(["date", "amount"]).is_valid
+
+
+def test_content_loader_ignores_unusable_header():
+    assert CsvContentDataLoader().load_and_prepare("foo;bar\n1;2\n") == []
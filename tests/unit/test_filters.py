@@ -18,9 +18,10 @@ class StubMonthlySummary:
 class StubFilteredSummary:
     """We validate structural behavior,
     we only need 'filtered' and 'excluded_months' attributes for assertions."""
-    def __init__(self, filtered, excluded_months):
+    def __init__(self, filtered, excluded_months, reasons=None):
         self.filtered = filtered
         self.excluded_months = excluded_months
+        self.reasons = reasons or {}
 
 class StubTransaction:
     """Minimal stub to satisfy attributes used by filter_transactions_by_period_label_and_kind."""
@@ -95,6 +96,10 @@ def test_filter_atypical_months_mixed_inclusion_order_preserved():
     res = filtering.filter_atypical_months(summary)
     assert res.excluded_months == ["2024-01", "2024-03"]
     assert [s.month for s in res.filtered] == ["2024-02", "2024-04"]
+    assert res.reasons == {
+        "2024-01": ["negative savings (-1.00)"],
+        "2024-03": ["negative savings vs theoretical (-1.00)"],
+    }
 
 
 # ---------- Tests: filter_transactions_by_period_label_and_kind ----------
@@ -0,0 +1,90 @@
+import random
+from datetime import date, timedelta
+from typing import List, Sequence
+
+import pytest
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
+from bank_analysis.domain import period_splicer
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import breakdown, enhanced_breakdown, summary
+from bank_analysis.domain.reporting.fused import compute_fused_reports
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.ports.loader import DataLoaderPort
+from bank_analysis.usecases.full_global_analysis import FullGlobalAnalysisUseCase
+
+ROWS = [
+    ("Salaire fixe", "Income", ""),
+    ("Alimentation", "Vie quotidienne", "LIDL 42"),
+    ("Alimentation", "Vie quotidienne", "E.Leclerc"),
+    ("Alimentation", "Vie quotidienne", "Monoprix"),
+    ("Loyers, charges", "Logement", ""),
+    ("Remboursement de frais", "Santé", ""),
+    ("Internal debit", "Mouvements internes débiteurs", ""),
+    (None, "Divers", ""),
+]
+
+
+def _random_txns(n=1500, seed=11):
+    rng = random.Random(seed)
+    txns = []
+    for _ in range(n):
+        d = date(2024, 1, 1) + timedelta(days=rng.randrange(0, 400))
+        category, parent, supplier = rng.choice(ROWS)
+        amount = round(rng.uniform(2500, 3800), 2) if category == "Salaire fixe" else round(rng.uniform(-300, 40), 2)
+        txns.append(Transaction(date_op=d, month=f"{d.year:04d}-{d.month:02d}", category=category,
+                                category_parent=parent, amount=amount, message="M", supplier=supplier))
+    return txns
+
+
+@pytest.mark.parametrize("grouper_factory", [lambda t: CalendarCycleGrouper(), SalaryCycleGrouper])
+def test_fused_matches_dedicated_passes(grouper_factory):
+    txns = _random_txns()
+    grouper = grouper_factory(txns)
+    reports = compute_fused_reports(txns, cycle_grouper=grouper)
+
+    assert reports.monthly_summary == summary.compute_monthly_summary_core(txns, cycle_grouper=grouper)
+    assert reports.category_breakdown == breakdown.compute_category_breakdown(txns)
+
+    for row in reports.monthly_summary:
+        period = row.month
+        if period == "Outside salary periods":
+            period_txns = [t for t in txns if grouper.label_for_date(t.date_op) == period]
+        else:
+            period_txns = period_splicer.filter_transactions_by_period(txns, period)
+        assert reports.period_breakdowns[period] == breakdown.compute_category_breakdown(period_txns)
+        assert (reports.period_enhanced_breakdowns[period]
+                == enhanced_breakdown.compute_category_breakdown(period_txns))
+
+
+@pytest.mark.parametrize("grouper_factory", [lambda t: CalendarCycleGrouper(), SalaryCycleGrouper])
+def test_columnar_scan_matches_row_scan(grouper_factory):
+    txns = _random_txns()
+    table = TransactionTable.from_transactions(txns)
+    grouper = grouper_factory(txns)
+
+    assert compute_fused_reports(table, cycle_grouper=grouper) == compute_fused_reports(txns, cycle_grouper=grouper)
+    # The classification flags are left on the table for later breakdowns
+    assert any(key[0] == "enhanced_breakdown" for key in table.derived)
+
+
+class FakeLoader(DataLoaderPort):
+    def __init__(self, transactions: List[Transaction]):
+        self._transactions = transactions
+    def list_csv_files(self) -> List[str]:
+        return ["dummy.csv"]
+    def load_and_prepare(self, csv_path: str) -> Sequence[Transaction]:
+        return self._transactions
+
+
+def test_full_analysis_fused_mode_returns_same_result():
+    txns = _random_txns(400)
+    uc = FullGlobalAnalysisUseCase(FakeLoader(txns), CalendarCycleGrouper())
+    regular = uc.run_full_analysis("unused.csv", do_filter_atypical=True, show_category_breakdown=True)
+    fused = uc.run_full_analysis("unused.csv", do_filter_atypical=True, show_category_breakdown=True, fused=True)
+
+    for key, value in regular.items():
+        assert fused[key] == value, key
+    assert set(fused["period_breakdowns"]) == {r.month for r in regular["monthly_summary"]}
+    assert set(fused["period_enhanced_breakdowns"]) == set(fused["period_breakdowns"])
@@ -0,0 +1,134 @@
+import io
+import random
+import struct
+from array import array
+from datetime import date, timedelta
+
+import pytest
+
+from bank_analysis.adapters.binary_table_codec import read_table
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.field_parsers import RowParser
+from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.incremental import IncrementalAnalysis
+from bank_analysis.domain.reporting.fused import compute_fused_reports
+from bank_analysis.usecases.append_transactions import AppendTransactionsUseCase
+from bank_analysis.usecases.precompute_period_breakdowns import PrecomputePeriodBreakdownsUseCase
+
+ROWS = [
+    ("Salaire fixe", "Income", ""),
+    ("Alimentation", "Vie quotidienne", "LIDL 42"),
+    ("Alimentation", "Vie quotidienne", "Monoprix"),
+    ("Loyers, charges", "Logement", ""),
+    ("Internal debit", "Mouvements internes débiteurs", ""),
+    (None, "Divers", ""),
+]
+
+
+def _tx(d, category="Alimentation", parent="Vie quotidienne", amount=-10.0, message="M", supplier="", account="A1"):
+    return Transaction(date_op=d, month=f"{d.year:04d}-{d.month:02d}", category=category,
+                       category_parent=parent, amount=amount, message=message,
+                       supplier=supplier, account=account)
+
+
+def _random_txns(start, days, n, seed):
+    rng = random.Random(seed)
+    txns = []
+    for i in range(n):
+        d = start + timedelta(days=rng.randrange(0, days))
+        category, parent, supplier = rng.choice(ROWS)
+        amount = round(rng.uniform(2500, 3800), 2) if category == "Salaire fixe" else round(rng.uniform(-300, 40), 2)
+        txns.append(_tx(d, category, parent, amount, f"OP {i}", supplier))
+    return sorted(txns, key=lambda t: t.date_op)
+
+
+def _assert_matches_full_run(analysis, txns, grouper):
+    reports = compute_fused_reports(txns, cycle_grouper=grouper)
+    assert analysis.monthly_summary == reports.monthly_summary
+    assert analysis.period_breakdowns == PrecomputePeriodBreakdownsUseCase(grouper).execute(txns)
+
+
+@pytest.mark.parametrize("grouper_factory", [lambda t: CalendarCycleGrouper(), SalaryCycleGrouper])
+def test_appending_statements_matches_a_full_recompute(grouper_factory):
+    history = _random_txns(date(2024, 1, 1), 200, 800, seed=3)
+    statements = [_random_txns(date(2024, 7, 20) + timedelta(days=30 * k), 30, 120, seed=10 + k)
+                  for k in range(3)]
+
+    analysis = IncrementalAnalysis(grouper_factory(history), history)
+    seen = list(history)
+    for statement in statements:
+        result = analysis.append(statement)
+        seen.extend(statement)
+        assert result.added == len(statement)
+        _assert_matches_full_run(analysis, seen, grouper_factory(seen))
+    assert list(analysis.table) == seen
+
+
+def test_new_salary_splits_the_last_period_and_only_recent_periods_are_recomputed():
+    history = [
+        _tx(date(2024, 1, 25), "Salaire fixe", "Income", 3000.0, "SAL"),
+        _tx(date(2024, 2, 3)),
+        _tx(date(2024, 2, 26), "Salaire fixe", "Income", 3000.0, "SAL"),
+        _tx(date(2024, 3, 5)),
+    ]
+    analysis = IncrementalAnalysis(SalaryCycleGrouper(history), history)
+    assert analysis.periods == ["2024-01-25 to 2024-02-25", "2024-02-26 to 2024-03-05"]
+
+    new = [_tx(date(2024, 3, 20)), _tx(date(2024, 3, 25), "Salaire fixe", "Income", 3100.0, "SAL"),
+           _tx(date(2024, 4, 2))]
+    result = AppendTransactionsUseCase(analysis).execute(new)
+
+    assert result.recomputed_periods == ["2024-02-26 to 2024-03-24", "2024-03-25 to 2024-04-02"]
+    assert result.removed_periods == ["2024-02-26 to 2024-03-05"]
+    _assert_matches_full_run(analysis, history + new, SalaryCycleGrouper(history + new))
+
+
+def test_overlapping_statement_is_deduplicated_but_identical_operations_are_kept():
+    coffee = _tx(date(2024, 5, 2), amount=-2.5, message="CAFE")
+    analysis = IncrementalAnalysis(CalendarCycleGrouper(), [coffee, coffee])
+
+    # Re-importing the same statement adds nothing
+    result = analysis.append([coffee, coffee])
+    assert (result.added, result.duplicates, result.recomputed_periods) == (0, 2, [])
+
+    # A third identical operation in the next statement's copy is new
+    result = analysis.append([coffee, coffee, coffee, _tx(date(2024, 5, 2), amount=-2.5, message="CAFE", account="A2")])
+    assert (result.added, result.duplicates) == (2, 2)
+    assert len(analysis.table) == 4
+    assert analysis.monthly_summary[0].nb_expense_operations == 4
+
+
+def test_extended_with_matches_a_grouper_built_from_scratch():
+    history = _random_txns(date(2024, 1, 1), 120, 300, seed=5)
+    new = _random_txns(date(2024, 3, 15), 90, 200, seed=6)
+    extended = SalaryCycleGrouper(history).extended_with(new)
+    rebuilt = SalaryCycleGrouper(history + new)
+    dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(200)]
+    assert extended.labels_for_dates(dates) == rebuilt.labels_for_dates(dates)
+
+
+def test_row_parser_reads_the_account_column():
+    parser = RowParser(["dateOp", "category", "categoryParent", "amount", "label", "accountNum"])
+    assert parser(["2024-05-02", "Alimentation", "Vie quotidienne", "-2,50", "CAFE", "FR76 001"])[-1] == "FR76 001"
+    assert RowParser(["dateOp", "amount"])(["2024-05-02", "-2,50"])[-1] == ""
+
+
+def _string(s):
+    data = s.encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def test_version_1_binary_streams_are_read_with_an_empty_account():
+    # Hand-written v1 stream: four dictionary columns, no account codes
+    buf = b"BATX" + struct.pack("<HH", 1, 0)
+    for col_id, value in enumerate(["2024-05", "Alimentation", "Vie quotidienne", "lidl"]):
+        buf += b"D" + struct.pack("<BI", col_id, 1) + _string(value)
+    buf += b"R" + struct.pack("<I", 1)
+    buf += array("i", [date(2024, 5, 2).toordinal()]).tobytes() + array("d", [-2.5]).tobytes()
+    buf += array("i", [0, 0, 0, 0]).tobytes()
+    buf += array("I", [4]).tobytes() + b"CAFE"
+    buf += b"E" + struct.pack("<Q", 1)
+
+    (tx,) = list(read_table(io.BytesIO(buf)))
+    assert tx == _tx(date(2024, 5, 2), amount=-2.5, message="CAFE", supplier="lidl", account="")
@@ -0,0 +1,101 @@
+from datetime import date
+from pathlib import Path
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.multi_file_loader import MultiFileDataLoader
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting.fused import compute_fused_reports
+from bank_analysis.domain.transfers import cancel_internal_transfers, match_internal_transfers
+from bank_analysis.entrypoints.cli import run
+from bank_analysis.usecases.multi_account_analysis import MultiAccountAnalysisUseCase
+
+HEADER = "dateOp;label;category;categoryParent;supplierFound;amount;accountNum\n"
+CURRENT = HEADER + (
+    "2024-05-25;\"SALAIRE\";\"Salaire fixe\";\"Revenus\";\"\";3000,00;FR01\n"
+    "2024-05-26;\"LIDL\";\"Alimentation\";\"Vie quotidienne\";\"lidl\";-80,00;FR01\n"
+    "2024-05-27;\"VIR LIVRET\";\"Virements émis\";\"Virements émis\";\"\";-500,00;FR01\n"
+)
+SAVINGS = HEADER + (
+    "2024-05-28;\"VIR COMPTE\";\"Virement interne\";\"Mouvements internes créditeurs\";\"\";500,00;FR02\n"
+    "2024-05-30;\"RETRAIT\";\"Retrait\";\"Retraits\";\"\";-40,00;FR02\n"
+)
+
+
+def _tx(d, amount, account, category="Divers", parent="Divers"):
+    return Transaction(date_op=d, month=d.strftime("%Y-%m"), category=category,
+                       category_parent=parent, amount=amount, message="M", account=account)
+
+
+def test_transfers_pair_across_accounts_within_the_window():
+    internal = "Mouvements internes débiteurs"
+    txns = [
+        _tx(date(2024, 5, 1), -200.0, "A", parent=internal),
+        _tx(date(2024, 5, 2), 200.0, "A"),   # same account: not a transfer
+        _tx(date(2024, 5, 9), 200.0, "B"),   # too late
+        _tx(date(2024, 5, 3), 200.0, "B"),
+        _tx(date(2024, 5, 3), -75.5, "A"),   # neither leg internal
+        _tx(date(2024, 5, 3), 75.5, "B"),
+    ]
+    assert match_internal_transfers(txns) == [(0, 3)]
+    kept, cancelled = cancel_internal_transfers(txns)
+    assert cancelled == 1 and kept == [txns[1], txns[2], txns[4], txns[5]]
+
+
+def test_accounts_are_reported_separately_and_consolidated_without_transfers(tmp_path: Path):
+    (tmp_path / "current.csv").write_text(CURRENT, encoding="utf-8")
+    # No accountNum column: rows are tagged with the file name
+    (tmp_path / "joint.csv").write_text(
+        "dateOp;category;categoryParent;amount\n2024-05-29;Loisirs;Loisirs;-15,00\n", encoding="utf-8")
+    (tmp_path / "savings.csv").write_text(SAVINGS, encoding="utf-8")
+
+    loader = MultiFileDataLoader(base_path=str(tmp_path), workers=2)
+    paths = loader.list_files()
+    assert [Path(p).name for p in paths] == ["current.csv", "joint.csv", "savings.csv"]
+    table = loader.load_table(paths)
+    assert sorted({t.account for t in table}) == ["FR01", "FR02", "joint"]
+
+    reports = MultiAccountAnalysisUseCase(CalendarCycleGrouper()).execute(table)
+    assert list(reports.accounts) == ["FR01", "FR02", "joint"]
+    assert reports.accounts["FR01"].monthly_summary[0].total_expenses == 580.0
+    assert reports.accounts["FR02"].monthly_summary[0].total_expenses == 40.0
+    assert reports.cancelled_transfers == 1
+
+    consolidated = reports.consolidated.monthly_summary[0]
+    assert consolidated.total_salary == 3000.0
+    assert consolidated.total_expenses == 135.0
+    rest = [t for t in table if t.amount not in (-500.0, 500.0)]
+    assert reports.consolidated == compute_fused_reports(rest, CalendarCycleGrouper())
+
+
+def test_cli_glob_prints_per_account_and_consolidated_reports(tmp_path: Path, capsys):
+    (tmp_path / "current.csv").write_text(CURRENT, encoding="utf-8")
+    (tmp_path / "savings.csv").write_text(SAVINGS, encoding="utf-8")
+    run(["--glob", str(tmp_path / "*.csv"), "--workers", "1"])
+    out = capsys.readouterr().out
+    assert "Account FR01" in out and "Account FR02" in out
+    assert "Consolidated (2 accounts, 1 internal transfers cancelled)" in out
+
+
+def test_cli_glob_uses_rules_config(tmp_path: Path, capsys):
+    import dataclasses
+    import json
+    from bank_analysis.domain.reporting.rule_set import DEFAULT_RULE_SET, rule_set_to_dict
+
+    (tmp_path / "current.csv").write_text(CURRENT, encoding="utf-8")
+    (tmp_path / "savings.csv").write_text(SAVINGS, encoding="utf-8")
+    policy = dataclasses.replace(DEFAULT_RULE_SET.policy, exclude_parents=frozenset())
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps(rule_set_to_dict(dataclasses.replace(DEFAULT_RULE_SET, policy=policy))),
+                          encoding="utf-8")
+
+    run(["--glob", str(tmp_path / "*.csv"), "--rules", str(rules_path)])
+    # No parent marks internal movements any more, so no transfer can be matched
+    assert "Consolidated (2 accounts, 0 internal transfers cancelled)" in capsys.readouterr().out
+
+
+def test_glob_keeps_only_exports(tmp_path: Path):
+    (tmp_path / "current.csv").write_text(CURRENT, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not an export", encoding="utf-8")
+    (tmp_path / "archive.csv").mkdir()
+    paths = MultiFileDataLoader().list_files(str(tmp_path / "*"))
+    assert [Path(p).name for p in paths] == ["current.csv"]
@@ -0,0 +1,92 @@
+import pytest
+
+from bank_analysis.domain.reporting import outliers
+from bank_analysis.domain.reporting.outliers import OutlierPolicy, detect_atypical_periods, policy_for_detectors
+from bank_analysis.domain.value_objects import CategoryBreakdown, FilteredSummary, MonthlySummary
+from bank_analysis.usecases.filter_atypical_months import FilterAtypicalMonthsUseCase
+
+
+def _row(month, salary, expenses):
+    return MonthlySummary(month=month, total_salary=salary, total_expenses=expenses,
+                          nb_expense_operations=10, total_savings=round(salary - expenses, 2),
+                          total_savings_vs_theoretical=round(3700 - expenses, 2))
+
+
+def _summary(expenses):
+    return [_row(f"2024-{i + 1:02d}", 3500, e) for i, e in enumerate(expenses)]
+
+
+EXPENSES = [2000, 2100, 1950, 2050, 2020, 1980, 3400, 2010, 2060, 1990]
+
+
+def test_default_policy_keeps_legacy_rule():
+    summary = _summary(EXPENSES)
+    assert detect_atypical_periods(summary) == {}
+    assert FilterAtypicalMonthsUseCase().execute(summary).excluded_months == []
+
+
+def test_mad_flags_spike_with_reason():
+    summary = _summary(EXPENSES)
+    result = FilterAtypicalMonthsUseCase(OutlierPolicy(negative_savings=False, mad_threshold=3.5)).execute(summary)
+
+    assert isinstance(result, FilteredSummary)
+    assert result.excluded_months == ["2024-07"]
+    assert [s.month for s in result.filtered] == [s.month for s in summary if s.month != "2024-07"]
+    reasons = result.reasons["2024-07"]
+    assert any(r.startswith("savings robust z-score -") for r in reasons)
+    assert any(r.startswith("expenses robust z-score +") for r in reasons)
+
+
+def test_mad_falls_back_to_mean_deviation_when_mad_is_zero():
+    summary = _summary([2000] * 6 + [2500])
+    reasons = detect_atypical_periods(summary, policy=OutlierPolicy(negative_savings=False, mad_threshold=3.5,
+                                                                    metrics=("total_expenses",)))
+    assert list(reasons) == ["2024-07"]
+    assert detect_atypical_periods(_summary([2000] * 6),
+                                   policy=OutlierPolicy(negative_savings=False, mad_threshold=3.5)) == {}
+
+
+def test_iqr_fences():
+    summary = _summary(EXPENSES)
+    reasons = detect_atypical_periods(summary, policy=OutlierPolicy(negative_savings=False, iqr_factor=1.5,
+                                                                    metrics=("total_expenses",)))
+    assert list(reasons) == ["2024-07"]
+    assert reasons["2024-07"][0].startswith("expenses 3400.00 outside IQR fences [")
+
+
+def test_category_deviation_from_rolling_baseline():
+    summary = _summary([2000] * 8)
+    groceries = [400, 420, 390, 410, 405, 1200, 400, 395]
+    breakdowns = {
+        s.month: [CategoryBreakdown(label="Groceries", total=g, nb_operations=5),
+                  CategoryBreakdown(label="Rent", total=1000.0, nb_operations=1)]
+        for s, g in zip(summary, groceries)
+    }
+    del breakdowns["2024-08"]  # a period without rows counts as 0
+    policy = OutlierPolicy(negative_savings=False, category_threshold=0.5, category_window=3)
+
+    reasons = detect_atypical_periods(summary, breakdowns, policy)
+
+    assert list(reasons) == ["2024-06", "2024-08"]
+    assert reasons["2024-06"] == ["Groceries 1200.00 vs baseline 405.00"]
+    assert reasons["2024-08"] == ["Groceries 0.00 vs baseline 405.00", "Rent 0.00 vs baseline 1000.00"]
+    # Without breakdowns the category detector has nothing to check
+    assert detect_atypical_periods(summary, None, policy) == {}
+
+
+def test_reasons_follow_summary_order_and_combine_detectors():
+    summary = _summary(EXPENSES[:6] + [4000] + EXPENSES[7:])
+    policy = policy_for_detectors(["negative", "mad", "iqr"])
+    result = FilterAtypicalMonthsUseCase(policy).execute(summary)
+    assert result.excluded_months == ["2024-07"]
+    assert result.reasons["2024-07"][0] == "negative savings (-500.00)"
+    assert len(result.reasons["2024-07"]) > 2
+
+
+def test_policy_for_detectors():
+    policy = policy_for_detectors(["mad", "category"])
+    assert not policy.negative_savings
+    assert (policy.mad_threshold, policy.iqr_factor, policy.category_threshold) == (3.5, None, 1.0)
+    assert policy_for_detectors(outliers.DETECTORS).iqr_factor == 1.5
+    with pytest.raises(ValueError):
+        policy_for_detectors(["zscore"])
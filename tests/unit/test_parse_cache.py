@@ -0,0 +1,92 @@
+import io
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters import csv_file_loader
+from bank_analysis.adapters.binary_table_codec import BinaryFormatError, TableWriter, read_table, write_table
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.domain.transaction_table import TransactionTable
+
+CSV = (
+    "dateOp;label;category;categoryParent;supplierFound;amount\n"
+    "2024-07-31;\"CARTE TOTO\";\"Bien-être\";\"Vie quotidienne\";\"yves rocher\";-49,40\n"
+    "2024-08-01;\"VIR INST\";\"Virements reçus\";\"Virements reçus\";\"\";266,00\n"
+)
+
+
+def _write(tmp_path: Path, text: str = CSV) -> str:
+    p = tmp_path / "export.csv"
+    p.write_text(text, encoding="utf-8")
+    return str(p)
+
+
+def test_codec_round_trip_with_incremental_row_groups():
+    buf = io.BytesIO()
+    write_table(buf, TransactionTable())
+    buf.seek(0)
+    assert len(read_table(buf)) == 0
+
+    source = TransactionTable()
+    source.append_values(date(2025, 1, 1), "2025-01", "A", "P", -1.5, "m1", "s")
+    source.append_values(date(2025, 1, 2), "2025-01", None, "P", 2.25, "mé2", "")
+    other = TransactionTable()
+    other.append_values(date(2025, 2, 1), "2025-02", "B", "P", -3.0, "m3", "s")
+
+    buf = io.BytesIO()
+    writer = TableWriter(buf)
+    writer.write(source)
+    writer.write(other)
+    writer.close()
+    buf.seek(0)
+    assert list(read_table(buf)) == list(source) + list(other)
+
+    with pytest.raises(BinaryFormatError):
+        read_table(io.BytesIO(b"nope"))
+
+
+def test_cache_hit_skips_parsing(tmp_path: Path, monkeypatch):
+    path = _write(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    first = CsvFileDataLoader(cache_dir=cache_dir).load_and_prepare(path)
+    assert len(os.listdir(cache_dir)) == 2
+
+    def boom(source):
+        raise AssertionError("CSV should not be parsed on a cache hit")
+    monkeypatch.setattr(csv_file_loader, "iter_records", boom)
+
+    second = CsvFileDataLoader(cache_dir=cache_dir).load_and_prepare(path)
+    assert list(second) == list(first)
+    assert list(CsvFileDataLoader(cache_dir=cache_dir).iter_transactions(path)) == list(first)
+
+
+def test_cache_invalidated_on_change_and_by_refresh_flag(tmp_path: Path):
+    path = _write(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    assert len(CsvFileDataLoader(cache_dir=cache_dir).load_table(path)) == 2
+
+    _write(tmp_path, CSV + "2024-08-02;\"X\";\"C\";\"P\";\"\";-1,00\n")
+    assert len(CsvFileDataLoader(cache_dir=cache_dir).load_table(path)) == 3
+
+    # Same size and content but a new mtime: the content hash keeps the sidecar valid
+    os.utime(path, ns=(1, 1))
+    assert len(CsvFileDataLoader(cache_dir=cache_dir).load_table(path)) == 3
+
+    # Explicit refresh re-parses and rewrites the sidecar
+    assert len(CsvFileDataLoader(cache_dir=cache_dir, refresh_cache=True).load_table(path)) == 3
+
+
+def test_sidecar_from_another_parser_version_is_a_miss(tmp_path: Path, monkeypatch):
+    path = _write(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    CsvFileDataLoader(cache_dir=cache_dir).load_table(path)
+
+    from bank_analysis.adapters import parse_cache
+    monkeypatch.setattr(parse_cache, "PARSER_VERSION", parse_cache.PARSER_VERSION + 1)
+    assert parse_cache.DiskParseCache(cache_dir).load(path) is None
+
+    # Re-parsed and stored under the new version
+    assert len(CsvFileDataLoader(cache_dir=cache_dir).load_table(path)) == 2
+    assert parse_cache.DiskParseCache(cache_dir).load(path) is not None
@@ -0,0 +1,35 @@
+from datetime import date
+
+import pytest
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.domain import period_splicer
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import breakdown, enhanced_breakdown
+from bank_analysis.usecases.precompute_period_breakdowns import PrecomputePeriodBreakdownsUseCase
+
+
+def _txns():
+    return [
+        Transaction(date_op=date(2025,1,25), month="2025-01", category="Salaire fixe", category_parent="Income", amount=3700.0, message="SALARY"),
+        Transaction(date_op=date(2025,1,10), month="2025-01", category="Loyers, charges", category_parent="Logement", amount=-900.0, message="RENT"),
+        Transaction(date_op=date(2025,1,12), month="2025-01", category="Alimentation", category_parent="Vie quotidienne", amount=-42.13, message="CB LIDL", supplier="LIDL"),
+        Transaction(date_op=date(2025,2,3),  month="2025-02", category="Alimentation", category_parent="Vie quotidienne", amount=-17.6, message="CB", supplier="Monop"),
+        Transaction(date_op=date(2025,2,5),  month="2025-02", category="Internal debit", category_parent="Mouvements internes débiteurs", amount=-200.0, message="VIR"),
+    ]
+
+
+def test_precomputes_every_period_for_both_styles():
+    txns = _txns()
+    out = PrecomputePeriodBreakdownsUseCase(CalendarCycleGrouper()).execute(txns)
+
+    assert set(out) == {(style, period) for style in ("standard", "enhanced") for period in ("2025-01", "2025-02")}
+    for period in ("2025-01", "2025-02"):
+        period_txns = period_splicer.filter_transactions_by_period(txns, period)
+        assert out[("standard", period)] == breakdown.compute_category_breakdown(period_txns)
+        assert out[("enhanced", period)] == enhanced_breakdown.compute_category_breakdown(period_txns)
+
+
+def test_precompute_rejects_empty_input():
+    with pytest.raises(ValueError):
+        PrecomputePeriodBreakdownsUseCase(CalendarCycleGrouper()).execute([])
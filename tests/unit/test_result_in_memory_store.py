@@ -0,0 +1,117 @@
+import threading
+from datetime import date
+
+from bank_analysis.adapters.result_in_memory_store import InMemoryResultStore, estimate_size
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.transaction_table import TransactionTable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+
+def test_unbounded_by_default():
+    store = InMemoryResultStore()
+    for i in range(100):
+        store.put(f"s{i}", [i])
+    assert store.get("s0") == [0]
+    store.remove("s0")
+    assert store.get("s0") is None
+    assert store.stats()["sessions"] == 99
+
+
+def test_lru_eviction_on_max_sessions():
+    clock = FakeClock()
+    store = InMemoryResultStore(max_sessions=2, clock=clock)
+    store.put("a", 1); clock.now += 1
+    store.put("b", 2); clock.now += 1
+    assert store.get("a") == 1  # 'a' becomes most recently used
+    clock.now += 1
+    store.put("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1 and store.get("c") == 3
+    assert store.stats()["evictions"] == 1
+
+
+def test_max_bytes_eviction_and_accounting():
+    clock = FakeClock()
+    store = InMemoryResultStore(max_bytes=250, size_of=lambda payload: 100, clock=clock)
+    for key in ("a", "b", "c"):
+        store.put(key, key)
+        clock.now += 1
+    stats = store.stats()
+    assert stats["sessions"] == 2
+    assert stats["bytes"] == 200
+    assert store.get("a") is None
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    store = InMemoryResultStore(ttl_seconds=10, clock=clock)
+    store.put("a", 1)
+    clock.now = 5
+    assert store.get("a") == 1  # refreshes idle time
+    clock.now = 14
+    assert store.get("a") == 1
+    clock.now = 30
+    assert store.get("a") is None
+    stats = store.stats()
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["bytes"] == 0
+
+
+def test_estimate_size_counts_shared_objects_once_and_uses_nbytes():
+    txns = [Transaction(date_op=date(2025, 1, 1), month="2025-01", category="c", category_parent="p",
+                        amount=-1.0, message=f"m{i}") for i in range(500)]
+    single = estimate_size({"transactions": txns})
+    assert estimate_size({"transactions": txns, "alias": txns}) < single + 200
+    table = TransactionTable.from_transactions(txns)
+    assert estimate_size(table) == table.nbytes
+    assert table.nbytes < single
+
+
+def test_concurrent_access_is_consistent():
+    store = InMemoryResultStore(max_sessions=50, stripes=4)
+
+    def worker(n):
+        for i in range(200):
+            store.put(f"{n}-{i}", i)
+            store.get(f"{n}-{i // 2}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = store.stats()
+    assert stats["sessions"] == 50
+    assert stats["evictions"] == 8 * 200 - 50
+
+
+def test_oversize_payloads_are_rejected_and_growth_is_reaccounted():
+    clock = FakeClock()
+    sizes = {"small": 100, "big": 5000}
+    store = InMemoryResultStore(max_bytes=1000, size_of=lambda payload: sizes[payload["name"]], clock=clock)
+
+    assert store.put("a", {"name": "small"}) is True
+    assert store.put("huge", {"name": "big"}) is False
+    assert store.get("huge") is None and store.get("a") == {"name": "small"}
+    assert store.stats()["rejections"] == 1 and store.stats()["evictions"] == 0
+
+    # The newest entry is kept: older ones make room for it
+    clock.now += 1
+    sizes["medium"] = 950
+    assert store.put("b", {"name": "medium"}) is True
+    assert store.get("a") is None and store.get("b") is not None
+
+    # A payload growing in place is re-accounted, and dropped if it no longer fits
+    payload = store.get("b")
+    payload["name"] = "small"
+    assert store.resize("b") is True and store.stats()["bytes"] == 100
+    payload["name"] = "big"
+    assert store.resize("b") is False and store.get("b") is None
+    assert store.stats()["bytes"] == 0
@@ -0,0 +1,91 @@
+import json
+import random
+import statistics
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.domain.reporting.rolling import RollingWindow, compute_rolling_stats
+from bank_analysis.domain.value_objects import MonthlySummary
+from bank_analysis.entrypoints.cli import run
+from bank_analysis.usecases.compute_rolling_stats import ComputeRollingStatsUseCase
+
+
+def _row(month, savings, expenses):
+    return MonthlySummary(month=month, total_salary=savings + expenses, total_expenses=expenses,
+                          nb_expense_operations=1, total_savings=savings,
+                          total_savings_vs_theoretical=savings)
+
+
+def _percentile(values, q):
+    s = sorted(values)
+    pos = (len(s) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (pos - lo)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_window_matches_brute_force(size):
+    rng = random.Random(size)
+    values = [round(rng.uniform(-2000, 3000), 2) for _ in range(60)]
+    w = RollingWindow(size)
+    for i, x in enumerate(values):
+        w.push(x)
+        window = values[max(0, i + 1 - size):i + 1]
+        assert len(w) == len(window)
+        assert w.mean == pytest.approx(statistics.mean(window), abs=1e-6)
+        assert w.median == pytest.approx(statistics.median(window), abs=1e-9)
+        expected_std = statistics.stdev(window) if len(window) > 1 else 0.0
+        assert w.std == pytest.approx(expected_std, abs=1e-6)
+        assert (w.min, w.max) == (min(window), max(window))
+        for q in (0, 10, 25, 90, 100):
+            assert w.percentile(q) == pytest.approx(_percentile(window, q), abs=1e-9)
+
+
+def test_rolling_stats_per_period_with_partial_windows():
+    summary = [_row("2024-01", 100, 900), _row("2024-02", 300, 700),
+               _row("2024-03", 200, 800), _row("2024-04", 600, 400)]
+
+    rows = compute_rolling_stats(summary, window=3, percentiles=(50.0,))
+
+    assert [r.month for r in rows] == ["2024-01", "2024-02", "2024-03", "2024-04"]
+    assert [r.periods for r in rows] == [1, 2, 3, 3]
+    assert rows[0].savings.std == 0.0
+    assert rows[1].savings.mean == 200.0
+    last = rows[-1]
+    assert (last.savings.mean, last.savings.median) == (366.67, 300.0)
+    assert (last.savings.min, last.savings.max) == (200.0, 600.0)
+    assert last.savings.percentiles == {50.0: 300.0}
+    assert last.expenses.mean == 633.33
+    assert last.expenses.std == round(statistics.stdev([700, 800, 400]), 2)
+
+
+def test_usecase_validates_inputs():
+    with pytest.raises(ValueError):
+        ComputeRollingStatsUseCase(window=0)
+    with pytest.raises(ValueError):
+        ComputeRollingStatsUseCase().execute(None)
+    with pytest.raises(ValueError):
+        ComputeRollingStatsUseCase(percentiles=(120.0,)).execute([_row("2024-01", 1, 1)])
+    assert ComputeRollingStatsUseCase().execute([]) == []
+
+
+def test_cli_prints_rolling_stats_after_the_aggregates(tmp_path: Path, monkeypatch, capsys):
+    lines = ["dateOp;label;category;categoryParent;supplierFound;amount"]
+    for month, spent in (("01", "900,00"), ("02", "700,00"), ("03", "800,00")):
+        lines.append(f"2024-{month}-01;\"SALAIRE\";\"Salaire fixe\";\"Revenus\";\"\";1000,00")
+        lines.append(f"2024-{month}-10;\"LIDL\";\"Alimentation\";\"Vie quotidienne\";\"lidl\";-{spent}")
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({"policy": {"ref_theoretical_salary": 2500}}), encoding="utf-8")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "n")
+
+    run(["--csv", str(csv_path), "--rolling", "2", "--rules", str(rules)])
+
+    out = capsys.readouterr().out
+    assert "Average savings vs theoretical salary (2500 €)" in out
+    rolling = out[out.index("=== Rolling Statistics ==="):]
+    assert "2024-02-01 to 2024-02-29" in rolling
+    assert "200.00" in rolling  # mean savings over February and March
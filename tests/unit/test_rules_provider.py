@@ -0,0 +1,109 @@
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from bank_analysis.adapters.analysis_cache import ContentAddressedCache
+from bank_analysis.adapters.json_rules_provider import JsonRulesProvider, load_rule_set
+from bank_analysis.domain.reporting.rule_set import DEFAULT_RULE_SET, rule_set_from_dict, rule_set_to_dict
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _write(path: Path, doc: dict) -> None:
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    # Distinct mtimes even on coarse-grained file systems
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9 * (1 + len(path.read_bytes()))))
+
+
+def test_config_round_trips_and_defaults_fill_missing_sections():
+    loaded = load_rule_set(str(ROOT / "rules.example.json"))
+    assert (loaded.policy, loaded.rules) == (DEFAULT_RULE_SET.policy, DEFAULT_RULE_SET.rules)
+    assert loaded.version.startswith("1@")
+
+    partial = rule_set_from_dict({"policy": {"ref_theoretical_salary": 4000}}, "v")
+    assert partial.policy == replace(DEFAULT_RULE_SET.policy, ref_theoretical_salary=4000.0)
+    assert partial.rules == DEFAULT_RULE_SET.rules
+    assert rule_set_from_dict(rule_set_to_dict(partial), "v") == partial
+
+
+@pytest.mark.parametrize("doc", [
+    {"policy": {"salary": "x"}},
+    {"rules": {"mandatory_categories": "Loyers"}},
+    {"rules": {"supplier_patterns": [{"name": "Bad", "regex": "("}]}},
+    {"policy": {"ref_theoretical_salary": "3700"}},
+    [],
+])
+def test_invalid_configs_are_rejected(doc):
+    with pytest.raises(ValueError):
+        rule_set_from_dict(doc, "v")
+
+
+def test_provider_reloads_changed_files_and_keeps_rules_on_errors(tmp_path: Path):
+    path = tmp_path / "rules.json"
+    _write(path, {"version": "1"})
+    clock = FakeClock()
+    provider = JsonRulesProvider(str(path), check_interval=5.0, clock=clock)
+    changes = []
+    provider.on_change(lambda old, new: changes.append((old.version, new.version)))
+    first = provider.current()
+
+    _write(path, {"version": "1", "policy": {"ref_theoretical_salary": 4000}})
+    assert provider.current() is first  # not checked before check_interval
+    clock.now = 5.0
+    second = provider.current()
+    assert second.policy.ref_theoretical_salary == 4000.0
+    # Same declared version, different content: still a new version
+    assert second.version != first.version and second.version.startswith("1@")
+    assert changes == [(first.version, second.version)]
+
+    _write(path, {"policy": {"ref_theoretical_salary": "oops"}})
+    assert provider.reload() is False
+    assert provider.current() is second and "ref_theoretical_salary" in provider.last_error
+
+    # Rewriting the same content is not a change
+    _write(path, {"version": "1", "policy": {"ref_theoretical_salary": 4000}})
+    assert provider.reload() is False and provider.last_error is None
+    assert len(changes) == 1
+
+
+def test_watch_reloads_from_a_background_thread(tmp_path: Path):
+    import threading
+
+    path = tmp_path / "rules.json"
+    _write(path, {"version": "1"})
+    provider = JsonRulesProvider(str(path), check_interval=0.01)
+    changed = threading.Event()
+    threads = []
+    provider.on_change(lambda old, new: (threads.append(threading.current_thread().name), changed.set()))
+
+    watcher = provider.watch()
+    _write(path, {"version": "2"})
+    assert changed.wait(5)
+    provider.stop()
+    watcher.join(5)
+    assert not watcher.is_alive()
+    assert threads == ["rules-watch"]
+    assert provider.current().version.startswith("2@")
+
+
+def test_results_of_old_rules_versions_can_be_discarded():
+    cache = ContentAddressedCache()
+    analysis = cache.get_or_load("d", lambda: [1])
+    analysis.derived(("summary", "calendar", "v1"), lambda: "old")
+    analysis.derived(("summary", "calendar", "v2"), lambda: "new")
+    assert cache.entries() == [analysis]
+
+    analysis.discard_derived(lambda key: key[-1] != "v2")
+    assert analysis.derived_keys() == [("summary", "calendar", "v2")]
@@ -0,0 +1,109 @@
+import threading
+from datetime import date
+
+import pytest
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
+from bank_analysis.adapters.sqlite_transaction_repository import SqliteTransactionRepository
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.period_splicer import filter_transactions_by_period
+from bank_analysis.domain.reporting import filtering
+from bank_analysis.domain.reporting.breakdown import compute_category_breakdown
+from bank_analysis.domain.reporting.summary import compute_monthly_summary_core
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.domain.value_objects import BreakdownKind
+
+
+def _txns():
+    return [
+        Transaction(date_op=date(2025,1,10), month="2025-01", category="Alimentation", category_parent="Vie quotidienne", amount=-9.0, message="d", supplier="Monoprix"),
+        Transaction(date_op=date(2025,1,12), month="2025-01", category="alimentation", category_parent="Vie quotidienne", amount=-42.13, message="b", supplier="E.Leclerc"),
+        Transaction(date_op=date(2025,1,25), month="2025-01", category="Salaire fixe", category_parent="Income", amount=3700.0, message="c"),
+        Transaction(date_op=date(2025,1,26), month="2025-01", category="Virement", category_parent="Mouvements internes débiteurs", amount=-500.0, message="x"),
+        Transaction(date_op=date(2025,2,3),  month="2025-02", category="Alimentation", category_parent=None, amount=-17.6, message="a", supplier="LIDL 12"),
+        Transaction(date_op=date(2025,2,24), month="2025-02", category=None, category_parent="Transports", amount=-2.1, message="e", supplier="Action"),
+        Transaction(date_op=date(2025,2,25), month="2025-02", category="Salaire fixe", category_parent="Income", amount=3650.5, message="f"),
+        Transaction(date_op=date(2025,3,2),  month="2025-03", category="Transport", category_parent="Transports", amount=-61.3, message="g"),
+    ]
+
+
+@pytest.fixture
+def repo():
+    repo = SqliteTransactionRepository()
+    repo.add_many("alice", _txns())
+    repo.add_many("bob", _txns()[:2])
+    yield repo
+    repo.close()
+
+
+def test_datasets_are_isolated(repo):
+    assert repo.transactions("alice") == _txns()
+    assert repo.transactions("bob") == _txns()[:2]
+    assert repo.has_dataset("bob") and not repo.has_dataset("carol")
+    repo.delete_dataset("bob")
+    assert not repo.has_dataset("bob") and repo.has_dataset("alice")
+
+
+@pytest.mark.parametrize("grouper", [CalendarCycleGrouper(), SalaryCycleGrouper(_txns())])
+def test_summary_matches_domain(repo, grouper):
+    assert repo.monthly_summary("alice", grouper) == compute_monthly_summary_core(_txns(), grouper)
+
+
+@pytest.mark.parametrize("period", [None, "2025-01", "2025-02", "2025-01-12 to 2025-02-24"])
+def test_breakdown_matches_domain(repo, period):
+    txns = _txns() if period is None else filter_transactions_by_period(_txns(), period)
+    assert repo.category_breakdown("alice", period) == compute_category_breakdown(txns)
+    if period is not None:
+        assert repo.transactions("alice", period) == txns
+
+
+@pytest.mark.parametrize("period", ["2025-01", "2025-02", "2025-01-12 to 2025-02-24"])
+@pytest.mark.parametrize("label,kind", [
+    ("ALIMENTATION", BreakdownKind.OTHER),
+    ("Salaire fixe", BreakdownKind.SALARY),
+    ("ignored", BreakdownKind.SUPPLIER),
+])
+def test_filter_matches_domain(repo, period, label, kind):
+    txns = _txns()
+    if kind != BreakdownKind.SUPPLIER:
+        # The list filter cannot casefold a missing category; SQL simply skips it
+        txns = [t for t in txns if t.category is not None]
+    expected = filtering.filter_transactions_by_period_label_and_kind(txns, period, label, kind)
+    assert repo.filter_transactions("alice", period, label, kind) == expected
+
+
+def test_file_store_is_shared_across_threads_and_instances(tmp_path):
+    path = str(tmp_path / "tx.sqlite3")
+    repo = SqliteTransactionRepository(path)
+    # Columnar input is inserted straight from the columns
+    assert repo.add_many("alice", TransactionTable.from_transactions(_txns())) == 8
+
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(len(repo.transactions("alice"))))
+    worker.start()
+    worker.join()
+    assert seen == [8]
+    repo.close()
+
+    reopened = SqliteTransactionRepository(path)
+    assert reopened.transactions("alice") == _txns()
+    reopened.close()
+
+
+def test_close_closes_connections_of_every_thread(tmp_path):
+    import sqlite3
+
+    repo = SqliteTransactionRepository(str(tmp_path / "tx.db"))
+    repo.add_many("alice", _txns())
+    opened = []
+    worker = threading.Thread(target=lambda: opened.append((repo._conn, repo.has_dataset("alice"))))
+    worker.start()
+    worker.join()
+    (worker_conn, seen), = opened
+    assert seen
+
+    repo.close()
+    for conn in (worker_conn, repo._anchor):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -61,3 +61,8 @@ def test_groups_exist_even_if_only_one_side_present():
     assert [r.month for r in out2] == ["2025-03"]
     assert out2[0].total_expenses == 0.0
     assert out2[0].nb_expense_operations == 0
+
+def test_calendar_batch_labels_match_single_lookup():
+    grouper = CalendarCycleGrouper()
+    dates = [date(2025,1,5), date(2024,12,31), date(2025,1,31)]
+    assert grouper.labels_for_dates(dates) == [grouper.label_for_date(d) for d in dates] == ["2025-01", "2024-12", "2025-01"]
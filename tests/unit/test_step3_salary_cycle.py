@@ -47,3 +47,30 @@ def test_compute_monthly_summary_core_with_salary_cycle_two_periods_and_outside(
     assert outside.total_salary == 0.0
     assert outside.total_expenses == 50.0
     assert outside.nb_expense_operations == 1
+
+
+def test_salary_cycle_bisection_lookup_and_batch_labels():
+    txns = [
+        Transaction(date_op=date(2025,1,25), month="2025-01", category="Salaire fixe", category_parent="Income", amount=3700.0, message="DEFAULT MESSAGE"),
+        Transaction(date_op=date(2025,2,25), month="2025-02", category="Salaire fixe", category_parent="Income", amount=3700.0, message="DEFAULT MESSAGE"),
+        Transaction(date_op=date(2025,3,10), month="2025-03", category="Dinner", category_parent="Leisure", amount=-65.0, message="DEFAULT MESSAGE"),
+    ]
+    grouper = SalaryCycleGrouper(txns)
+    dates = [date(2025,1,24), date(2025,1,25), date(2025,2,24), date(2025,2,25), date(2025,3,10), date(2025,3,11)]
+    expected = [
+        "Outside salary periods",
+        "2025-01-25 to 2025-02-24",
+        "2025-01-25 to 2025-02-24",
+        "2025-02-25 to 2025-03-10",
+        "2025-02-25 to 2025-03-10",
+        "Outside salary periods",
+    ]
+    assert [grouper.label_for_date(d) for d in dates] == expected
+    assert grouper.labels_for_dates(dates) == expected
+    # Labels are pre-built: repeated lookups hand out the same string object
+    assert grouper.label_for_date(date(2025,2,1)) is grouper.label_for_date(date(2025,2,10))
+
+
+def test_salary_cycle_without_salary_labels_everything_outside():
+    txns = [Transaction(date_op=date(2025,3,10), month="2025-03", category="Dinner", category_parent="Leisure", amount=-65.0, message="DEFAULT MESSAGE")]
+    assert SalaryCycleGrouper(txns).labels_for_dates([date(2025,3,10)]) == ["Outside salary periods"]
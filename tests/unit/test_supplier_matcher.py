@@ -0,0 +1,44 @@
+import random
+import re
+
+from bank_analysis.domain.matcher import SupplierMatcher, _first_match, _match_supplier, supplier_matcher
+from bank_analysis.domain.reporting.category_rules import DEFAULT_CATEGORY_RULES, SupplierPattern
+
+PATTERNS = DEFAULT_CATEGORY_RULES.supplier_patterns
+
+
+def _reference(s, patterns):
+    return _first_match(s.strip().casefold(), patterns) if s else None
+
+
+def test_compiled_matcher_agrees_with_trying_each_pattern():
+    words = ["lidl", "E.Leclerc", "leclerc", "ACTION", "transaction", "tanger  marche", "sneha",
+             "chandra foods", "mv braz - au bra", "MVBRAZ-AU BRA", "monoprix", "", "  Lidl 42 "]
+    rng = random.Random(1)
+    samples = [" ".join(rng.sample(words, 3)) for _ in range(500)] + words + [None]
+    matcher = SupplierMatcher(PATTERNS)
+    for s in samples:
+        assert matcher.match(s) == _reference(s, PATTERNS), s
+
+
+def test_first_pattern_in_rule_order_wins_over_the_leftmost_match():
+    patterns = (SupplierPattern("Late", re.compile("zzz")), SupplierPattern("Early", re.compile("aaa")))
+    assert SupplierMatcher(patterns).match("aaa zzz") == "Late"
+
+
+def test_pattern_flags_are_kept_and_backreferences_fall_back():
+    patterns = (SupplierPattern("Exact", re.compile("Shop")),  # case-sensitive on the casefolded text
+                SupplierPattern("Repeat", re.compile(r"(ab)\1")),
+                SupplierPattern("Any", re.compile("shop", re.IGNORECASE)))
+    matcher = SupplierMatcher(patterns)
+    assert matcher._combined is None
+    assert matcher.match("SHOP") == "Any" and matcher.match("xabab") == "Repeat"
+    assert SupplierMatcher(patterns[::2]).match("SHOP") == "Any"
+
+
+def test_match_supplier_shares_one_memoized_matcher_per_rule_set():
+    assert supplier_matcher(PATTERNS) is supplier_matcher(PATTERNS)
+    assert _match_supplier("LIDL 42", PATTERNS) == "Lidl"
+    assert "LIDL 42" in supplier_matcher(PATTERNS)._memo
+    # Unhashable pattern lists still work, without a compiled matcher
+    assert _match_supplier("LIDL 42", list(PATTERNS)) == "Lidl"
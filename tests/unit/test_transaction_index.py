@@ -0,0 +1,52 @@
+from datetime import date
+
+import pytest
+
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import filtering
+from bank_analysis.domain.transaction_index import TransactionIndex
+from bank_analysis.domain.value_objects import BreakdownKind
+from bank_analysis.usecases.filter_transactions import FilterTransactionsUseCase
+
+
+def _txns():
+    return [
+        Transaction(date_op=date(2025,2,3),  month="2025-02", category="Alimentation", category_parent="Vie quotidienne", amount=-17.6, message="a", supplier="LIDL 12"),
+        Transaction(date_op=date(2025,1,12), month="2025-01", category="alimentation", category_parent="Vie quotidienne", amount=-42.13, message="b", supplier="E.Leclerc"),
+        Transaction(date_op=date(2025,1,25), month="2025-01", category="Salaire fixe", category_parent="Income", amount=3700.0, message="c"),
+        Transaction(date_op=date(2025,1,10), month="2025-01", category="Alimentation", category_parent="Vie quotidienne", amount=-9.0, message="d", supplier="Monoprix"),
+        Transaction(date_op=date(2025,2,24), month="2025-02", category="Transport", category_parent="Transports", amount=-2.1, message="e", supplier="Action"),
+    ]
+
+
+PERIODS = ["2025-01", "2025-02", "2025-03", "2025-01-12 to 2025-02-24", "2025-01-25 to 2025-01-25"]
+
+
+@pytest.mark.parametrize("period", PERIODS)
+@pytest.mark.parametrize("label,kind", [
+    ("ALIMENTATION", BreakdownKind.OTHER),
+    ("Salaire fixe", BreakdownKind.SALARY),
+    ("ignored", BreakdownKind.SUPPLIER),
+])
+def test_index_matches_linear_filter(period, label, kind):
+    txns = _txns()
+    index = TransactionIndex(txns)
+    expected = filtering.filter_transactions_by_period_label_and_kind(txns, period, label, kind)
+    assert index.filter(period, label, kind) == expected
+
+
+def test_index_is_lazy_and_reused():
+    index = TransactionIndex(_txns())
+    assert index._by_month is None and index._date_order is None
+    assert index.rows_for_period("2025-01") == [1, 2, 3]
+    assert index.rows_for_period("2025-01-12 to 2025-02-24") == [0, 1, 2, 4]
+    assert index.rows_for_supplier("2025-01", "Leclerc") == [1]
+    assert index.rows_for_period("2025-01") is index.rows_for_period("2025-01")
+
+
+def test_usecase_execute_indexed():
+    index = TransactionIndex(_txns())
+    out = FilterTransactionsUseCase().execute_indexed(index, "2025-02", "transport", BreakdownKind.OTHER)
+    assert [t.message for t in out] == ["e"]
+    with pytest.raises(ValueError):
+        FilterTransactionsUseCase().execute_indexed(TransactionIndex([]), "2025-02", "x", BreakdownKind.OTHER)
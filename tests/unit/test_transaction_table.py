@@ -0,0 +1,65 @@
+from datetime import date
+from pathlib import Path
+
+from bank_analysis.adapters.csv_file_loader import CsvFileDataLoader
+from bank_analysis.domain import period_splicer
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import breakdown, enhanced_breakdown
+from bank_analysis.domain.transaction_table import TransactionTable
+
+
+def _txns():
+    return [
+        Transaction(date_op=date(2025,1,25), month="2025-01", category="Salaire fixe", category_parent="Income", amount=3700.0, message="SALARY"),
+        Transaction(date_op=date(2025,1,10), month="2025-01", category="Loyers, charges", category_parent="Logement", amount=-900.0, message="RENT"),
+        Transaction(date_op=date(2025,1,12), month="2025-01", category="Alimentation", category_parent="Vie quotidienne", amount=-42.13, message="CB LIDL", supplier="LIDL 1234"),
+        Transaction(date_op=date(2025,1,13), month="2025-01", category="Alimentation", category_parent="Vie quotidienne", amount=-17.6, message="CB CARREFOUR", supplier="Carrefour"),
+        Transaction(date_op=date(2025,2,3),  month="2025-02", category="Remboursement de frais", category_parent="Santé", amount=25.0, message="CPAM"),
+        Transaction(date_op=date(2025,2,5),  month="2025-02", category="Internal debit", category_parent="Mouvements internes débiteurs", amount=-200.0, message="VIR"),
+        Transaction(date_op=date(2025,2,6),  month="2025-02", category=None, category_parent="Divers", amount=-3.3, message="???"),
+        Transaction(date_op=date(2025,2,25), month="2025-02", category="Salaire fixe", category_parent="Income", amount=3700.0, message="SALARY"),
+    ]
+
+
+def test_table_round_trips_transactions():
+    txns = _txns()
+    table = TransactionTable.from_transactions(txns)
+    assert len(table) == len(txns)
+    assert list(table) == txns
+    assert table[2] == txns[2]
+    assert table[-1] == txns[-1]
+    assert list(table[1:3]) == txns[1:3]
+    # Dictionary encoding: repeated values share one code
+    assert len(table.category_dict) == 6
+    assert table.category_codes[2] == table.category_codes[3]
+
+
+def test_breakdowns_agree_between_list_and_table():
+    txns = _txns()
+    table = TransactionTable.from_transactions(txns)
+    assert breakdown.compute_category_breakdown(table) == breakdown.compute_category_breakdown(txns)
+    assert (enhanced_breakdown.compute_category_breakdown(table)
+            == enhanced_breakdown.compute_category_breakdown(txns))
+
+
+def test_period_splicer_on_table_returns_table():
+    txns = _txns()
+    table = TransactionTable.from_transactions(txns)
+    for period in ("2025-01", "2025-02", "2025-03", "2025-01-12 to 2025-02-05"):
+        out = period_splicer.filter_transactions_by_period(table, period)
+        assert isinstance(out, TransactionTable)
+        assert list(out) == period_splicer.filter_transactions_by_period(txns, period)
+
+
+def test_loader_builds_table_directly(tmp_path: Path):
+    p = tmp_path / "txns.csv"
+    p.write_text(
+        "dateOp;category;categoryParent;supplierFound;amount;label\n"
+        "2025-01-10;Groceries;Essentials;LIDL;-150,50;CB LIDL\n"
+        "2025-01-25;Salaire fixe;Income;;3 700;SALARY\n",
+        encoding="utf-8",
+    )
+    loader = CsvFileDataLoader()
+    table = loader.load_table(str(p))
+    assert isinstance(table, TransactionTable)
+    assert list(table) == list(loader.load_and_prepare(str(p)))
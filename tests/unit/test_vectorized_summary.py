@@ -0,0 +1,72 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from bank_analysis.adapters.calendar_cycle import CalendarCycleGrouper
+from bank_analysis.adapters.salary_cycle import SalaryCycleGrouper
+from bank_analysis.domain.entities import Transaction
+from bank_analysis.domain.reporting import summary
+from bank_analysis.domain.transaction_table import TransactionTable
+from bank_analysis.usecases.compute_monthly_summary import ComputeMonthlySummaryUseCase
+
+CATEGORIES = [
+    ("Salaire fixe", "Income"),
+    ("Groceries", "Essentials"),
+    ("Rent", "Housing"),
+    ("Internal debit", "Mouvements internes débiteurs"),
+    ("Internal credit", "Mouvements internes créditeurs"),
+    ("Refund", "Misc"),
+]
+
+
+def _random_txns(n=2000, seed=7):
+    rng = random.Random(seed)
+    start = date(2023, 1, 1)
+    txns = []
+    for _ in range(n):
+        d = start + timedelta(days=rng.randrange(0, 730))
+        category, parent = rng.choice(CATEGORIES)
+        if category == "Salaire fixe":
+            amount = round(rng.uniform(3000, 4000), 2)
+        else:
+            amount = round(rng.uniform(-500, 50), 2)
+        txns.append(Transaction(date_op=d, month=f"{d.year:04d}-{d.month:02d}", category=category,
+                                category_parent=parent, amount=amount, message="M"))
+    return txns
+
+
+@pytest.mark.parametrize("grouper_factory", [lambda t: CalendarCycleGrouper(), SalaryCycleGrouper])
+def test_vectorized_engine_is_bit_for_bit_identical(grouper_factory):
+    txns = _random_txns()
+    grouper = grouper_factory(txns)
+    expected = summary.compute_monthly_summary_core(txns, cycle_grouper=grouper)
+    assert summary.compute_monthly_summary_vectorized(txns, cycle_grouper=grouper) == expected
+    table = TransactionTable.from_transactions(txns)
+    assert summary.compute_monthly_summary_vectorized(table, cycle_grouper=grouper) == expected
+
+
+def test_rowwise_engine_dispatches_tables_to_the_columnar_engine(monkeypatch):
+    txns = _random_txns(300)
+    table = TransactionTable.from_transactions(txns)
+    expected = summary.compute_monthly_summary_core(txns, cycle_grouper=CalendarCycleGrouper())
+    calls = []
+    vectorized = summary.compute_monthly_summary_vectorized
+    monkeypatch.setattr(summary, "compute_monthly_summary_vectorized",
+                        lambda *args: calls.append(1) or vectorized(*args))
+
+    assert ComputeMonthlySummaryUseCase(CalendarCycleGrouper()).execute(table) == expected
+    assert calls == [1]
+
+
+def test_vectorized_engine_empty_input():
+    assert summary.compute_monthly_summary_vectorized([], cycle_grouper=CalendarCycleGrouper()) == []
+
+
+def test_usecase_engine_selection():
+    txns = _random_txns(300)
+    rowwise = ComputeMonthlySummaryUseCase(CalendarCycleGrouper()).execute(txns)
+    vectorized = ComputeMonthlySummaryUseCase(CalendarCycleGrouper(), engine="vectorized").execute(txns)
+    assert rowwise == vectorized
+    with pytest.raises(ValueError):
+        ComputeMonthlySummaryUseCase(CalendarCycleGrouper(), engine="gpu")